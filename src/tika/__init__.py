@@ -1,13 +1,28 @@
 from tika import detector, language, parser, unpack
-from tika.core import TikaError, TikaResponse, kill_server, start_server
+from tika.core import (
+    CompactResponse,
+    TikaAnalysis,
+    TikaDocument,
+    TikaError,
+    TikaPool,
+    TikaResponse,
+    TikaServerFarm,
+    kill_server,
+    start_server,
+)
 
 __all__ = [
+    "CompactResponse",
+    "TikaAnalysis",
+    "TikaDocument",
     "TikaError",
+    "TikaPool",
     "TikaResponse",
+    "TikaServerFarm",
     "detector",
-    "parser",
-    "unpack",
+    "kill_server",
     "language",
+    "parser",
     "start_server",
-    "kill_server",
+    "unpack",
 ]
@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Backends for the Tika result cache.
+
+A backend stores Tika server responses under a key derived from a hash of the request
+body, the service and the request headers (see :func:`tika.core.set_result_cache`), so
+documents that were already processed never reach the server again.
+
+Example:
+    >>> from tika import core
+    >>> from tika.cache import SQLiteCache
+    >>> core.set_result_cache(SQLiteCache("/var/cache/tika.sqlite"))
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import suppress
+from pathlib import Path
+
+try:
+    import lmdb  # type: ignore
+except ImportError:
+    lmdb = None
+
+
+class CacheBackend(ABC):
+    """Storage for cached Tika responses, keyed by hex digest strings."""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Return the response stored under key, or None if there is none."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes) -> None:
+        """Store a response under key."""
+
+    async def close(self) -> None:  # noqa: B027
+        """Release any resources held by the backend."""
+
+
+class MemoryCache(CacheBackend):
+    """In-process LRU cache bounded by the total size of the stored responses.
+
+    Args:
+        max_bytes: Total size of the responses kept before the least recently used ones
+            are evicted. Responses larger than this are not cached. Defaults to 64 MiB.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> bytes | None:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= len(previous)
+        self._entries[key] = value
+        self.size += len(value)
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+
+
+class SQLiteCache(CacheBackend):
+    """On-disk cache in a SQLite database, shared by every process that opens the same file.
+
+    Queries run in a worker thread so the event loop is never blocked on disk I/O.
+
+    Args:
+        path: Path of the database file; it is created if needed.
+        max_age: Seconds after which a stored response is ignored. Defaults to None (never).
+    """
+
+    def __init__(self, path: str | Path, max_age: float | None = None) -> None:
+        self.path = Path(path)
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB NOT NULL, stored REAL NOT NULL)"
+            )
+
+    async def get(self, key: str) -> bytes | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: bytes) -> None:
+        await asyncio.to_thread(self._set, key, value)
+
+    async def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _get(self, key: str) -> bytes | None:
+        oldest = 0.0 if self.max_age is None else time.time() - self.max_age
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM results WHERE key = ? AND stored >= ?", (key, oldest)
+            ).fetchone()
+        return None if row is None else bytes(row[0])
+
+    def _set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results (key, value, stored) VALUES (?, ?, ?)", (key, value, time.time())
+            )
+
+
+class LMDBCache(CacheBackend):
+    """On-disk cache in an LMDB environment. Requires the optional ``lmdb`` package.
+
+    LMDB cannot grow past ``map_size`` and keeps no access order to evict by, so when the
+    database is full it is emptied and filled again from scratch. Responses too large to
+    fit on their own are not cached.
+
+    Args:
+        path: Directory of the LMDB environment; it is created if needed.
+        map_size: Maximum size of the database in bytes. Defaults to 1 GiB.
+
+    Raises:
+        ImportError: If ``lmdb`` is not installed.
+    """
+
+    def __init__(self, path: str | Path, map_size: int = 1024 * 1024 * 1024) -> None:
+        if lmdb is None:
+            msg = "LMDBCache requires the lmdb package; install it with 'pip install lmdb'"
+            raise ImportError(msg)
+        self.path = Path(path)
+        self._env = lmdb.open(str(self.path), map_size=map_size)
+
+    async def get(self, key: str) -> bytes | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: bytes) -> None:
+        await asyncio.to_thread(self._set, key, value)
+
+    async def close(self) -> None:
+        self._env.close()
+
+    def _get(self, key: str) -> bytes | None:
+        with self._env.begin() as txn:
+            return txn.get(key.encode("ascii"))
+
+    def _set(self, key: str, value: bytes) -> None:
+        try:
+            self._put(key, value)
+        except lmdb.MapFullError:
+            with self._env.begin(write=True) as txn:
+                txn.drop(self._env.open_db(txn=txn), delete=False)
+            with suppress(lmdb.MapFullError):
+                self._put(key, value)
+
+    def _put(self, key: str, value: bytes) -> None:
+        with self._env.begin(write=True) as txn:
+            txn.put(key.encode("ascii"), value)
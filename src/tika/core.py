@@ -55,24 +55,41 @@ import asyncio
 import codecs
 import getopt
 import hashlib
+import importlib.util
 import logging
 import os
 import platform
 import re
+import shlex
 import signal
 import socket
 import sys
 import tempfile
 import time
 import types
-from collections.abc import Iterable
+import weakref
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from contextlib import aclosing, asynccontextmanager, suppress
+from fnmatch import fnmatch
+from functools import partial
 from http import HTTPStatus
-from os import walk
 from pathlib import Path
 from subprocess import STDOUT, Popen
-from typing import Any, BinaryIO, Literal, NoReturn, TypedDict
+from typing import Any, BinaryIO, Literal, NoReturn, Self, TypedDict
 
 import httpx
+import orjson
+
+from tika.cache import CacheBackend
 
 USAGE = """
 tika.py [-v] [-e] [-o <outputDir>] [--server <Tikaserver_endpoint>] [--install <UrlToTikaServerJar>] [--port <portNumber>] <command> <option> <urlOrPathToFile>
@@ -128,10 +145,141 @@ class TikaResponse(TypedDict):
     """Metadata extracted from the document(s)"""
     content: str | bytes | BinaryIO | None
     """Text content extracted from the document(s)"""
-    attachments: dict[str, Any] | None
+    attachments: Mapping[str, Any] | None
     """Attachments extracted from the document(s)"""
 
 
+class TikaAnalysis(TikaResponse):
+    """Result of :func:`tika.parser.analyze`: a parse response plus the document's type and language."""
+
+    content_type: str | None
+    """Media type of the top-level document, without parameters (e.g. "application/pdf")"""
+    language: str | None
+    """ISO 639-1 code of the document's language, if it could be determined"""
+
+
+class TikaDocument(TypedDict):
+    """One document of an /rmeta response: the container or one of its embedded documents."""
+
+    path: str
+    """X-TIKA:embedded_resource_path of the document, "/" for the container"""
+    content: str | None
+    """Text or XHTML content of this document alone"""
+    metadata: dict[str, str | list[str]]
+    """Metadata of this document, without X-TIKA:content and X-TIKA:embedded_resource_path"""
+
+
+# Key-to-position tables shared by every CompactMetadata with the same keys, in the same order
+_metadata_layouts: dict[tuple[str, ...], dict[str, int]] = {}
+_MAX_METADATA_LAYOUTS = 4096
+_MAX_INTERNED_VALUE = 64
+
+
+def _intern_value(value: Any) -> Any:  # noqa: ANN401
+    """Intern short strings, which are mostly repeated values such as MIME types and parser names."""
+    return sys.intern(value) if isinstance(value, str) and len(value) <= _MAX_INTERNED_VALUE else value
+
+
+class CompactMetadata(Mapping[str, Any]):
+    """Read-only document metadata that stores only its values.
+
+    Keys are interned and the table mapping them to positions is shared by all instances
+    with the same keys, the way CPython shares dict keys between instances of a class.
+    Short values are interned too, and multi-valued entries are stored as tuples.
+
+    Args:
+        metadata: The metadata to copy, e.g. ``TikaResponse["metadata"]``.
+    """
+
+    __slots__ = ("_layout", "_values")
+
+    def __init__(self, metadata: Mapping[str, Any]) -> None:
+        keys = tuple(metadata)
+        layout = _metadata_layouts.get(keys)
+        if layout is None:
+            layout = {sys.intern(key): index for index, key in enumerate(keys)}
+            if len(_metadata_layouts) < _MAX_METADATA_LAYOUTS:
+                _metadata_layouts[tuple(layout)] = layout
+        self._layout = layout
+        self._values = tuple(
+            tuple(map(_intern_value, value)) if isinstance(value, list) else _intern_value(value)
+            for value in metadata.values()
+        )
+
+    def __getitem__(self, key: str) -> Any:  # noqa: ANN401
+        return self._values[self._layout[key]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layout)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def to_dict(self) -> dict[str, str | list[str]]:
+        """Return the metadata as a plain dict, with lists for multi-valued entries."""
+        return {key: list(value) if isinstance(value, tuple) else value for key, value in self.items()}
+
+
+class CompactResponse(Mapping[str, Any]):
+    """A TikaResponse in a slotted object with :class:`CompactMetadata`, for holding many results.
+
+    It can be read like the TikaResponse it was built from (``result["content"]``), or
+    through attributes (``result.content``).
+
+    Args:
+        response: The response to compact.
+
+    Example:
+        >>> results = [CompactResponse(response) for response in await parse("all", paths)]
+    """
+
+    __slots__ = ("attachments", "content", "metadata", "status")
+    _FIELDS = ("status", "metadata", "content", "attachments")
+
+    def __init__(self, response: TikaResponse) -> None:
+        self.status = response["status"]
+        self.content = response["content"]
+        self.metadata = None if response["metadata"] is None else CompactMetadata(response["metadata"])
+        self.attachments = response["attachments"]
+
+    def __getitem__(self, key: str) -> Any:  # noqa: ANN401
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._FIELDS)
+
+    def __len__(self) -> int:
+        return len(self._FIELDS)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def to_dict(self) -> TikaResponse:
+        """Return the result as a plain TikaResponse."""
+        return TikaResponse(
+            status=self.status,
+            metadata=None if self.metadata is None else self.metadata.to_dict(),
+            content=self.content,
+            attachments=self.attachments,
+        )
+
+
+class BatchResult(TypedDict):
+    """Outcome of a single input processed by one of the ``iter_*`` batch functions."""
+
+    url_or_path: Any
+    """The input this result belongs to"""
+    result: tuple[int, str | bytes | BinaryIO] | None
+    """HTTP status code and response, or None if processing failed"""
+    error: Exception | None
+    """The exception raised while processing the input, if any"""
+
+
 try:
     unicode_string = unicode  # type: ignore
     binary_string = str
@@ -214,8 +362,26 @@ TIKA_CLIENT_ONLY = bool(os.getenv("TIKA_CLIENT_ONLY", default=False))
 TIKA_SERVER_CLASSPATH: str = os.getenv("TIKA_SERVER_CLASSPATH", "")
 TIKA_STARTUP_SLEEP = float(os.getenv("TIKA_STARTUP_SLEEP", 5))
 TIKA_STARTUP_MAX_RETRY = int(os.getenv("TIKA_STARTUP_MAX_RETRY", 3))
+TIKA_STARTUP_PROBE_TIMEOUT = float(os.getenv("TIKA_STARTUP_PROBE_TIMEOUT", "1"))
+TIKA_LIVENESS_TTL = float(os.getenv("TIKA_LIVENESS_TTL", "30"))
+TIKA_HTTP_MAX_CONNECTIONS = int(os.getenv("TIKA_HTTP_MAX_CONNECTIONS", "100"))
+TIKA_HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("TIKA_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+TIKA_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("TIKA_HTTP_KEEPALIVE_EXPIRY", "5"))
+TIKA_HTTP_CONNECT_TIMEOUT = float(os.getenv("TIKA_HTTP_CONNECT_TIMEOUT", "60"))
+TIKA_HTTP_READ_TIMEOUT = float(os.getenv("TIKA_HTTP_READ_TIMEOUT", "60"))
+TIKA_HTTP_WRITE_TIMEOUT = float(os.getenv("TIKA_HTTP_WRITE_TIMEOUT", "60"))
+TIKA_HTTP_POOL_TIMEOUT = float(os.getenv("TIKA_HTTP_POOL_TIMEOUT", "60"))
+TIKA_HTTP2 = bool(os.getenv("TIKA_HTTP2", default=""))
+TIKA_SINGLE_FLIGHT = bool(os.getenv("TIKA_SINGLE_FLIGHT", default=""))
 TIKA_JAVA: str = os.getenv("TIKA_JAVA", "java")
 TIKA_JAVA_ARGS: str = os.getenv("TIKA_JAVA_ARGS", "")
+TIKA_UPLOAD_CHUNK_SIZE = int(os.getenv("TIKA_UPLOAD_CHUNK_SIZE", str(256 * 1024)))
+TIKA_REMOTE_MAX_BYTES = int(os.getenv("TIKA_REMOTE_MAX_BYTES", "0"))
+TIKA_REMOTE_TIMEOUT = float(os.getenv("TIKA_REMOTE_TIMEOUT", "60"))
+TIKA_REMOTE_CONCURRENCY = int(os.getenv("TIKA_REMOTE_CONCURRENCY", "8"))
+TIKA_MAX_IN_FLIGHT = int(os.getenv("TIKA_MAX_IN_FLIGHT", "8"))
+TIKA_DETECT_PREFIX_BYTES = int(os.getenv("TIKA_DETECT_PREFIX_BYTES", "0"))
+TIKA_UNPACK_SPILL_BYTES = int(os.getenv("TIKA_UNPACK_SPILL_BYTES", str(32 * 1024 * 1024)))
 
 VERBOSE: int = 0
 ENCODE_UTF8: int = 0
@@ -231,6 +397,204 @@ class TikaError(Exception):
     pass
 
 
+class _PoolMember:
+    """Book-keeping for one endpoint of a :class:`TikaPool`."""
+
+    __slots__ = ("current_weight", "ejected_until", "failures", "outstanding", "url", "weight")
+
+    def __init__(self, url: str, weight: int) -> None:
+        self.url = url
+        self.weight = weight
+        self.outstanding = 0
+        self.failures = 0
+        self.ejected_until = 0.0
+        self.current_weight = 0
+
+
+class TikaPool:
+    """Spread requests over several Tika servers.
+
+    A pool can be passed anywhere a ``server_endpoint`` string is accepted. Each request
+    is sent to one endpoint chosen by ``strategy``:
+
+    - ``"least_outstanding"``: the endpoint with the fewest requests in flight relative
+      to its weight.
+    - ``"round_robin"``: smooth weighted round-robin.
+
+    An endpoint is ejected for ``eject_seconds`` after ``max_failures`` consecutive
+    connection errors or 502/503/504 responses, then tried again. If every endpoint is
+    ejected, all of them are used rather than failing outright. Requests that fail this
+    way are retried on another endpoint when their body can be replayed (no body, str,
+    bytes, buffers, paths and seekable file-like objects); async iterators and
+    non-seekable streams are sent once.
+
+    Args:
+        endpoints: Server URLs, or a mapping of server URL to integer weight.
+        strategy: How to pick an endpoint. Defaults to "least_outstanding".
+        max_failures: Consecutive failures before an endpoint is ejected. Defaults to 3.
+        eject_seconds: How long an ejected endpoint is skipped. Defaults to 30.
+
+    Example:
+        >>> pool = TikaPool({"http://tika-1:9998": 2, "http://tika-2:9998": 1})
+        >>> await parser.from_file("doc.pdf", server_endpoint=pool)
+    """
+
+    RETRY_STATUSES = frozenset({HTTPStatus.BAD_GATEWAY, HTTPStatus.SERVICE_UNAVAILABLE, HTTPStatus.GATEWAY_TIMEOUT})
+
+    def __init__(
+        self,
+        endpoints: Iterable[str] | dict[str, int],
+        *,
+        strategy: Literal["least_outstanding", "round_robin"] = "least_outstanding",
+        max_failures: int = 3,
+        eject_seconds: float = 30.0,
+    ) -> None:
+        weights = endpoints if isinstance(endpoints, dict) else dict.fromkeys(endpoints, 1)
+        if not weights:
+            msg = "TikaPool needs at least one endpoint"
+            raise TikaError(msg)
+        if any(weight < 1 for weight in weights.values()):
+            msg = f"TikaPool weights must be at least 1, got {weights}"
+            raise TikaError(msg)
+        if strategy not in ("least_outstanding", "round_robin"):
+            msg = f"Unknown TikaPool strategy: {strategy}"
+            raise TikaError(msg)
+        self.members = [_PoolMember(url.rstrip("/"), weight) for url, weight in weights.items()]
+        self.strategy = strategy
+        self.max_failures = max_failures
+        self.eject_seconds = eject_seconds
+        self._turn = 0
+
+    def __repr__(self) -> str:
+        return f"TikaPool({[member.url for member in self.members]!r}, strategy={self.strategy!r})"
+
+    @property
+    def endpoints(self) -> list[str]:
+        """The URLs of the endpoints that are currently not ejected."""
+        now = time.monotonic()
+        return [member.url for member in self.members if member.ejected_until <= now]
+
+    def acquire(self, exclude: Iterable[_PoolMember] = ()) -> _PoolMember | None:
+        """Pick an endpoint for a request and count it as outstanding.
+
+        Returns:
+            _PoolMember | None: The chosen endpoint, or None if every endpoint is excluded.
+        """
+        now = time.monotonic()
+        candidates = [member for member in self.members if member not in exclude]
+        if not candidates:
+            return None
+        candidates = [member for member in candidates if member.ejected_until <= now] or candidates
+        if self.strategy == "round_robin":
+            total = 0
+            for member in candidates:
+                member.current_weight += member.weight
+                total += member.weight
+            chosen = max(candidates, key=lambda member: member.current_weight)
+            chosen.current_weight -= total
+        else:
+            # rotate the starting point so idle endpoints share the load instead of the first one taking it all
+            self._turn = (self._turn + 1) % len(candidates)
+            rotated = candidates[self._turn :] + candidates[: self._turn]
+            chosen = min(rotated, key=lambda member: member.outstanding / member.weight)
+        chosen.outstanding += 1
+        return chosen
+
+    def release(self, member: _PoolMember, *, failed: bool) -> None:
+        """Finish a request on an endpoint, ejecting it after too many consecutive failures."""
+        member.outstanding -= 1
+        if not failed:
+            member.failures = 0
+            member.ejected_until = 0.0
+            return
+        member.failures += 1
+        if member.failures >= self.max_failures:
+            member.ejected_until = time.monotonic() + self.eject_seconds
+            logger.warning(
+                f"Ejecting Tika server {member.url} for {self.eject_seconds}s after {member.failures} failures"
+            )
+
+    async def send(
+        self,
+        request: Callable[[str, Any], Awaitable[tuple[int, Any]]],
+        data: Any,  # noqa: ANN401
+    ) -> tuple[int, Any]:
+        """Run ``request(endpoint, data)`` on a pooled endpoint, failing over while the body can be replayed."""
+        position = _replay_position(data)
+        replayable = position is not None
+        borrowed = _BorrowedStream(data) if replayable and hasattr(data, "read") else data
+        tried: list[_PoolMember] = []
+        try:
+            while member := self.acquire(exclude=tried):
+                tried.append(member)
+                if borrowed is not data:
+                    data.seek(position)
+                try:
+                    result = await request(member.url, borrowed)
+                except TikaError as e:
+                    failed = isinstance(e.__cause__, httpx.TransportError)
+                    self.release(member, failed=failed)
+                    if not (failed and replayable and len(tried) < len(self.members)):
+                        raise
+                    logger.warning(f"Retrying on another Tika server after {member.url} failed: {e}")
+                    continue
+                except BaseException:
+                    self.release(member, failed=False)
+                    raise
+                failed = result[0] in self.RETRY_STATUSES
+                self.release(member, failed=failed)
+                if not (failed and replayable and len(tried) < len(self.members)):
+                    return result
+                logger.warning(f"Retrying on another Tika server after {member.url} returned {result[0]}")
+        finally:
+            if borrowed is not data and hasattr(data, "close"):
+                data.close()
+        msg = "No Tika server available in pool"  # unreachable: the loop always returns or raises
+        raise TikaError(msg)
+
+    @asynccontextmanager
+    async def endpoint(self) -> AsyncIterator[str]:
+        """Hold a pooled endpoint for the duration of a single, non-retried request."""
+        member = self.acquire()
+        if member is None:  # pragma: no cover - a pool always has members
+            msg = "No Tika server available in pool"
+            raise TikaError(msg)
+        failed = False
+        try:
+            yield member.url
+        except TikaError as e:
+            failed = isinstance(e.__cause__, httpx.TransportError)
+            raise
+        finally:
+            self.release(member, failed=failed)
+
+
+class _BorrowedStream:
+    """Proxy for a caller's stream that ignores close() so a failed upload can be replayed."""
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self._stream = stream
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        return getattr(self._stream, name)
+
+    def close(self) -> None:
+        pass
+
+
+def _replay_position(data: Any) -> int | None:  # noqa: ANN401
+    """Return where a request body can be replayed from, or None if it can only be sent once.
+
+    Bodies that do not need rewinding return 0.
+    """
+    if data is None or isinstance(data, str | bytes | bytearray | memoryview | Path):
+        return 0
+    try:
+        return data.tell() if data.seekable() else None
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
 def echo2(*s: Any) -> types.NoneType:  # noqa: ANN401
     sys.stderr.write(unicode_string("tika.py: %s\n") % unicode_string(" ").join(map(unicode_string, s)))
 
@@ -324,34 +688,202 @@ async def run_command(
     raise TikaError(msg)
 
 
-def get_paths(url_or_paths: Iterable[str | Path | BinaryIO]) -> list[Path]:
-    """Convert URLs, file paths, or file-like objects into a list of Path objects.
+def get_paths(
+    url_or_paths: Iterable[str | Path | BinaryIO] | str | Path | BinaryIO,
+    *,
+    include: Iterable[str] | None = None,
+    exclude: Iterable[str] | None = None,
+    min_size: int | None = None,
+    max_size: int | None = None,
+) -> Iterator[str | Path | BinaryIO]:
+    """Lazily expand URLs, file paths, or file-like objects, walking directories as they are reached.
 
-    Handles single paths, lists of paths, and directories. For directories,
-    recursively finds all files within them.
+    Inputs that are not directories are yielded unchanged. Directories are walked
+    depth-first with :func:`os.scandir`, one directory listing at a time, so parsing
+    can start on the first file of a large tree before the rest of it has been listed.
 
     Args:
         url_or_paths: Input paths as URLs, file paths, directories, or file-like objects.
                      Can be a single item or an iterable of items.
+        include: Glob patterns a file found in a directory must match to be yielded.
+                Defaults to None (all files).
+        exclude: Glob patterns for files and subdirectories to skip while walking.
+                Defaults to None.
+        min_size: Skip files found in a directory smaller than this many bytes. Defaults to None.
+        max_size: Skip files found in a directory larger than this many bytes. Defaults to None.
 
-    Returns:
-        list[Path]: List of Path objects for all files found.
+    Yields:
+        str | Path | BinaryIO: Each non-directory input, and a Path for each file found
+        within a directory (including in subdirectories).
 
     Note:
-        When a directory is provided, all files within it (including in subdirectories)
-        are included in the returned list.
+        Patterns are matched with :mod:`fnmatch` against both the entry name and its
+        path relative to the directory being walked (e.g. ``"*.pdf"`` or ``"archive/*"``).
+        Filters only apply to files found by walking; inputs named explicitly are always
+        yielded. Symlinked directories are not followed.
     """
-    if not isinstance(url_or_paths, Iterable):
+    if isinstance(url_or_paths, str | Path) or not isinstance(url_or_paths, Iterable):
         url_or_paths = [url_or_paths]  # do not recursively walk over letters of a single path which can include "/"
-    paths = []
+    include = tuple(include or ())
+    exclude = tuple(exclude or ())
     for each_url_or_paths in url_or_paths:
         if isinstance(each_url_or_paths, str | Path) and Path(each_url_or_paths).is_dir():
-            for root, _, filenames in walk(each_url_or_paths):
-                for filename in filenames:
-                    paths.append(os.path.join(root, filename))
+            yield from _walk_files(Path(each_url_or_paths), include, exclude, min_size, max_size)
         else:
-            paths.append(each_url_or_paths)
-    return paths
+            yield each_url_or_paths
+
+
+def _walk_files(  # noqa: C901
+    root: Path,
+    include: tuple[str, ...],
+    exclude: tuple[str, ...],
+    min_size: int | None,
+    max_size: int | None,
+) -> Iterator[Path]:
+    """Yield the files under root that pass the filters, reusing each scandir entry's stat."""
+
+    def matches(patterns: tuple[str, ...], entry: os.DirEntry[str]) -> bool:
+        relative = os.path.relpath(entry.path, root).replace(os.sep, "/")
+        return any(fnmatch(entry.name, pattern) or fnmatch(relative, pattern) for pattern in patterns)
+
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                subdirectories = []
+                for entry in entries:
+                    if exclude and matches(exclude, entry):
+                        continue
+                    try:
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                subdirectories.append(entry.path)
+                            continue
+                        if include and not matches(include, entry):
+                            continue
+                        if min_size is not None or max_size is not None:
+                            size = entry.stat().st_size
+                            if (min_size is not None and size < min_size) or (max_size is not None and size > max_size):
+                                continue
+                    except OSError as e:
+                        logger.warning(f"Skipping {entry.path}: {e}")
+                        continue
+                    yield Path(entry.path)
+        except OSError as e:
+            logger.warning(f"Skipping directory {directory}: {e}")
+            continue
+        stack.extend(reversed(subdirectories))
+
+
+async def iter_batch(
+    func: Callable[[Any], Awaitable[tuple[int, str | bytes | BinaryIO]]],
+    url_or_paths: Iterable[Any] | AsyncIterable[Any],
+    *,
+    max_in_flight: int = TIKA_MAX_IN_FLIGHT,
+) -> AsyncIterator[BatchResult]:
+    """Run ``func`` over every input with at most ``max_in_flight`` calls running at once.
+
+    Inputs are consumed lazily, so an iterable of millions of paths never becomes millions
+    of tasks or open files. Results are yielded in completion order, and an exception
+    raised for one input is captured in its result rather than cancelling the others.
+    Closing the iterator early cancels the calls still running.
+
+    Args:
+        func: Coroutine function called with a single input, e.g. a partial of :func:`parse_1`.
+        url_or_paths: Inputs as a (possibly lazy) iterable or async iterable.
+        max_in_flight: Maximum number of concurrent calls. Defaults to TIKA_MAX_IN_FLIGHT.
+
+    Yields:
+        BatchResult: One result per input.
+    """
+    async with aclosing(_as_completed_bounded(func, url_or_paths, max_in_flight)) as completed:
+        async for _, url_or_path, result, error in completed:
+            yield BatchResult(url_or_path=url_or_path, result=result, error=error)
+
+
+async def gather_bounded(
+    func: Callable[[Any], Awaitable[tuple[int, str | bytes | BinaryIO]]],
+    url_or_paths: Iterable[Any] | AsyncIterable[Any],
+    *,
+    max_in_flight: int = TIKA_MAX_IN_FLIGHT,
+) -> list[tuple[int, str | bytes | BinaryIO]]:
+    """Like :func:`asyncio.gather` over ``func(input)``, but with at most ``max_in_flight`` calls running.
+
+    Args:
+        func: Coroutine function called with a single input.
+        url_or_paths: Inputs as a (possibly lazy) iterable or async iterable.
+        max_in_flight: Maximum number of concurrent calls. Defaults to TIKA_MAX_IN_FLIGHT.
+
+    Returns:
+        list: The results in input order.
+
+    Raises:
+        Exception: The first exception raised by ``func``; calls still running are cancelled.
+    """
+    results: dict[int, tuple[int, str | bytes | BinaryIO]] = {}
+    async with aclosing(_as_completed_bounded(func, url_or_paths, max_in_flight)) as completed:
+        async for index, _, result, error in completed:
+            if error is not None:
+                raise error
+            results[index] = result  # type: ignore
+    return [results[index] for index in range(len(results))]
+
+
+async def _as_completed_bounded(
+    func: Callable[[Any], Awaitable[Any]],
+    items: Iterable[Any] | AsyncIterable[Any],
+    max_in_flight: int,
+) -> AsyncIterator[tuple[int, Any, Any, Exception | None]]:
+    """Yield (index, input, result, error) for each input as its call completes."""
+    if max_in_flight < 1:
+        msg = f"max_in_flight must be at least 1, got {max_in_flight}"
+        raise TikaError(msg)
+
+    async def run(index: int, item: Any) -> tuple[int, Any, Any, Exception | None]:  # noqa: ANN401
+        try:
+            return (index, item, await func(item), None)
+        except Exception as e:  # noqa: BLE001
+            return (index, item, None, e)
+
+    sync_items = iter(items) if isinstance(items, Iterable) else None
+    async_items = aiter(items) if sync_items is None else None  # type: ignore
+    pending: set[asyncio.Task[tuple[int, Any, Any, Exception | None]]] = set()
+    index = 0
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < max_in_flight:
+                try:
+                    item = next(sync_items) if sync_items is not None else await anext(async_items)  # type: ignore
+                except (StopIteration, StopAsyncIteration):
+                    exhausted = True
+                    break
+                pending.add(asyncio.create_task(run(index, item)))
+                index += 1
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _meta_path(url_or_path: str | Path | BinaryIO, *, out_dir: Path | None, meta_extension: str) -> Path:
+    """Name the metadata file written by :func:`parse_and_save` for one input."""
+    if isinstance(url_or_path, str) and urlparse(url_or_path).scheme not in ("", "file"):
+        source = Path(to_filename(url_or_path))
+    elif isinstance(url_or_path, str | Path):
+        source = Path(url_or_path)
+    else:
+        name = getattr(url_or_path, "name", None)
+        source = Path(name) if isinstance(name, str | Path) else Path(f"file_{int(time.time())}")
+    if out_dir is not None:
+        return Path(out_dir) / (source.name + meta_extension)
+    return source.with_name(source.name + meta_extension)
 
 
 async def parse_and_save(
@@ -359,12 +891,13 @@ async def parse_and_save(
     url_or_paths: Iterable[str | Path | BinaryIO],
     *,
     out_dir: Path | None = None,
-    server_endpoint: str = SERVER_ENDPOINT,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
     verbose: int = VERBOSE,
     tika_server_jar: Path = TIKA_SERVER_JAR,
     response_mime_type: str = "application/json",
     meta_extension: str = "_meta.json",
     services: dict[str, str] | None = None,
+    max_in_flight: int = TIKA_MAX_IN_FLIGHT,
 ) -> list[Path]:
     """Parse files and save extracted metadata/text as JSON files.
 
@@ -376,101 +909,132 @@ async def parse_and_save(
         url_or_paths: Files to parse as URLs, paths, or file-like objects.
         out_dir: Directory where metadata files should be saved. If None,
                 saves alongside input files. Defaults to None.
-        server_endpoint: Tika server URL. Defaults to SERVER_ENDPOINT.
+        server_endpoint: Tika server URL or TikaPool. Defaults to SERVER_ENDPOINT.
         verbose: Logging verbosity level. Defaults to VERBOSE.
         tika_server_jar: Path to Tika server JAR. Defaults to TIKA_SERVER_JAR.
         response_mime_type: Expected response format. Defaults to "application/json".
         meta_extension: Extension to append to metadata filenames. Defaults to "_meta.json".
         services: Dict mapping options to service endpoints. Defaults to
                  {'meta': '/meta', 'text': '/tika', 'all': '/rmeta'}.
+        max_in_flight: Maximum number of files parsed concurrently. Defaults to TIKA_MAX_IN_FLIGHT.
 
     Returns:
-        list[Path]: List of paths to the created metadata files.
+        list[Path]: List of paths to the created metadata files, in input order.
 
     Note:
         For each input file 'example.pdf', creates 'example.pdf_meta.json'
         (or similar based on meta_extension) containing the extracted information.
+        URLs and file-like objects are sent to the server as given; their metadata
+        file is named after the URL path or the stream's ``name`` and, without
+        ``out_dir``, written to the current directory unless the stream names a local file.
     """
     services = services or {"meta": "/meta", "text": "/tika", "all": "/rmeta"}
-    meta_paths: list[Path] = []
-    paths = get_paths(url_or_paths=url_or_paths)
-    for path in paths:
-        if out_dir is None:
-            meta_path: Path = path.with_stem(path.stem + meta_extension)
-        else:
-            meta_path = Path(os.path.join(out_dir, os.path.split(path)[1] + meta_extension))
-            logger.info(f"Writing {meta_path}")
-            _, content = await parse_1(
-                option=option,
-                url_or_path=path,
-                server_endpoint=server_endpoint,
-                verbose=verbose,
-                tika_server_jar=tika_server_jar,
-                response_mime_type=response_mime_type,
-                services=services,
-            )
-
-            if isinstance(content, str):
-                content = (content + "\n").encode("utf-8")
 
-            with open(meta_path, mode="wb", encoding="utf-8") as f:
-                f.write(content)
+    async def save_one(url_or_path: str | Path | BinaryIO) -> Path:
+        meta_path = _meta_path(url_or_path, out_dir=out_dir, meta_extension=meta_extension)
+        logger.info(f"Writing {meta_path}")
+        _, content = await parse_1(
+            option=option,
+            url_or_path=url_or_path,
+            server_endpoint=server_endpoint,
+            verbose=verbose,
+            tika_server_jar=tika_server_jar,
+            response_mime_type=response_mime_type,
+            services=services,
+        )
+        if isinstance(content, str):
+            content = (content + "\n").encode("utf-8")
+        await asyncio.to_thread(meta_path.write_bytes, content)  # type: ignore
+        return meta_path
 
-        meta_paths.append(meta_path)
-    return meta_paths
+    return await gather_bounded(save_one, get_paths(url_or_paths), max_in_flight=max_in_flight)
 
 
 async def parse(
     option: str,
     url_or_paths: Iterable[str | Path | BinaryIO],
     *,
-    server_endpoint: str = SERVER_ENDPOINT,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
     verbose: int = VERBOSE,
     tika_server_jar: Path = TIKA_SERVER_JAR,
     response_mime_type: str = "application/json",
     services: dict[str, str] | None = None,
     raw_response: bool = False,
+    max_in_flight: int = TIKA_MAX_IN_FLIGHT,
 ) -> list[tuple[int, str | bytes | BinaryIO]]:
     """Parse files and extract metadata and/or text content using Tika.
 
     Args:
         option: Parsing option ('meta', 'text', or 'all').
         url_or_paths: Files to parse as URLs, paths, or file-like objects.
-        server_endpoint: Tika server URL. Defaults to SERVER_ENDPOINT.
+        server_endpoint: Tika server URL or TikaPool. Defaults to SERVER_ENDPOINT.
         verbose: Logging verbosity level. Defaults to VERBOSE.
         tika_server_jar: Path to Tika server JAR. Defaults to TIKA_SERVER_JAR.
         response_mime_type: Expected response format. Defaults to "application/json".
         services: Dict mapping options to service endpoints. Defaults to
                  {'meta': '/meta', 'text': '/tika', 'all': '/rmeta'}.
         raw_response: If True, return raw response content. Defaults to False.
+        max_in_flight: Maximum number of concurrent requests. Defaults to TIKA_MAX_IN_FLIGHT.
 
     Returns:
         list[tuple[int, str | bytes | BinaryIO]]: List of tuples containing
-        (HTTP status code, parsed content) for each processed file.
+        (HTTP status code, parsed content) for each processed file, in input order.
     """
     services = services or {"meta": "/meta", "text": "/tika", "all": "/rmeta"}
-    return await asyncio.gather(
-        *[
-            parse_1(
-                option=option,
-                url_or_path=path,
-                server_endpoint=server_endpoint,
-                verbose=verbose,
-                tika_server_jar=tika_server_jar,
-                response_mime_type=response_mime_type,
-                services=services,
-                raw_response=raw_response,
-            )
-            for path in url_or_paths
-        ]
+    parse_one = partial(
+        parse_1,
+        option,
+        server_endpoint=server_endpoint,
+        verbose=verbose,
+        tika_server_jar=tika_server_jar,
+        response_mime_type=response_mime_type,
+        services=services,
+        raw_response=raw_response,
+    )
+    return await gather_bounded(parse_one, url_or_paths, max_in_flight=max_in_flight)
+
+
+async def iter_parse(
+    option: str,
+    url_or_paths: Iterable[str | Path | BinaryIO] | AsyncIterable[str | Path | BinaryIO],
+    *,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
+    verbose: int = VERBOSE,
+    tika_server_jar: Path = TIKA_SERVER_JAR,
+    response_mime_type: str = "application/json",
+    services: dict[str, str] | None = None,
+    raw_response: bool = False,
+    max_in_flight: int = TIKA_MAX_IN_FLIGHT,
+) -> AsyncIterator[BatchResult]:
+    """Parse files with bounded concurrency, yielding each result as soon as it completes.
+
+    Takes the same arguments as :func:`parse`. Inputs are pulled from ``url_or_paths``
+    only as slots free up, and a failure is reported in that input's result instead of
+    stopping the batch.
+
+    Yields:
+        BatchResult: The input together with its (status, content) tuple or its error.
+    """
+    services = services or {"meta": "/meta", "text": "/tika", "all": "/rmeta"}
+    parse_one = partial(
+        parse_1,
+        option,
+        server_endpoint=server_endpoint,
+        verbose=verbose,
+        tika_server_jar=tika_server_jar,
+        response_mime_type=response_mime_type,
+        services=services,
+        raw_response=raw_response,
     )
+    async for result in iter_batch(parse_one, url_or_paths, max_in_flight=max_in_flight):
+        yield result
 
 
 async def parse_1(
     option: str,
-    url_or_path: str | Path | BinaryIO,
+    url_or_path: str | Path | BinaryIO | bytes | bytearray | memoryview,
     *,
-    server_endpoint: str = SERVER_ENDPOINT,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
     verbose: int = VERBOSE,
     tika_server_jar: Path = TIKA_SERVER_JAR,
     response_mime_type: str = "application/json",
@@ -484,8 +1048,8 @@ async def parse_1(
 
     Args:
         option: Parsing option ('meta', 'text', or 'all').
-        url_or_path: File to parse as URL, path, or file-like object.
-        server_endpoint: Tika server URL. Defaults to SERVER_ENDPOINT.
+        url_or_path: File to parse as URL, path, file-like object or in-memory buffer.
+        server_endpoint: Tika server URL or TikaPool. Defaults to SERVER_ENDPOINT.
         verbose: Logging verbosity level. Defaults to VERBOSE.
         tika_server_jar: Path to Tika server JAR. Defaults to TIKA_SERVER_JAR.
         response_mime_type: Expected response format. Defaults to "application/json".
@@ -501,33 +1065,14 @@ async def parse_1(
     """
     services = services or {"meta": "/meta", "text": "/tika", "all": "/rmeta/text"}
     request_options = request_options or {}
-    headers = headers or {}
-
-    path, file_type = get_remote_file(url_or_path, TIKA_FILES_PATH)
-    headers.update(
-        **{
-            "Accept": response_mime_type,
-            "Content-Disposition": make_content_disposition_header(path),
-        }
-    )
 
-    if option not in services:
-        logger.warning("config option must be one of meta, text, or all; using all.")
-    service = services.get(option, services["all"])
-    if service == "/tika":
-        response_mime_type = "text/plain"
-    headers.update(
-        **{
-            "Accept": response_mime_type,
-            "Content-Disposition": make_content_disposition_header(path),
-        }
-    )
-    with get_file_handle(path) as f:
+    async with open_source(url_or_path) as (source, source_headers):
+        service, headers = _parse_request(option, services, response_mime_type, headers, source_headers)
         status, response = await call_server(
             verb="put",
             server_endpoint=server_endpoint,
             service=service,
-            data=f,
+            data=source,
             headers=headers,
             verbose=verbose,
             tika_server_jar=tika_server_jar,
@@ -535,54 +1080,148 @@ async def parse_1(
             raw_response=raw_response,
             request_options=request_options,
         )
-
-    if file_type == "remote" and isinstance(path, Path):
-        path.unlink()
     return (status, response)
 
 
+async def stream_parse_1(
+    option: str,
+    url_or_path: str | Path | BinaryIO | bytes | bytearray | memoryview,
+    *,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
+    verbose: int = VERBOSE,
+    tika_server_jar: Path = TIKA_SERVER_JAR,
+    response_mime_type: str = "application/json",
+    services: dict[str, str] | None = None,
+    headers: dict[str, Any] | None = None,
+    config_path: str | None = None,
+    request_options: dict[str, Any] | None = None,
+) -> AsyncIterator[bytes]:
+    """Parse a single file and yield the raw Tika response body as it arrives.
+
+    Takes the same arguments as :func:`parse_1`, but never buffers the response, so
+    callers can start consuming extracted text before the server has finished.
+
+    Yields:
+        bytes: Chunks of the response body, with any content encoding removed.
+
+    Raises:
+        TikaError: If the server returns a non-200 status or the request fails.
+    """
+    services = services or {"meta": "/meta", "text": "/tika", "all": "/rmeta/text"}
+    request_options = request_options or {}
+
+    async with open_source(url_or_path) as (source, source_headers):
+        service, headers = _parse_request(option, services, response_mime_type, headers, source_headers)
+        async for chunk in call_server_stream(
+            verb="put",
+            server_endpoint=server_endpoint,
+            service=service,
+            data=source,
+            headers=headers,
+            verbose=verbose,
+            tika_server_jar=tika_server_jar,
+            config_path=config_path,
+            request_options=request_options,
+        ):
+            yield chunk
+
+
+def _parse_request(
+    option: str,
+    services: dict[str, str],
+    response_mime_type: str,
+    headers: dict[str, Any] | None,
+    source_headers: dict[str, str],
+) -> tuple[str, dict[str, Any]]:
+    """Resolve the service and request headers shared by parse_1 and stream_parse_1."""
+    headers = headers or {}
+    if option not in services:
+        logger.warning("config option must be one of meta, text, or all; using all.")
+    service = services.get(option, services["all"])
+    if service == "/tika":
+        response_mime_type = "text/plain"
+    headers.update(Accept=response_mime_type, **source_headers)
+    return service, headers
+
+
 async def detect_lang(
     option: str,
     url_or_paths: Iterable[str | Path | BinaryIO],
-    server_endpoint: str = SERVER_ENDPOINT,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
     verbose: int = VERBOSE,
     tika_server_jar: Path = TIKA_SERVER_JAR,
     response_mime_type: str = "text/plain",
     services: dict[str, str] | None = None,
+    max_in_flight: int = TIKA_MAX_IN_FLIGHT,
 ) -> list[tuple[int, str | bytes | BinaryIO]]:
     """Detect the language of files using Tika.
 
     Args:
         option: Detection option (usually 'file').
         url_or_paths: Files to analyze as URLs, paths, or file-like objects.
-        server_endpoint: Tika server URL. Defaults to SERVER_ENDPOINT.
+        server_endpoint: Tika server URL or TikaPool. Defaults to SERVER_ENDPOINT.
         verbose: Logging verbosity level. Defaults to VERBOSE.
         tika_server_jar: Path to Tika server JAR. Defaults to TIKA_SERVER_JAR.
         response_mime_type: Expected response format. Defaults to "text/plain".
         services: Dict mapping options to service endpoints. Defaults to
                  {'file': '/language/stream'}.
+        max_in_flight: Maximum number of concurrent requests. Defaults to TIKA_MAX_IN_FLIGHT.
 
     Returns:
         list[tuple[int, str | bytes | BinaryIO]]: List of tuples containing
-        (HTTP status code, detected language code) for each file.
+        (HTTP status code, detected language code) for each file, in input order.
 
     Note:
         Language codes are returned as ISO 639-1 two-letter codes (e.g., 'en' for English).
     """
     services = services or {"file": "/language/stream"}
-    paths = get_paths(url_or_paths)
-    return await asyncio.gather(
-        *[
-            detect_lang_1(option, path, server_endpoint, verbose, tika_server_jar, response_mime_type, services)
-            for path in paths
-        ]
+    detect_one = partial(
+        detect_lang_1,
+        option,
+        server_endpoint=server_endpoint,
+        verbose=verbose,
+        tika_server_jar=tika_server_jar,
+        response_mime_type=response_mime_type,
+        services=services,
+    )
+    return await gather_bounded(detect_one, get_paths(url_or_paths), max_in_flight=max_in_flight)
+
+
+async def iter_detect_lang(
+    option: str,
+    url_or_paths: Iterable[str | Path | BinaryIO],
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
+    verbose: int = VERBOSE,
+    tika_server_jar: Path = TIKA_SERVER_JAR,
+    response_mime_type: str = "text/plain",
+    services: dict[str, str] | None = None,
+    max_in_flight: int = TIKA_MAX_IN_FLIGHT,
+) -> AsyncIterator[BatchResult]:
+    """Detect the language of files with bounded concurrency, yielding results as they complete.
+
+    Takes the same arguments as :func:`detect_lang`; see :func:`iter_parse`.
+
+    Yields:
+        BatchResult: The input together with its (status, language) tuple or its error.
+    """
+    services = services or {"file": "/language/stream"}
+    detect_one = partial(
+        detect_lang_1,
+        option,
+        server_endpoint=server_endpoint,
+        verbose=verbose,
+        tika_server_jar=tika_server_jar,
+        response_mime_type=response_mime_type,
+        services=services,
     )
+    async for result in iter_batch(detect_one, get_paths(url_or_paths), max_in_flight=max_in_flight):
+        yield result
 
 
 async def detect_lang_1(
     option: str,
-    url_or_path: str | Path | BinaryIO,
-    server_endpoint: str = SERVER_ENDPOINT,
+    url_or_path: str | Path | BinaryIO | bytes | bytearray | memoryview,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
     verbose: int = VERBOSE,
     tika_server_jar: Path = TIKA_SERVER_JAR,
     response_mime_type: str = "text/plain",
@@ -593,8 +1232,8 @@ async def detect_lang_1(
 
     Args:
         option: Detection option (usually 'file').
-        url_or_path: File to analyze as URL, path, or file-like object.
-        server_endpoint: Tika server URL. Defaults to SERVER_ENDPOINT.
+        url_or_path: File to analyze as URL, path, file-like object or in-memory buffer.
+        server_endpoint: Tika server URL or TikaPool. Defaults to SERVER_ENDPOINT.
         verbose: Logging verbosity level. Defaults to VERBOSE.
         tika_server_jar: Path to Tika server JAR. Defaults to TIKA_SERVER_JAR.
         response_mime_type: Expected response format. Defaults to "text/plain".
@@ -611,85 +1250,125 @@ async def detect_lang_1(
     """
     services = services or {"file": "/language/stream"}
     request_options = request_options or {}
-    path, mode = get_remote_file(url_or_path, TIKA_FILES_PATH)
     if option not in services:
         msg = f"Language option must be one of {services.keys()}"
         logger.exception(msg)
         raise TikaError(msg)
     service = services[option]
-    status, response = await call_server(
-        verb="put",
-        server_endpoint=server_endpoint,
-        service=service,
-        data=get_file_handle(path),
-        headers={"Accept": response_mime_type},
-        verbose=verbose,
-        tika_server_jar=tika_server_jar,
-        request_options=request_options,
-    )
+    async with open_source(url_or_path) as (source, source_headers):
+        status, response = await call_server(
+            verb="put",
+            server_endpoint=server_endpoint,
+            service=service,
+            data=source,
+            headers={"Accept": response_mime_type, **source_headers},
+            verbose=verbose,
+            tika_server_jar=tika_server_jar,
+            request_options=request_options,
+        )
     return (status, response)
 
 
 async def detect_type(
     option: str,
     url_or_paths: Iterable[str | Path | BinaryIO],
-    server_endpoint: str = SERVER_ENDPOINT,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
     verbose: int = VERBOSE,
     tika_server_jar: Path = TIKA_SERVER_JAR,
     response_mime_type: str = "text/plain",
     services: dict[str, str] | None = None,
+    max_in_flight: int = TIKA_MAX_IN_FLIGHT,
+    prefix_bytes: int = TIKA_DETECT_PREFIX_BYTES,
 ) -> list[tuple[int, str | bytes | BinaryIO]]:
     """Detect MIME types of files using Tika.
 
     Args:
         option: Detection option (usually 'type').
         url_or_paths: Files to analyze as URLs, paths, or file-like objects.
-        server_endpoint: Tika server URL. Defaults to SERVER_ENDPOINT.
+        server_endpoint: Tika server URL or TikaPool. Defaults to SERVER_ENDPOINT.
         verbose: Logging verbosity level. Defaults to VERBOSE.
         tika_server_jar: Path to Tika server JAR. Defaults to TIKA_SERVER_JAR.
         response_mime_type: Expected response format. Defaults to "text/plain".
         services: Dict mapping options to service endpoints. Defaults to
                  {'type': '/detect/stream'}.
+        max_in_flight: Maximum number of concurrent requests. Defaults to TIKA_MAX_IN_FLIGHT.
+        prefix_bytes: Upload only this many leading bytes of each file; see
+            :func:`detect_type_1`. Defaults to TIKA_DETECT_PREFIX_BYTES.
 
     Returns:
         list[tuple[int, str | bytes | BinaryIO]]: List of tuples containing
-        (HTTP status code, detected MIME type) for each file.
+        (HTTP status code, detected MIME type) for each file, in input order.
     """
     services = services or {"type": "/detect/stream"}
-    paths = get_paths(url_or_paths)
-    return await asyncio.gather(
-        *[
-            detect_type_1(
-                option=option,
-                url_or_path=path,
-                server_endpoint=server_endpoint,
-                verbose=verbose,
-                tika_server_jar=tika_server_jar,
-                response_mime_type=response_mime_type,
-                services=services,
-            )
-            for path in paths
-        ]
+    detect_one = partial(
+        detect_type_1,
+        option,
+        server_endpoint=server_endpoint,
+        verbose=verbose,
+        tika_server_jar=tika_server_jar,
+        response_mime_type=response_mime_type,
+        services=services,
+        prefix_bytes=prefix_bytes,
+    )
+    return await gather_bounded(detect_one, get_paths(url_or_paths), max_in_flight=max_in_flight)
+
+
+async def iter_detect_type(
+    option: str,
+    url_or_paths: Iterable[str | Path | BinaryIO],
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
+    verbose: int = VERBOSE,
+    tika_server_jar: Path = TIKA_SERVER_JAR,
+    response_mime_type: str = "text/plain",
+    services: dict[str, str] | None = None,
+    max_in_flight: int = TIKA_MAX_IN_FLIGHT,
+    prefix_bytes: int = TIKA_DETECT_PREFIX_BYTES,
+) -> AsyncIterator[BatchResult]:
+    """Detect MIME types of files with bounded concurrency, yielding results as they complete.
+
+    Takes the same arguments as :func:`detect_type`; see :func:`iter_parse`.
+
+    Yields:
+        BatchResult: The input together with its (status, MIME type) tuple or its error.
+    """
+    services = services or {"type": "/detect/stream"}
+    detect_one = partial(
+        detect_type_1,
+        option,
+        server_endpoint=server_endpoint,
+        verbose=verbose,
+        tika_server_jar=tika_server_jar,
+        response_mime_type=response_mime_type,
+        services=services,
+        prefix_bytes=prefix_bytes,
     )
+    async for result in iter_batch(detect_one, get_paths(url_or_paths), max_in_flight=max_in_flight):
+        yield result
 
 
 async def detect_type_1(
     option: str,
-    url_or_path: str | Path | BinaryIO,
-    server_endpoint: str = SERVER_ENDPOINT,
+    url_or_path: str | Path | BinaryIO | bytes | bytearray | memoryview,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
     verbose: int = VERBOSE,
     tika_server_jar: Path = TIKA_SERVER_JAR,
     response_mime_type: str = "text/plain",
     services: dict[str, Any] | None = None,
     config_path: str | None = None,
     request_options: dict[str, Any] | None = None,
+    prefix_bytes: int = TIKA_DETECT_PREFIX_BYTES,
 ) -> tuple[int, str | bytes | BinaryIO]:
     """Detect MIME type of a single file using Tika.
 
+    With ``prefix_bytes`` set, only that many leading bytes are uploaded together with the
+    file name, which is all Tika's magic and name based detection looks at. Container
+    formats (ZIP, OLE2) need the whole file to tell e.g. DOCX from XLSX, so when the prefix
+    is detected as one of those the file is uploaded again in full.
+
     Args:
         option: Detection option (usually 'type').
-        url_or_path: File to analyze as URL, path, or file-like object.
-        server_endpoint: Tika server URL. Defaults to SERVER_ENDPOINT.
+        url_or_path: File to analyze as URL, path, file-like object or in-memory buffer.
+        server_endpoint: Tika server URL or TikaPool. Defaults to SERVER_ENDPOINT.
         verbose: Logging verbosity level. Defaults to VERBOSE.
         tika_server_jar: Path to Tika server JAR. Defaults to TIKA_SERVER_JAR.
         response_mime_type: Expected response format. Defaults to "text/plain".
@@ -697,6 +1376,8 @@ async def detect_type_1(
                  {'type': '/detect/stream'}.
         config_path: Path to Tika config file. Defaults to None.
         request_options: Additional request options. Defaults to None.
+        prefix_bytes: Number of leading bytes to upload first; 0 always uploads the whole
+            file. Defaults to TIKA_DETECT_PREFIX_BYTES.
 
     Returns:
         tuple[int, str | bytes | BinaryIO]: Tuple containing HTTP status code
@@ -707,52 +1388,124 @@ async def detect_type_1(
     """
     services = services or {"type": "/detect/stream"}
     request_options = request_options or {}
-    path, _ = get_remote_file(url_or_path, TIKA_FILES_PATH)
     if option not in services:
         msg = f"Detect option must be one of {services.keys()}"
         logger.exception(msg)
         raise TikaError(msg)
     service = services[option]
 
-    status, response = await call_server(
+    detect = partial(
+        call_server,
         verb="put",
         server_endpoint=server_endpoint,
         service=service,
-        data=get_file_handle(path),
-        headers={
-            "Accept": response_mime_type,
-            "Content-Disposition": make_content_disposition_header(path),
-        },
         verbose=verbose,
         tika_server_jar=tika_server_jar,
         config_path=config_path,
         request_options=request_options,
     )
+    async with open_source(url_or_path) as (source, source_headers):
+        headers = {"Accept": response_mime_type, **source_headers}
+        prefix = None
+        if prefix_bytes > 0:
+            prefix, source = await _split_prefix(source, prefix_bytes)
+        if prefix is None:
+            status, response = await detect(data=source, headers=headers)
+        else:
+            prefix_headers = {key: value for key, value in headers.items() if key != "Content-Length"}
+            status, response = await detect(data=prefix, headers=prefix_headers)
+            if len(prefix) < prefix_bytes:
+                _close_unsent(source)
+            elif status == HTTPStatus.OK and _needs_full_upload(response):
+                status, response = await detect(data=source, headers=headers)
+            else:
+                _close_unsent(source)
     if CSV_OUTPUT == 1:
         return (status, url_or_path.decode("UTF-8") + "," + response)  # type: ignore
     return (status, response)
 
 
-async def get_config(
-    option: str,
-    server_endpoint: str = SERVER_ENDPOINT,
-    verbose: int = VERBOSE,
-    tika_server_jar: Path = TIKA_SERVER_JAR,
-    response_mime_type: str = "application/json",
-    services: dict[str, str] | None = None,
-    request_options: dict[str, Any] | None = None,
-) -> tuple[int, str | bytes | BinaryIO]:
-    """Retrieves configuration information from the Tika server.
+# Types Tika reports for a container when it cannot see the entries that identify the subtype
+_CONTAINER_TYPES = frozenset(
+    {
+        "application/zip",
+        "application/x-tika-ooxml",
+        "application/x-tika-msoffice",
+        "application/x-tika-ooxml-protected",
+        "application/x-tar",
+        "application/octet-stream",
+    }
+)
 
-    Makes a GET request to the Tika server to fetch configuration details about
-    various server capabilities including parsers, detectors, and MIME types.
 
-    Args:
+def _needs_full_upload(response: Any) -> bool:  # noqa: ANN401
+    """Whether a type detected from a prefix is a container that the whole file may refine."""
+    if isinstance(response, bytes):
+        response = response.decode("utf-8", errors="replace")
+    return not isinstance(response, str) or response.split(";", 1)[0].strip().lower() in _CONTAINER_TYPES
+
+
+async def _split_prefix(source: Any, size: int) -> tuple[bytes | None, Any]:  # noqa: ANN401
+    """Read up to size leading bytes of an upload body without consuming it.
+
+    Returns:
+        tuple: The prefix, or None if the body cannot be peeked at, and a body that still
+        produces the full content.
+    """
+    if isinstance(source, bytes | bytearray | memoryview):
+        return bytes(source[:size]), source
+    if isinstance(source, Path):
+        return await asyncio.to_thread(_read_path_prefix, source, size), source
+    if hasattr(source, "seekable") and source.seekable():
+        position = source.tell()
+        prefix = await asyncio.to_thread(source.read, size)
+        source.seek(position)
+        return prefix, source
+    if isinstance(source, AsyncIterator):
+        chunks: list[bytes] = []
+        length = 0
+        async for chunk in source:
+            chunks.append(chunk)
+            length += len(chunk)
+            if length >= size:
+                break
+        return b"".join(chunks)[:size], _prepend(chunks, source)
+    return None, source
+
+
+def _read_path_prefix(path: Path, size: int) -> bytes:
+    with path.open("rb") as file_obj:
+        return file_obj.read(size)
+
+
+async def _prepend(chunks: list[bytes], rest: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Yield chunks that were already read from an async iterator, then the rest of it."""
+    for chunk in chunks:
+        yield chunk
+    async for chunk in rest:
+        yield chunk
+
+
+async def get_config(
+    option: str,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
+    verbose: int = VERBOSE,
+    tika_server_jar: Path = TIKA_SERVER_JAR,
+    response_mime_type: str = "application/json",
+    services: dict[str, str] | None = None,
+    request_options: dict[str, Any] | None = None,
+) -> tuple[int, str | bytes | BinaryIO]:
+    """Retrieves configuration information from the Tika server.
+
+    Makes a GET request to the Tika server to fetch configuration details about
+    various server capabilities including parsers, detectors, and MIME types.
+
+    Args:
         option: The configuration to retrieve. Must be one of:
             - "mime-types": List of supported MIME types
             - "detectors": Available content type detectors
             - "parsers": Available document parsers
-        server_endpoint: URL of the Tika server. Defaults to SERVER_ENDPOINT.
+        server_endpoint: URL of the Tika server or a TikaPool. Defaults to SERVER_ENDPOINT.
         verbose: Level of logging verbosity. Defaults to VERBOSE.
         tika_server_jar: Path to the Tika server JAR file. Defaults to TIKA_SERVER_JAR.
         response_mime_type: Expected MIME type of the response. Defaults to "application/json".
@@ -798,36 +1551,126 @@ async def get_config(
     return (status, response)
 
 
-_http_client: httpx.AsyncClient | None = None
+# options for clients created by get_async_client, keyed on normalized endpoint (None for the defaults)
+_client_options: dict[str | None, dict[str, Any]] = {}
+_http_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str | None, httpx.AsyncClient]] = (
+    weakref.WeakKeyDictionary()
+)
+# clients requested outside of a running event loop
+_unbound_http_clients: dict[str | None, httpx.AsyncClient] = {}
+
 
+def create_async_client(
+    *,
+    max_connections: int | None = TIKA_HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections: int | None = TIKA_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float | None = TIKA_HTTP_KEEPALIVE_EXPIRY,
+    connect_timeout: float | None = TIKA_HTTP_CONNECT_TIMEOUT,
+    read_timeout: float | None = TIKA_HTTP_READ_TIMEOUT,
+    write_timeout: float | None = TIKA_HTTP_WRITE_TIMEOUT,
+    pool_timeout: float | None = TIKA_HTTP_POOL_TIMEOUT,
+    http2: bool = TIKA_HTTP2,
+    verify: bool = False,
+) -> httpx.AsyncClient:
+    """Create an httpx.AsyncClient with the connection pool limits and timeouts used for Tika.
+
+    Args:
+        max_connections: Maximum number of open connections. Defaults to TIKA_HTTP_MAX_CONNECTIONS.
+        max_keepalive_connections: Maximum number of idle connections kept open.
+            Defaults to TIKA_HTTP_MAX_KEEPALIVE_CONNECTIONS.
+        keepalive_expiry: Seconds an idle connection is kept open. Defaults to TIKA_HTTP_KEEPALIVE_EXPIRY.
+        connect_timeout: Seconds to wait for a connection. Defaults to TIKA_HTTP_CONNECT_TIMEOUT.
+        read_timeout: Seconds to wait for response data. Defaults to TIKA_HTTP_READ_TIMEOUT.
+        write_timeout: Seconds to wait while sending request data. Defaults to TIKA_HTTP_WRITE_TIMEOUT.
+        pool_timeout: Seconds to wait for a free connection from the pool. Defaults to TIKA_HTTP_POOL_TIMEOUT.
+        http2: Whether to negotiate HTTP/2. Requires the ``h2`` package. Defaults to TIKA_HTTP2.
+        verify: Whether to verify TLS certificates. Defaults to False.
 
-def get_async_client() -> httpx.AsyncClient:
+    Returns:
+        httpx.AsyncClient: A new client; the caller is responsible for closing it.
+
+    Raises:
+        TikaError: If HTTP/2 is requested but ``h2`` is not installed.
     """
-    Returns a memoized httpx.AsyncClient instance.
-    Creates a new one if it doesn't exist.
+    if http2 and importlib.util.find_spec("h2") is None:
+        msg = "HTTP/2 support requires the h2 package; install it with 'pip install httpx[http2]'"
+        raise TikaError(msg)
+    return httpx.AsyncClient(
+        verify=verify,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(connect=connect_timeout, read=read_timeout, write=write_timeout, pool=pool_timeout),
+    )
+
+
+def configure_client(server_endpoint: str | None = None, **options: Any) -> None:  # noqa: ANN401
+    """Set the :func:`create_async_client` options used for new clients of an endpoint.
+
+    Options for ``server_endpoint=None`` apply to every endpoint, and endpoint specific options
+    override them. Clients that already exist keep their settings until
+    :func:`close_async_client` is called.
+
+    Example:
+        >>> configure_client(max_connections=200, read_timeout=300)
+        >>> configure_client("http://tika-1:9998", http2=True)
     """
-    global _http_client
-    if _http_client is None:
-        _http_client = httpx.AsyncClient(verify=False, timeout=60.0)  # noqa: S501
-    return _http_client
+    _client_options.setdefault(_client_key(server_endpoint), {}).update(options)
+
+
+def get_async_client(server_endpoint: str | None = None) -> httpx.AsyncClient:
+    """Return the client for an endpoint on the running event loop, creating it if needed.
+
+    Each (endpoint, event loop) pair gets its own client, and so its own connection pool,
+    so a busy server cannot starve requests to another one and clients are never shared
+    between loops.
+
+    Args:
+        server_endpoint: URL of the Tika server. Defaults to None, the client used for
+            everything else (e.g. downloading remote documents).
+    """
+    key = _client_key(server_endpoint)
+    try:
+        clients = _http_clients.setdefault(asyncio.get_running_loop(), {})
+    except RuntimeError:
+        clients = _unbound_http_clients
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        options = {**_client_options.get(None, {}), **_client_options.get(key, {})}
+        client = clients[key] = create_async_client(**options)
+    return client
 
 
 async def close_async_client() -> None:
     """
-    Closes the memoized client if it exists.
+    Closes the clients created for the running event loop, if any.
     Should be called when shutting down the application.
     """
-    global _http_client
-    if _http_client is not None:
-        await _http_client.aclose()
-        _http_client = None
+    try:
+        clients = _http_clients.pop(asyncio.get_running_loop(), {})
+    except RuntimeError:
+        clients = {}
+    for client in [*clients.values(), *_unbound_http_clients.values()]:
+        await client.aclose()
+    _unbound_http_clients.clear()
+
+
+def _client_key(server_endpoint: str | None) -> str | None:
+    """Normalize an endpoint to scheme://host:port so every service on a server shares a client."""
+    if server_endpoint is None:
+        return None
+    parsed_url = urlparse(server_endpoint)
+    return f"{parsed_url.scheme}://{parsed_url.netloc}".lower()
 
 
-async def call_server(  # noqa: C901
+async def call_server(
     verb: str,
-    server_endpoint: str,
+    server_endpoint: str | TikaPool,
     service: str,
-    data: str | bytes | BinaryIO | None,
+    data: str | bytes | Path | BinaryIO | AsyncIterable[bytes] | None,
     *,
     headers: dict[str, Any],
     verbose: int = VERBOSE,
@@ -837,11 +1680,396 @@ async def call_server(  # noqa: C901
     config_path: str | None = None,
     request_options: dict[str, Any] | None = None,
 ) -> tuple[int, str | bytes | BinaryIO]:
-    """Make an HTTP request to the Tika Server."""
-    client = get_async_client()
+    """Make an HTTP request to the Tika Server.
+
+    Paths, file-like objects and async iterators are streamed to the server in chunks of
+    ``TIKA_UPLOAD_CHUNK_SIZE`` bytes, so peak memory does not grow with the document size.
+    File-like objects are closed once the request completes. When ``server_endpoint`` is a
+    :class:`TikaPool`, the request is sent to one of its endpoints and failed over to another
+    if that endpoint is unreachable or overloaded. When a result cache is set with
+    :func:`set_result_cache`, successful responses to requests with a body are served from
+    and stored in it, and with :func:`set_single_flight` concurrent identical requests share
+    one response.
+    """
+    request_key = await _request_key(verb, server_endpoint, service, data, headers, config_path)
+    send = partial(
+        _call_server,
+        verb,
+        server_endpoint,
+        service,
+        data,
+        headers=headers,
+        verbose=verbose,
+        tika_server_jar=tika_server_jar,
+        classpath=classpath,
+        config_path=config_path,
+        request_options=request_options,
+    )
+    if request_key is None:
+        return await send(raw_response=raw_response)
+
+    cache = _result_cache
+    content = None if cache is None else await _cache_get(cache, request_key)
+    if content is not None:
+        _close_unsent(data)
+        status = HTTPStatus.OK
+    else:
+
+        async def fetch() -> tuple[int, bytes]:
+            status, content = await send(raw_response=True)
+            if status == HTTPStatus.OK and cache is not None:
+                await _cache_set(cache, request_key, content)  # type: ignore
+            return (status, content)  # type: ignore
+
+        if _single_flight:
+            status, content, shared = await _join_flight(request_key, fetch)
+            if shared:
+                _close_unsent(data)
+        else:
+            status, content = await fetch()
+    return (status, content if raw_response else content.decode("utf-8", errors="replace"))
+
+
+_result_cache: CacheBackend | None = None
+
+
+async def _cache_get(cache: CacheBackend, key: str) -> bytes | None:
+    """Look a response up in the cache, treating a failing backend as a miss."""
+    try:
+        return await cache.get(key)
+    except Exception:
+        msg = f"Result cache lookup failed in {type(cache).__name__}; asking the server"
+        logger.exception(msg)
+        return None
+
+
+async def _cache_set(cache: CacheBackend, key: str, value: bytes) -> None:
+    """Store a response in the cache; a failing backend must not fail the request it answers."""
+    try:
+        await cache.set(key, value)
+    except Exception:
+        msg = f"Result cache store failed in {type(cache).__name__}; response not cached"
+        logger.exception(msg)
+
+
+def set_result_cache(cache: CacheBackend | None) -> None:
+    """Serve repeated requests from a cache instead of the Tika server.
+
+    Responses are stored under a hash of the request body, the verb, service, config path and
+    request headers, so the same document sent to the same service with the same options (and
+    file name, which Tika uses for type detection) is only processed once. Only successful
+    responses to requests whose body can be hashed without consuming it are cached: strings,
+    bytes, buffers, paths and seekable file-like objects. Cached text is decoded as UTF-8.
+    Errors raised by the backend are logged and the request goes to the server as if the
+    cache were not there.
+
+    Args:
+        cache: A backend from :mod:`tika.cache`, or None to disable caching.
+
+    Example:
+        >>> from tika.cache import MemoryCache
+        >>> set_result_cache(MemoryCache(max_bytes=256 * 1024 * 1024))
+    """
+    global _result_cache
+    _result_cache = cache
+
+
+_single_flight = TIKA_SINGLE_FLIGHT
+
+
+def set_single_flight(*, enabled: bool = True) -> None:
+    """Share one Tika request between concurrent calls for the same document.
+
+    While a request is in flight, identical requests (same key as the result cache) wait
+    for its response instead of being sent again. This works with or without a result
+    cache, but costs hashing each request body that can be hashed.
+
+    Args:
+        enabled: Whether to deduplicate in-flight requests. Defaults to True.
+    """
+    global _single_flight
+    _single_flight = enabled
+
+
+class _Flight:
+    """A request in flight and the number of callers waiting for it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task[tuple[int, bytes]]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+_flights: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, _Flight]] = weakref.WeakKeyDictionary()
+
+
+async def _join_flight(key: str, fetch: Callable[[], Awaitable[tuple[int, bytes]]]) -> tuple[int, bytes, bool]:
+    """Run fetch, or wait for the identical request already in flight on this loop.
+
+    The request runs in its own task, so a caller that is cancelled does not cancel it for
+    the others; it is only cancelled once every caller has gone.
+
+    Returns:
+        tuple: The status, the raw response and whether it came from another caller's request.
+    """
+    flights = _flights.setdefault(asyncio.get_running_loop(), {})
+    flight = flights.get(key)
+    shared = flight is not None
+    if flight is None:
+        flight = flights[key] = _Flight(asyncio.create_task(fetch()))
+        flight.task.add_done_callback(lambda _: flights.pop(key, None))
+    flight.waiters += 1
+    try:
+        status, content = await asyncio.shield(flight.task)
+    finally:
+        flight.waiters -= 1
+        if flight.waiters == 0 and not flight.task.done():
+            flight.task.cancel()
+    return (status, content, shared)
+
+
+def _close_unsent(data: Any) -> None:  # noqa: ANN401
+    """Close a file-like body that was answered without being sent, as sending it would have."""
+    if hasattr(data, "close"):
+        data.close()
+
+
+async def _request_key(
+    verb: str,
+    server_endpoint: str | TikaPool,
+    service: str,
+    data: Any,  # noqa: ANN401
+    headers: dict[str, Any],
+    config_path: str | None,
+) -> str | None:
+    """Return the key identifying a request for the result cache and single-flight, or None.
+
+    None is returned when neither is enabled, or the request has no body that can be hashed.
+    The endpoint is part of the key, so servers with different configurations never share
+    results; a pool is keyed by its whole set of endpoints, any of which may answer.
+    """
+    if (_result_cache is None and not _single_flight) or data is None or verb.lower() == "get":
+        return None
+    if isinstance(server_endpoint, TikaPool):
+        endpoints = [member.url for member in server_endpoint.members]
+    else:
+        endpoints = [server_endpoint]
+    request = [verb.lower(), sorted(_endpoint_key(endpoint) for endpoint in endpoints), service, config_path]
+    request += sorted(
+        (key.lower(), str(value))
+        for key, value in headers.items()
+        if key.lower() != "content-length" and not _GENERATED_FILENAME.search(str(value))
+    )
+    digest = hashlib.blake2b(orjson.dumps(request), digest_size=32)
+    if isinstance(data, str):
+        digest.update(data.encode("utf-8"))
+    elif isinstance(data, bytes | bytearray | memoryview):
+        digest.update(data)
+    elif isinstance(data, Path):
+        await asyncio.to_thread(_hash_path, data, digest)
+    elif hasattr(data, "getbuffer"):
+        with data.getbuffer() as view:
+            digest.update(view[data.tell() :])
+    elif _replay_position(data) is not None:
+        position = data.tell()
+        await asyncio.to_thread(_hash_stream, data, digest)
+        data.seek(position)
+    else:
+        return None
+    return digest.hexdigest()
+
+
+def _endpoint_key(server_endpoint: str) -> str:
+    """Normalize an endpoint to scheme://host:port/path for use in a request key."""
+    parsed_url = urlparse(server_endpoint)
+    return f"{parsed_url.scheme}://{parsed_url.netloc}".lower() + parsed_url.path.rstrip("/")
+
+
+def _hash_path(path: Path, digest: Any) -> None:  # noqa: ANN401
+    with open(path, "rb") as f:
+        _hash_stream(f, digest)
+
+
+def _hash_stream(file_handle: BinaryIO, digest: Any) -> None:  # noqa: ANN401
+    while chunk := file_handle.read(TIKA_UPLOAD_CHUNK_SIZE):
+        digest.update(chunk)
+
+
+async def _call_server(
+    verb: str,
+    server_endpoint: str | TikaPool,
+    service: str,
+    data: str | bytes | Path | BinaryIO | AsyncIterable[bytes] | None,
+    *,
+    headers: dict[str, Any],
+    verbose: int = VERBOSE,
+    tika_server_jar: Path = TIKA_SERVER_JAR,
+    classpath: str | None = None,
+    raw_response: bool = False,
+    config_path: str | None = None,
+    request_options: dict[str, Any] | None = None,
+) -> tuple[int, str | bytes | BinaryIO]:
+    """Send a request to the Tika Server, bypassing the result cache; see :func:`call_server`."""
+    if isinstance(server_endpoint, TikaPool):
+
+        def request(endpoint: str, body: Any) -> Awaitable[tuple[int, str | bytes | BinaryIO]]:  # noqa: ANN401
+            return _call_server(
+                verb,
+                endpoint,
+                service,
+                body,
+                headers=headers,
+                verbose=verbose,
+                tika_server_jar=tika_server_jar,
+                classpath=classpath,
+                raw_response=raw_response,
+                config_path=config_path,
+                request_options=request_options,
+            )
+
+        return await server_endpoint.send(request, data)
+
+    client = get_async_client(server_endpoint)
+    request_options = request_options or {}
+    service_url = await _service_url(
+        server_endpoint,
+        service,
+        tika_server_jar=tika_server_jar,
+        classpath=classpath,
+        config_path=config_path,
+    )
+    headers = dict(headers)
+    content, file_handle = _prepare_content(data, headers)
+
+    # Make the async request
+    try:
+        if verb.lower() == "get":
+            resp = await client.get(service_url, headers=headers, **request_options)
+        elif verb.lower() == "put":
+            resp = await client.put(service_url, content=content, headers=headers, **request_options)
+        elif verb.lower() == "post":
+            resp = await client.post(service_url, content=content, headers=headers, **request_options)
+        else:
+            msg = f"Unsupported HTTP verb: {verb}"
+            raise TikaError(msg)
+
+        if verbose:
+            logger.info(f"Request headers: {headers}")
+            logger.info(f"Response headers: {resp.headers}")
+
+        if resp.status_code != 200:
+            logger.warning(f"Tika server returned status: {resp.status_code}")
+
+        return (resp.status_code, resp.content if raw_response else resp.text)
+
+    except httpx.RequestError as e:
+        raise _request_error(e, service_url) from e
+
+    finally:
+        await _close_content(content, file_handle)
+
+
+async def call_server_stream(
+    verb: str,
+    server_endpoint: str | TikaPool,
+    service: str,
+    data: str | bytes | Path | BinaryIO | AsyncIterable[bytes] | None,
+    *,
+    headers: dict[str, Any],
+    verbose: int = VERBOSE,
+    tika_server_jar: Path = TIKA_SERVER_JAR,
+    classpath: str | None = None,
+    config_path: str | None = None,
+    request_options: dict[str, Any] | None = None,
+) -> AsyncIterator[bytes]:
+    """Make an HTTP request to the Tika Server and yield the response body as it arrives.
+
+    Takes the same arguments as :func:`call_server`. The response is never buffered in full;
+    each chunk is yielded as soon as it is received, with any content encoding removed.
+
+    Yields:
+        bytes: Chunks of the response body.
+
+    Raises:
+        TikaError: If the server returns a non-200 status or the request fails.
+    """
+    if isinstance(server_endpoint, TikaPool):
+        async with server_endpoint.endpoint() as endpoint:
+            async for chunk in call_server_stream(
+                verb,
+                endpoint,
+                service,
+                data,
+                headers=headers,
+                verbose=verbose,
+                tika_server_jar=tika_server_jar,
+                classpath=classpath,
+                config_path=config_path,
+                request_options=request_options,
+            ):
+                yield chunk
+        return
+
+    client = get_async_client(server_endpoint)
     request_options = request_options or {}
+    service_url = await _service_url(
+        server_endpoint,
+        service,
+        tika_server_jar=tika_server_jar,
+        classpath=classpath,
+        config_path=config_path,
+    )
+    if verb.lower() not in ("get", "put", "post"):
+        msg = f"Unsupported HTTP verb: {verb}"
+        raise TikaError(msg)
+    headers = dict(headers)
+    content, file_handle = _prepare_content(data, headers)
+
+    try:
+        async with client.stream(
+            verb.upper(), service_url, content=content, headers=headers, **request_options
+        ) as resp:
+            if verbose:
+                logger.info(f"Request headers: {headers}")
+                logger.info(f"Response headers: {resp.headers}")
+
+            if resp.status_code != HTTPStatus.OK:
+                body = (await resp.aread()).decode("utf-8", errors="replace")
+                msg = f"Unexpected response from Tika server ({resp.status_code}): {body}"
+                logger.warning(msg)
+                raise TikaError(msg)
+
+            async for chunk in resp.aiter_bytes():
+                yield chunk
+
+    except httpx.RequestError as e:
+        raise _request_error(e, service_url) from e
+
+    finally:
+        await _close_content(content, file_handle)
+
+
+def _request_error(error: httpx.RequestError, service_url: str) -> TikaError:
+    """Log a failed request to the Tika server and turn it into a TikaError."""
+    if isinstance(error, httpx.NetworkError):
+        forget_server_liveness(service_url)
+    msg = f"Error making request to Tika server: {error}"
+    if isinstance(error, httpx.PoolTimeout):
+        msg += " (all connections to the server are busy; consider raising TIKA_HTTP_MAX_CONNECTIONS)"
+    logger.error(msg)
+    return TikaError(msg)
+
 
-    # Server endpoint validation and setup
+async def _service_url(
+    server_endpoint: str,
+    service: str,
+    *,
+    tika_server_jar: Path = TIKA_SERVER_JAR,
+    classpath: str | None = None,
+    config_path: str | None = None,
+) -> str:
+    """Validate the server endpoint, start a local server if needed and return the service URL."""
     parsed_url = urlparse(server_endpoint)
     server_host = parsed_url.hostname
     scheme: Literal["http", "https"] = parsed_url.scheme  # type: ignore
@@ -863,8 +2091,8 @@ async def call_server(  # noqa: C901
     if classpath is None:
         classpath = TIKA_SERVER_CLASSPATH
 
-    if not TIKA_CLIENT_ONLY:
-        server_endpoint = check_tika_server(
+    if not TIKA_CLIENT_ONLY and server_endpoint not in _farm_endpoints:
+        server_endpoint = await check_tika_server_async(
             scheme=scheme,
             server_host=server_host,
             port=str(port),
@@ -873,44 +2101,92 @@ async def call_server(  # noqa: C901
             config_path=config_path,
         )
 
-    service_url = server_endpoint + service
+    return server_endpoint + service
 
-    # Handle data preparation
-    prepared_data: bytes | None = None
-    if data is not None:
-        if isinstance(data, str | bytes):
-            prepared_data = data.encode("utf-8") if isinstance(data, str) else data
-        elif hasattr(data, "read"):
-            # Read file-like objects completely into memory
-            prepared_data = data.read() if IS_WINDOWS else data.read()  # type: ignore
-            if hasattr(data, "close"):
-                data.close()  # type: ignore
 
-    # Make the async request
-    try:
-        if verb.lower() == "get":
-            resp = await client.get(service_url, headers=headers, **request_options)
-        elif verb.lower() == "put":
-            resp = await client.put(service_url, content=prepared_data, headers=headers, **request_options)
-        elif verb.lower() == "post":
-            resp = await client.post(service_url, content=prepared_data, headers=headers, **request_options)
-        else:
-            msg = f"Unsupported HTTP verb: {verb}"
-            raise TikaError(msg)
+def _prepare_content(
+    data: str | bytes | bytearray | memoryview | Path | BinaryIO | AsyncIterable[bytes] | None,
+    headers: dict[str, Any],
+) -> tuple[bytes | AsyncIterable[bytes] | None, BinaryIO | None]:
+    """Turn request data into an httpx body, adding Content-Length to headers when it is known.
 
-        if verbose:
-            logger.info(f"Request headers: {headers}")
-            logger.info(f"Response headers: {resp.headers}")
+    In-memory buffers (``bytearray``, ``memoryview`` and ``BytesIO``) are sent as slices of
+    their own memory rather than being copied into a new ``bytes`` object first.
 
-        if resp.status_code != 200:
-            logger.warning(f"Tika server returned status: {resp.status_code}")
+    Returns:
+        tuple: The request content and, for paths and file-like objects, the handle that
+        must be passed to :func:`_close_content` once the request completes.
+    """
+    if data is None:
+        return (None, None)
+    if isinstance(data, str | bytes):
+        return (data.encode("utf-8") if isinstance(data, str) else data, None)
+    if isinstance(data, bytearray | memoryview):
+        view = memoryview(data).cast("B")
+        _set_content_length(headers, view.nbytes)
+        return (_iter_buffer_chunks(view), None)
+
+    if isinstance(data, Path):
+        file_handle: BinaryIO = open(data, "rb")  # noqa: SIM115
+    elif hasattr(data, "getbuffer"):
+        view = data.getbuffer()[data.tell() :]  # type: ignore
+        _set_content_length(headers, view.nbytes)
+        return (_iter_buffer_chunks(view), data)  # type: ignore
+    elif hasattr(data, "read"):
+        file_handle = data  # type: ignore
+    else:
+        return (data, None)  # type: ignore
 
-        return (resp.status_code, resp.content if raw_response else resp.text)
+    length = _remaining_length(file_handle)
+    if length is not None:
+        _set_content_length(headers, length)
+    return (_iter_file_chunks(file_handle), file_handle)
 
-    except httpx.RequestError as e:
-        msg = f"Error making request to Tika server: {str(e)}"
-        logger.error(msg)
-        raise TikaError(msg) from e
+
+async def _close_content(content: bytes | AsyncIterable[bytes] | None, file_handle: BinaryIO | None) -> None:
+    """Release the body generator and file handle returned by :func:`_prepare_content`."""
+    if file_handle is None:
+        return
+    if isinstance(content, AsyncGenerator):
+        await content.aclose()
+    if hasattr(file_handle, "close"):
+        file_handle.close()
+
+
+def _set_content_length(headers: dict[str, Any], length: int) -> None:
+    """Set Content-Length unless the caller already provided one."""
+    if not any(key.lower() == "content-length" for key in headers):
+        headers["Content-Length"] = str(length)
+
+
+async def _iter_file_chunks(file_handle: BinaryIO, chunk_size: int = TIKA_UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Yield a file-like object in fixed-size chunks without blocking the event loop."""
+    while chunk := await asyncio.to_thread(file_handle.read, chunk_size):
+        yield chunk
+
+
+async def _iter_buffer_chunks(view: memoryview, chunk_size: int = TIKA_UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Yield fixed-size slices of a buffer, releasing the view once it has been sent."""
+    with view:
+        for start in range(0, view.nbytes, chunk_size):
+            yield view[start : start + chunk_size]  # type: ignore
+
+
+def _remaining_length(file_handle: BinaryIO) -> int | None:
+    """Return the number of bytes left to read from a file-like object, or None if unknown."""
+    try:
+        return max(os.fstat(file_handle.fileno()).st_size - file_handle.tell(), 0)
+    except (AttributeError, OSError, ValueError):
+        pass
+    try:
+        if not file_handle.seekable():
+            return None
+        position = file_handle.tell()
+        end = file_handle.seek(0, os.SEEK_END)
+        file_handle.seek(position)
+        return max(end - position, 0)
+    except (AttributeError, OSError, ValueError):
+        return None
 
 
 def check_tika_server(
@@ -949,7 +2225,9 @@ def check_tika_server(
     server_endpoint = f"{scheme}://{server_host}:{port}"
     jar_path = Path(os.path.join(TIKA_JAR_PATH, "tika-server.jar"))
     if "localhost" in server_endpoint or "127.0.0.1" in server_endpoint:
-        already_running = check_port_is_open(remote_server_host=server_host, port=port)
+        already_running = _is_known_live(server_host, port) or check_port_is_open(
+            remote_server_host=server_host, port=port
+        )
 
         if not already_running:
             if not check_jar_signature(tika_server_jar=tika_server_jar, jar_path=jar_path):
@@ -970,32 +2248,175 @@ def check_tika_server(
                 logger.error("Failed to receive startup confirmation from startServer.")
                 msg = "Unable to start Tika server."
                 raise RuntimeError(msg)
+        _mark_live(server_host, port)
     return server_endpoint
 
 
-def check_jar_signature(tika_server_jar: Path, jar_path: Path) -> bool:
+async def check_tika_server_async(
+    scheme: Literal["http", "https"] = "http",
+    server_host: str = SERVER_HOST,
+    port: str = PORT,
+    tika_server_jar: Path = TIKA_SERVER_JAR,
+    classpath: str | None = None,
+    config_path: str | None = None,
+) -> str:
+    """Check if Tika server is running and start it if necessary, without blocking the event loop.
+
+    Takes the same arguments and returns the same endpoint as :func:`check_tika_server`.
+    The port check, checksum verification and startup all run off the event loop, and
+    startup completes as soon as the server answers ``/version``.
+
+    Raises:
+        RuntimeError: If server JAR signature doesn't match or server fails to start.
+    """
+    if port is None:
+        port = "443" if scheme == "https" else "80"
+
+    server_endpoint = f"{scheme}://{server_host}:{port}"
+    jar_path = Path(os.path.join(TIKA_JAR_PATH, "tika-server.jar"))
+    if "localhost" not in server_endpoint and "127.0.0.1" not in server_endpoint:
+        return server_endpoint
+    if _is_known_live(server_host, port) or await _port_accepts(server_host, int(port)):
+        _mark_live(server_host, port)
+        return server_endpoint
+
+    async with _startup_lock():
+        # another request may have started the server while this one waited for the lock
+        if _is_known_live(server_host, port) or await _port_accepts(server_host, int(port)):
+            _mark_live(server_host, port)
+            return server_endpoint
+        if not await asyncio.to_thread(check_jar_signature, tika_server_jar=tika_server_jar, jar_path=jar_path):
+            msg = f"Jar signature does not match for JAR {tika_server_jar} at path {jar_path}"
+            logger.error(msg)
+            raise RuntimeError(msg)
+
+        status = await start_server_async(
+            tika_server_jar=jar_path,
+            java_path=TIKA_JAVA,
+            java_args=TIKA_JAVA_ARGS,
+            server_host=server_host,
+            port=port,
+            classpath=classpath,
+            config_path=config_path,
+        )
+        if not status:
+            logger.error("Failed to receive startup confirmation from start_server_async.")
+            msg = "Unable to start Tika server."
+            raise RuntimeError(msg)
+        _mark_live(server_host, port)
+    return server_endpoint
+
+
+# (host, port) of local servers recently seen accepting connections, mapped to when that expires
+_live_servers: dict[tuple[str, int], float] = {}
+
+
+def _is_known_live(server_host: str, port: str | int) -> bool:
+    """Return True if the server was seen up less than TIKA_LIVENESS_TTL seconds ago."""
+    return _live_servers.get((server_host, int(port)), 0.0) > time.monotonic()
+
+
+def _mark_live(server_host: str, port: str | int) -> None:
+    """Remember that the server is up so requests in the next TIKA_LIVENESS_TTL seconds skip the check."""
+    if TIKA_LIVENESS_TTL > 0:
+        _live_servers[(server_host, int(port))] = time.monotonic() + TIKA_LIVENESS_TTL
+
+
+def forget_server_liveness(server_endpoint: str | None = None) -> None:
+    """Drop cached liveness so the next request checks (and if needed starts) the server again.
+
+    Args:
+        server_endpoint: URL of the server to forget, or None to forget every server.
     """
-    Checks the signature of Jar
-    :param tika_server_jar:
-    :param jarPath:
-    :return: ``True`` if the signature of the jar matches
+    if server_endpoint is None:
+        _live_servers.clear()
+        return
+    parsed_url = urlparse(server_endpoint)
+    if parsed_url.hostname and parsed_url.port:
+        _live_servers.pop((parsed_url.hostname, parsed_url.port), None)
+
+
+_startup_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = weakref.WeakKeyDictionary()
+
+
+def _startup_lock() -> asyncio.Lock:
+    """Return the lock that serializes local server startup on the running event loop."""
+    loop = asyncio.get_running_loop()
+    lock = _startup_locks.get(loop)
+    if lock is None:
+        lock = _startup_locks[loop] = asyncio.Lock()
+    return lock
+
+
+def check_jar_signature(tika_server_jar: Path, jar_path: Path, algo: str = TIKA_JAR_HASH_ALGO) -> bool:
+    """Check the JAR against the checksum published next to it.
+
+    The checksum is read from ``<jar_path>.<algo>`` (e.g. ``tika-server.jar.md5``); like the
+    files on Maven Central it may be followed by the file name. The JAR's digest is remembered
+    in memory and in ``<jar_path>.sigcache``, keyed on its path, size, mtime and inode, so it is
+    only hashed again (in streamed chunks) after the file changes.
+
+    Args:
+        tika_server_jar: The JAR the server was installed from, used in error messages.
+        jar_path: Path of the JAR to check.
+        algo: Any :mod:`hashlib` algorithm, e.g. "md5", "sha1" or "sha512". Defaults to TIKA_JAR_HASH_ALGO.
+
+    Returns:
+        bool: ``True`` if the signature of the jar matches.
+
+    Raises:
+        RuntimeError: If the checksum file does not exist.
     """
-    local_checksum_path = Path(jar_path, TIKA_JAR_HASH_ALGO)
+    local_checksum_path = jar_path.with_name(f"{jar_path.name}.{algo}")
     if not local_checksum_path.exists():
-        msg = f"Checksum file not found for JAR {tika_server_jar} at path {jar_path}"
+        msg = f"Checksum file not found for JAR {tika_server_jar} at path {local_checksum_path}"
         raise RuntimeError(msg)
 
-    m = hashlib.new(TIKA_JAR_HASH_ALGO)
+    expected = local_checksum_path.read_text().split(maxsplit=1)
+    return bool(expected) and expected[0].lower() == jar_digest(jar_path, algo)
+
+
+# digests of JARs already hashed by this process, keyed on (path, size, mtime, inode, algorithm)
+_jar_digests: dict[tuple[str, int, int, int, str], str] = {}
+
+
+def jar_digest(jar_path: Path, algo: str = TIKA_JAR_HASH_ALGO) -> str:
+    """Return the hex digest of a JAR, reusing a cached value while the file is unchanged.
+
+    Args:
+        jar_path: Path of the JAR to hash.
+        algo: Any :mod:`hashlib` algorithm. Defaults to TIKA_JAR_HASH_ALGO.
+
+    Returns:
+        str: The lower-case hex digest.
+    """
+    stat = os.stat(jar_path)
+    key = (str(Path(jar_path).resolve()), stat.st_size, stat.st_mtime_ns, stat.st_ino, algo)
+    digest = _jar_digests.get(key)
+    if digest is not None:
+        return digest
+
+    cache_path = jar_path.with_name(jar_path.name + ".sigcache")
+    try:
+        cached = orjson.loads(cache_path.read_bytes())
+        if tuple(cached["key"]) == key:
+            digest = _jar_digests[key] = cached["digest"]
+            return digest  # type: ignore
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
 
     with open(jar_path, "rb") as f:
-        bin_contents = f.read()
-        m.update(bin_contents)
-        with open(local_checksum_path) as em:
-            existing_contents = em.read()
-            return existing_contents == m.hexdigest()
+        digest = _jar_digests[key] = hashlib.file_digest(f, algo).hexdigest()
+    try:
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}")
+        tmp_path.write_bytes(orjson.dumps({"key": key, "digest": digest}))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Unable to write JAR signature cache {cache_path}: {e}")
+    return digest
 
 
-def start_server(  # noqa: C901
+def start_server(
     tika_server_jar: Path,
     java_path: str = TIKA_JAVA,
     java_args: str = TIKA_JAVA_ARGS,
@@ -1004,7 +2425,7 @@ def start_server(  # noqa: C901
     classpath: str | None = None,
     config_path: str | None = None,
 ) -> bool:
-    """Start the Tika Server as a subprocess.
+    """Start the Tika Server as a subprocess and wait until it answers requests.
 
     Args:
         tika_server_jar: Path to the Tika server JAR file.
@@ -1021,77 +2442,159 @@ def start_server(  # noqa: C901
     Note:
         - Creates a log file at TIKA_SERVER_LOG_FILE_PATH/tika-server.log
         - On Windows, forces server_host to "0.0.0.0"
-        - Attempts to start server multiple times based on TIKA_STARTUP_MAX_RETRY
+        - Probes ``/version`` with exponential backoff for up to
+          TIKA_STARTUP_SLEEP * TIKA_STARTUP_MAX_RETRY seconds
         - Sets global TIKA_SERVER_PROCESS variable for later cleanup
+        - Blocks the calling thread; from async code use :func:`start_server_async`
+    """
+    process = _launch_server(tika_server_jar, java_path, java_args, server_host, port, classpath, config_path)
+    if process is None:
+        return False
+    probe_url = f"http://{server_host}:{port}/version"
+    for delay in _startup_delays():
+        if _server_exited(process, port):
+            return False
+        try:
+            if httpx.get(probe_url, timeout=TIKA_STARTUP_PROBE_TIMEOUT).status_code == HTTPStatus.OK:
+                return True
+        except httpx.TransportError:
+            pass
+        time.sleep(delay)
+    logger.error(f"Tika server did not answer {probe_url} within {TIKA_STARTUP_SLEEP * TIKA_STARTUP_MAX_RETRY}s")
+    return False
+
+
+async def start_server_async(
+    tika_server_jar: Path,
+    java_path: str = TIKA_JAVA,
+    java_args: str = TIKA_JAVA_ARGS,
+    server_host: str = SERVER_HOST,
+    port: str = PORT,
+    classpath: str | None = None,
+    config_path: str | None = None,
+) -> bool:
+    """Start the Tika Server as a subprocess without blocking the event loop.
+
+    Takes the same arguments and returns the same result as :func:`start_server`, but
+    waits for the server with :func:`wait_for_server` so other coroutines keep running.
+    """
+    process = await asyncio.to_thread(
+        _launch_server, tika_server_jar, java_path, java_args, server_host, port, classpath, config_path
+    )
+    if process is None:
+        return False
+    try:
+        await wait_for_server(f"http://{server_host}:{port}", process=process)
+    except TikaError as e:
+        logger.error(str(e))
+        return False
+    return True
+
+
+async def wait_for_server(
+    server_endpoint: str,
+    *,
+    process: Popen[bytes] | asyncio.subprocess.Process | None = None,
+    timeout: float | None = None,
+) -> None:
+    """Wait until a Tika server answers ``GET /version``, probing with exponential backoff.
+
+    Args:
+        server_endpoint: URL of the Tika server.
+        process: The server process, if known; waiting stops early if it exits.
+        timeout: Seconds to wait in total. Defaults to TIKA_STARTUP_SLEEP * TIKA_STARTUP_MAX_RETRY.
+
+    Raises:
+        TikaError: If the process exits or the server is not ready within the timeout.
+    """
+    client = get_async_client(server_endpoint)
+    probe_url = server_endpoint.rstrip("/") + "/version"
+    for delay in _startup_delays(timeout):
+        if process is not None and _server_exited(process, urlparse(server_endpoint).port):
+            msg = f"Tika server at {server_endpoint} exited with status {process.returncode} during startup"
+            raise TikaError(msg)
+        try:
+            resp = await client.get(probe_url, timeout=TIKA_STARTUP_PROBE_TIMEOUT)
+            if resp.status_code == HTTPStatus.OK:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(delay)
+    msg = f"Tika server did not answer {probe_url} within {timeout or TIKA_STARTUP_SLEEP * TIKA_STARTUP_MAX_RETRY}s"
+    raise TikaError(msg)
+
+
+def _startup_delays(timeout: float | None = None) -> Iterator[float]:
+    """Yield backoff delays (50 ms doubling up to 1 s) until timeout seconds have passed."""
+    deadline = time.monotonic() + (TIKA_STARTUP_SLEEP * TIKA_STARTUP_MAX_RETRY if timeout is None else timeout)
+    delay = 0.05
+    while time.monotonic() < deadline:
+        yield min(delay, max(deadline - time.monotonic(), 0))
+        delay = min(delay * 2, 1.0)
+
+
+def _server_exited(process: Popen[bytes] | asyncio.subprocess.Process, port: int | str | None) -> bool:
+    """Return True (and log where to look) if a server process has already exited."""
+    returncode = process.poll() if isinstance(process, Popen) else process.returncode
+    if returncode is None:
+        return False
+    logger.error(f"Tika server on port {port} exited with status {returncode}; see {TIKA_SERVER_LOG_FILE_PATH}")
+    return True
+
+
+def server_command(
+    tika_server_jar: Path,
+    java_path: str = TIKA_JAVA,
+    java_args: str = TIKA_JAVA_ARGS,
+    server_host: str = SERVER_HOST,
+    port: str | int = PORT,
+    classpath: str | None = None,
+    config_path: str | None = None,
+) -> list[str]:
+    """Build the argument list that starts a Tika server.
+
+    The arguments are passed to the process directly rather than through a shell, so
+    paths containing spaces or shell metacharacters need no quoting.
     """
     if classpath is None:
         classpath = TIKA_SERVER_CLASSPATH
-
     if IS_WINDOWS:
         server_host = "0.0.0.0"  # noqa: S104
+    classpath = os.pathsep.join(filter(None, [classpath, str(tika_server_jar)]))
+    cmd = [java_path, *shlex.split(java_args), "-cp", classpath]
+    cmd += ["org.apache.tika.server.core.TikaServerCli", "--port", str(port), "--host", server_host]
+    if config_path:
+        cmd += ["--config", str(config_path)]
+    return cmd
 
-    if classpath:
-        if IS_WINDOWS:
-            classpath += ";" + str(tika_server_jar)
-            classpath = '"' + classpath + '"'
-        else:
-            classpath += ":" + str(tika_server_jar)
-    else:
-        classpath = str(tika_server_jar)
-
-    # setup command string
-    cmd_string = ""
-    if not config_path:
-        cmd_string = f'{java_path} {java_args} -cp "{classpath}" org.apache.tika.server.core.TikaServerCli --port {port} --host {server_host} &'  # noqa: E501
-    else:
-        cmd_string = f'{java_path} {java_args} -cp "{classpath}" org.apache.tika.server.core.TikaServerCli --port {port} --host {server_host} --config {config_path} &'  # noqa: E501
 
-    # Check that we can write to log path
+def _launch_server(
+    tika_server_jar: Path,
+    java_path: str,
+    java_args: str,
+    server_host: str,
+    port: str,
+    classpath: str | None,
+    config_path: str | None,
+) -> Popen[bytes] | None:
+    """Start the server process in its own session and record it in TIKA_SERVER_PROCESS."""
     try:
         tika_log_file_path = os.path.join(TIKA_SERVER_LOG_FILE_PATH, "tika-server.log")
         log_file = open(tika_log_file_path, "w")  # noqa: SIM115
         logger.info(f"Logging to {tika_log_file_path}")
     except PermissionError:
         logger.error(f"Unable to create tika-server.log at {TIKA_SERVER_LOG_FILE_PATH} due to permission error.")
-        return False
+        return None
 
-    # Check that specified java binary is available on path
+    global TIKA_SERVER_PROCESS
+    cmd = server_command(tika_server_jar, java_path, java_args, server_host, port, classpath, config_path)
     try:
-        _ = Popen(java_path, stdout=open(os.devnull, "w"), stderr=open(os.devnull, "w"))  # noqa: S603, SIM115
+        with log_file:
+            TIKA_SERVER_PROCESS = Popen(cmd, stdout=log_file, stderr=STDOUT, start_new_session=True)  # noqa: S603
     except FileNotFoundError:
         logger.error("Unable to run java; is it installed?")
-        return False
-
-    # Run java with jar args
-    global TIKA_SERVER_PROCESS
-    # Patch for Windows support
-    if IS_WINDOWS:
-        if sys.version.startswith("2"):
-            # Python 2.x
-            TIKA_SERVER_PROCESS = Popen(cmd_string, stdout=log_file, stderr=STDOUT, shell=True)  # noqa: S602
-        elif sys.version.startswith("3"):
-            # Python 3.x
-            TIKA_SERVER_PROCESS = Popen(cmd_string, stdout=log_file, stderr=STDOUT, shell=True, start_new_session=True)  # noqa: S602
-    else:
-        TIKA_SERVER_PROCESS = Popen(cmd_string, stdout=log_file, stderr=STDOUT, shell=True, preexec_fn=os.setsid)  # noqa: S602
-
-    # Check logs and retry as configured
-    try_count = 0
-    is_started = False
-    while try_count < TIKA_STARTUP_MAX_RETRY:
-        with open(tika_log_file_path) as tika_log_file_tmp:
-            # check for INFO string to confirm listening endpoint
-            if "Started Apache Tika server" in tika_log_file_tmp.read():
-                is_started = True
-                break
-            logger.warning("Failed to see startup log message; retrying...")
-        time.sleep(TIKA_STARTUP_SLEEP)
-        try_count += 1
-
-    if not is_started:
-        logger.error("Tika startup log message not received after %d tries." % (TIKA_STARTUP_MAX_RETRY))  # noqa: UP031
-        return False
-    return True
+        return None
+    return TIKA_SERVER_PROCESS
 
 
 def kill_server(
@@ -1128,6 +2631,196 @@ def kill_server(
         time.sleep(1)
 
 
+# endpoints of running TikaServerFarm members; their lifecycle is managed by the farm, not check_tika_server
+_farm_endpoints: set[str] = set()
+
+
+class TikaServerFarm(TikaPool):
+    """Start, supervise and load balance several local Tika servers on consecutive ports.
+
+    The farm is a :class:`TikaPool` over its own servers, so it can be passed anywhere a
+    ``server_endpoint`` is accepted. Each server is a separate JVM listening on
+    ``base_port + i`` and logging to ``TIKA_SERVER_LOG_FILE_PATH/tika-server-<port>.log``.
+    While the farm is running, a supervisor task probes each server's ``/version`` and
+    restarts servers that exit or stop answering, each independently of the others; a
+    server is ejected from the pool until its replacement accepts connections again.
+
+    Args:
+        size: Number of servers to run.
+        server_host: Host the servers listen on. Defaults to SERVER_HOST.
+        base_port: Port of the first server. Defaults to PORT.
+        tika_server_jar: Path to the Tika server JAR. Defaults to TIKA_SERVER_JAR.
+        java_path: Path to Java executable. Defaults to TIKA_JAVA.
+        java_args: Additional Java arguments. Defaults to TIKA_JAVA_ARGS.
+        classpath: Additional classpath entries. Defaults to TIKA_SERVER_CLASSPATH.
+        config_path: Path to Tika configuration file. Defaults to None.
+        strategy: How requests are spread over the servers; see :class:`TikaPool`.
+        startup_timeout: Seconds to wait for a server to accept connections. Defaults to 60.
+        health_interval: Seconds between health checks of each server. Defaults to 5.
+        health_timeout: Seconds a running server may take to answer ``/version`` before it
+            is considered hung and restarted. Defaults to 30.
+        shutdown_timeout: Seconds to wait for a server to exit before killing it. Defaults to 10.
+
+    Example:
+        >>> async with TikaServerFarm(4) as farm:
+        ...     parsed = await parser.from_file("doc.pdf", server_endpoint=farm)
+    """
+
+    def __init__(
+        self,
+        size: int,
+        *,
+        server_host: str = SERVER_HOST,
+        base_port: int = int(PORT),
+        tika_server_jar: Path = TIKA_SERVER_JAR,
+        java_path: str = TIKA_JAVA,
+        java_args: str = TIKA_JAVA_ARGS,
+        classpath: str | None = None,
+        config_path: str | None = None,
+        strategy: Literal["least_outstanding", "round_robin"] = "least_outstanding",
+        startup_timeout: float = 60.0,
+        health_interval: float = 5.0,
+        health_timeout: float = 30.0,
+        shutdown_timeout: float = 10.0,
+    ) -> None:
+        if size < 1:
+            msg = f"TikaServerFarm size must be at least 1, got {size}"
+            raise TikaError(msg)
+        self.server_host = server_host
+        self.ports = [base_port + i for i in range(size)]
+        super().__init__([f"http://{server_host}:{port}" for port in self.ports], strategy=strategy)
+        self.tika_server_jar = tika_server_jar
+        self.java_path = java_path
+        self.java_args = java_args
+        self.classpath = TIKA_SERVER_CLASSPATH if classpath is None else classpath
+        self.config_path = config_path
+        self.startup_timeout = startup_timeout
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self.shutdown_timeout = shutdown_timeout
+        self.processes: dict[int, asyncio.subprocess.Process] = {}
+        self._supervisor: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> Self:
+        return await self.start()
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.stop()
+
+    async def start(self) -> Self:
+        """Start every server, wait until all accept connections and begin supervising them.
+
+        Raises:
+            TikaError: If a server exits or does not accept connections within startup_timeout.
+                Servers that did start are stopped again.
+        """
+        _farm_endpoints.update(member.url for member in self.members)
+        try:
+            await asyncio.gather(
+                *(self._launch(member, port) for member, port in zip(self.members, self.ports, strict=True))
+            )
+        except BaseException:
+            await self.stop()
+            raise
+        self._supervisor = asyncio.create_task(self._supervise())
+        return self
+
+    async def stop(self) -> None:
+        """Stop supervising and shut every server down, killing those that do not exit in time."""
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._supervisor
+            self._supervisor = None
+        await asyncio.gather(*(self._terminate(port) for port in list(self.processes)))
+        _farm_endpoints.difference_update(member.url for member in self.members)
+
+    def command(self, port: int) -> list[str]:
+        """Return the argument list used to start the server on the given port."""
+        return server_command(
+            self.tika_server_jar,
+            self.java_path,
+            self.java_args,
+            self.server_host,
+            port,
+            self.classpath,
+            self.config_path,
+        )
+
+    async def _launch(self, member: _PoolMember, port: int) -> None:
+        """Start the server on port and put its pool member back in rotation once it is up."""
+        log_path = Path(TIKA_SERVER_LOG_FILE_PATH, f"tika-server-{port}.log")
+        log_file = await asyncio.to_thread(open, log_path, "wb")
+        with log_file:
+            process = await asyncio.create_subprocess_exec(
+                *self.command(port), stdout=log_file, stderr=STDOUT, start_new_session=True
+            )
+        self.processes[port] = process
+        logger.info(f"Started Tika server process {process.pid} on port {port}, logging to {log_path}")
+        await wait_for_server(member.url, process=process, timeout=self.startup_timeout)
+        member.failures = 0
+        member.ejected_until = 0.0
+
+    async def _supervise(self) -> None:
+        """Watch every server concurrently, so a slow restart does not delay the others."""
+        await asyncio.gather(
+            *(self._watch(member, port) for member, port in zip(self.members, self.ports, strict=True))
+        )
+
+    async def _watch(self, member: _PoolMember, port: int) -> None:
+        """Restart the server on port whenever it exits or stops answering, keeping it ejected until it is back."""
+        while True:
+            await asyncio.sleep(self.health_interval)
+            process = self.processes.get(port)
+            if process is None or process.returncode is not None:
+                returncode = None if process is None else process.returncode
+                logger.warning(f"Tika server on port {port} exited with status {returncode}; restarting")
+            else:
+                try:
+                    await wait_for_server(member.url, process=process, timeout=self.health_timeout)
+                    continue
+                except TikaError as e:
+                    logger.warning(f"Tika server on port {port} failed its health check ({e}); restarting")
+            member.ejected_until = float("inf")
+            try:
+                if process is not None and process.returncode is None:
+                    await self._terminate(port)
+                await self._launch(member, port)
+            except Exception:  # e.g. OSError spawning java; retry on the next check
+                msg = f"Failed to restart Tika server on port {port}"
+                logger.exception(msg)
+
+    async def _terminate(self, port: int) -> None:
+        """Stop the server on port, killing its process group if it does not exit in time."""
+        process = self.processes.pop(port)
+        if process.returncode is not None:
+            return
+        try:
+            if IS_WINDOWS:
+                process.terminate()
+            else:
+                os.killpg(process.pid, signal.SIGTERM)
+            await asyncio.wait_for(process.wait(), self.shutdown_timeout)
+        except TimeoutError:
+            logger.warning(f"Tika server on port {port} did not exit in {self.shutdown_timeout}s; killing it")
+            process.kill()
+            await process.wait()
+        except (ProcessLookupError, OSError) as e:
+            logger.error(f"Failed to stop Tika server on port {port}: {e}")
+
+
+async def _port_accepts(host: str, port: int, timeout: float = 1.0) -> bool:
+    """Return True if a TCP connection to host:port can be opened."""
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except (OSError, TimeoutError):
+        return False
+    writer.close()
+    with suppress(OSError):
+        await writer.wait_closed()
+    return True
+
+
 def to_filename(url: str) -> str:
     """
     Gets url and returns filename
@@ -1140,6 +2833,26 @@ def to_filename(url: str) -> str:
     return re.sub(r"[-\s]+", "-", value).strip("-")[-200:]
 
 
+# Content-Disposition of anonymous streams, whose timestamped name must not split the cache
+_GENERATED_FILENAME = re.compile(r"filename=\"?file_\d+\"?$")
+
+
+def content_disposition(source: str | Path | BinaryIO | bytes | bytearray | memoryview) -> dict[str, str]:
+    """Build the Content-Disposition header for a source.
+
+    Args:
+        source: A path, or a file-like object whose ``name`` attribute is a path.
+
+    Returns:
+        dict[str, str]: The header. Anonymous streams and buffers get a generated
+        ``file_<timestamp>`` name, as their temporary copies used to.
+    """
+    name = source if isinstance(source, str | Path) else getattr(source, "name", None)
+    if not name or not isinstance(name, str | Path):
+        name = f"file_{int(time.time())}"
+    return {"Content-Disposition": make_content_disposition_header(name)}
+
+
 def get_file_handle(url_or_path: str | Path | BinaryIO) -> BinaryIO:
     """
     Opens a remote file and returns a file-like object.
@@ -1152,42 +2865,39 @@ def get_file_handle(url_or_path: str | Path | BinaryIO) -> BinaryIO:
     """
     if isinstance(url_or_path, Path):
         return open(url_or_path, "rb")
-    if isinstance(url_or_path, BinaryIO):
-        return url_or_path
+    if hasattr(url_or_path, "read"):
+        return url_or_path  # type: ignore
     return open(url_or_path, "rb")
 
 
 def get_remote_file(
-    url_or_path: str | Path | BinaryIO,
+    url_or_path: str | Path | BinaryIO | bytes | bytearray | memoryview,
     dest_path: str | Path,
-) -> tuple[Path, Literal["local", "remote", "binary"]]:
+) -> tuple[Path | BinaryIO | bytes | bytearray | memoryview, Literal["local", "remote", "binary"]]:
     """Fetch a remote file or handle a local file/binary stream.
 
     Args:
-        url_or_path: Resource to fetch - can be a URL, local path, or file-like object.
+        url_or_path: Resource to fetch - can be a URL, local path, file-like object or
+            in-memory buffer.
         dest_path: Local path where to save the file if it needs to be downloaded.
 
     Returns:
-        tuple[Path, Literal["local", "remote", "binary"]]: Tuple containing:
-            - Path object pointing to the local file
+        tuple: Tuple containing:
+            - Path object pointing to the local file, or the stream/buffer itself
             - String indicating the source type: "local" for local files,
-              "remote" for downloaded files, "binary" for binary streams
+              "remote" for downloaded files, "binary" for binary streams and buffers
 
     Raises:
         TikaError: If a local file does not exist.
         OSError: If there are issues downloading a remote file.
 
     Note:
-        For binary stream inputs, a temporary file is created with a timestamp-based name.
+        Binary streams and buffers are returned unchanged so that they can be sent to the
+        server directly; no temporary copy is written to disk.
     """
-    # handle binary stream input
+    # binary streams and in-memory buffers go straight into the request body
     if not isinstance(url_or_path, Path | str):
-        name = f"file_{int(time.time())}" if not hasattr(url_or_path, "name") else url_or_path.name
-        filename = to_filename(name)
-        dest_path = Path(dest_path) / filename
-        with open(dest_path, "wb") as f:
-            f.write(url_or_path.read())
-        return (dest_path, "binary")
+        return (url_or_path, "binary")
 
     if isinstance(url_or_path, Path):
         return (url_or_path, "local")
@@ -1218,6 +2928,131 @@ def get_remote_file(
     return (dest_path, "remote")
 
 
+@asynccontextmanager
+async def open_source(
+    url_or_path: str | Path | BinaryIO | bytes | bytearray | memoryview,
+    *,
+    max_bytes: int = TIKA_REMOTE_MAX_BYTES,
+    timeout: float = TIKA_REMOTE_TIMEOUT,
+) -> AsyncIterator[tuple[Path | BinaryIO | bytes | bytearray | memoryview | AsyncIterator[bytes], dict[str, str]]]:
+    """Open any supported input as a request body for the Tika server.
+
+    HTTP(S) URLs are downloaded with :func:`fetch_remote` and piped into the upload as
+    they arrive, without touching the disk. Other URL schemes fall back to
+    :func:`get_remote_file` in a worker thread, and the downloaded copy is removed on exit.
+
+    Args:
+        url_or_path: A URL, local path, file-like object or in-memory buffer.
+        max_bytes: Maximum size of an HTTP(S) download; 0 disables the limit.
+            Defaults to TIKA_REMOTE_MAX_BYTES.
+        timeout: Connect/read timeout in seconds for HTTP(S) downloads.
+            Defaults to TIKA_REMOTE_TIMEOUT.
+
+    Yields:
+        tuple: The body to pass to :func:`call_server` and the headers that describe it
+        (Content-Disposition and, when known up front, Content-Length).
+
+    Raises:
+        TikaError: If a local file does not exist or a download fails or is too large.
+    """
+    if isinstance(url_or_path, str) and urlparse(url_or_path).scheme in ("http", "https"):
+        async with fetch_remote(url_or_path, max_bytes=max_bytes, timeout=timeout) as (body, length):
+            headers = {"Content-Disposition": make_content_disposition_header(to_filename(url_or_path))}
+            if length is not None:
+                headers["Content-Length"] = str(length)
+            yield (body, headers)
+        return
+
+    if isinstance(url_or_path, str) and urlparse(url_or_path).scheme:
+        source, file_type = await asyncio.to_thread(get_remote_file, url_or_path, TIKA_FILES_PATH)
+    else:
+        source, file_type = get_remote_file(url_or_path, TIKA_FILES_PATH)
+    try:
+        yield (source, content_disposition(source))
+    finally:
+        if file_type == "remote" and isinstance(source, Path):
+            source.unlink(missing_ok=True)
+
+
+@asynccontextmanager
+async def fetch_remote(
+    url: str,
+    *,
+    max_bytes: int = TIKA_REMOTE_MAX_BYTES,
+    timeout: float = TIKA_REMOTE_TIMEOUT,
+) -> AsyncIterator[tuple[AsyncIterator[bytes], int | None]]:
+    """Stream a remote document over HTTP(S) using the shared async client.
+
+    At most TIKA_REMOTE_CONCURRENCY downloads run at once per event loop; further
+    callers wait for a free slot.
+
+    Args:
+        url: The HTTP(S) URL to download.
+        max_bytes: Maximum number of bytes to accept; 0 disables the limit.
+            Defaults to TIKA_REMOTE_MAX_BYTES.
+        timeout: Connect/read timeout in seconds. Defaults to TIKA_REMOTE_TIMEOUT.
+
+    Yields:
+        tuple: An async iterator over the (decoded) body and its length, if the server
+        announced one.
+
+    Raises:
+        TikaError: If the download fails, returns a non-200 status or exceeds max_bytes.
+    """
+    client = get_async_client()
+    logger.info("Streaming %s.", url)
+    async with _remote_semaphore():
+        try:
+            async with client.stream("GET", url, timeout=timeout, follow_redirects=True) as resp:
+                if resp.status_code != HTTPStatus.OK:
+                    msg = f"Unexpected response while retrieving {url} ({resp.status_code})"
+                    raise TikaError(msg)
+
+                length: int | None = None
+                if "Content-Length" in resp.headers and "Content-Encoding" not in resp.headers:
+                    length = int(resp.headers["Content-Length"])
+                if max_bytes and length is not None and length > max_bytes:
+                    msg = f"Remote file {url} is {length} bytes, which exceeds the {max_bytes} byte limit"
+                    raise TikaError(msg)
+
+                yield (_iter_capped(resp.aiter_bytes(), url, max_bytes), length)
+        except httpx.TransportError as e:
+            msg = f"Error retrieving {url}: {e}"
+            logger.error(msg)
+            raise TikaError(msg) from e
+
+
+async def _iter_capped(chunks: AsyncIterator[bytes], url: str, max_bytes: int) -> AsyncIterator[bytes]:
+    """Pass download chunks through, raising once more than max_bytes have been seen."""
+    received = 0
+    try:
+        async for chunk in chunks:
+            received += len(chunk)
+            if max_bytes and received > max_bytes:
+                msg = f"Remote file {url} exceeds the {max_bytes} byte limit"
+                raise TikaError(msg)
+            yield chunk
+    except httpx.TransportError as e:
+        # report download failures as such, rather than as a failed upload to Tika
+        msg = f"Error retrieving {url}: {e}"
+        logger.error(msg)
+        raise TikaError(msg) from e
+
+
+_remote_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _remote_semaphore() -> asyncio.Semaphore:
+    """Return the download semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _remote_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _remote_semaphores[loop] = asyncio.Semaphore(TIKA_REMOTE_CONCURRENCY)
+    return semaphore
+
+
 def check_port_is_open(
     remote_server_host: str = SERVER_HOST,
     port: str = PORT,
@@ -15,18 +15,126 @@
 # limitations under the License.
 #
 
+import asyncio
+import re
+from collections.abc import Callable
 from http import HTTPStatus
 from pathlib import Path
 from typing import Any, BinaryIO
 
-from tika.core import SERVER_ENDPOINT, TikaError, call_server, detect_type_1
+from tika.core import (
+    SERVER_ENDPOINT,
+    TIKA_DETECT_PREFIX_BYTES,
+    TikaError,
+    TikaPool,
+    call_server,
+    detect_type_1,
+)
+
+SNIFF_PREFIX_SIZE = 4096
+"""Number of leading bytes read for local detection"""
+
+# Signatures that identify a type on their own, as (offset, bytes) parts that must all match.
+# Containers with many subtypes (ZIP, OLE2, RIFF, ISO base media) and text formats are left
+# to the server, except where the subtype is spelled out in the prefix.
+_MAGIC: tuple[tuple[tuple[tuple[int, bytes], ...], str], ...] = (
+    (((0, b"%PDF-"),), "application/pdf"),
+    (((0, b"\x89PNG\r\n\x1a\n"),), "image/png"),
+    (((0, b"\xff\xd8\xff"),), "image/jpeg"),
+    (((0, b"GIF87a"),), "image/gif"),
+    (((0, b"GIF89a"),), "image/gif"),
+    (((0, b"II*\x00"),), "image/tiff"),
+    (((0, b"MM\x00*"),), "image/tiff"),
+    (((0, b"RIFF"), (8, b"WEBP")), "image/webp"),
+    (((0, b"RIFF"), (8, b"WAVE")), "audio/vnd.wave"),
+    (((0, b"fLaC"),), "audio/x-flac"),
+    (((0, b"\x1f\x8b"),), "application/gzip"),
+    (((0, b"BZh"),), "application/x-bzip2"),
+    (((0, b"\xfd7zXZ\x00"),), "application/x-xz"),
+    (((0, b"7z\xbc\xaf\x27\x1c"),), "application/x-7z-compressed"),
+    (((0, b"Rar!\x1a\x07"),), "application/x-rar-compressed"),
+    (((0, b"{\\rtf"),), "application/rtf"),
+    (((0, b"%!PS"),), "application/postscript"),
+    (((257, b"ustar\x00"),), "application/x-tar"),
+    (((257, b"ustar  \x00"),), "application/x-gtar"),
+)
+
+# ODF and EPUB packages store their type uncompressed as the first ZIP entry, "mimetype".
+_ZIP_MIMETYPE = re.compile(rb"PK\x03\x04.{26}mimetype([a-z]+/[a-z0-9.+-]+)", re.DOTALL)
+
+
+def sniff(prefix: bytes | bytearray | memoryview) -> str | None:
+    """Identifies a MIME type from the leading bytes of a document, without the server.
+
+    Args:
+        prefix: The first bytes of the document; SNIFF_PREFIX_SIZE bytes are enough.
+
+    Returns:
+        The MIME type, or None when the prefix matches no signature or one shared by
+        several types (e.g. a ZIP that could be DOCX, XLSX or JAR) and only the server
+        can tell.
+
+    Example:
+        >>> sniff(b"%PDF-1.7\\n...")
+        'application/pdf'
+    """
+    prefix = bytes(prefix[:SNIFF_PREFIX_SIZE])
+    for parts, mime_type in _MAGIC:
+        if all(prefix.startswith(magic, offset) for offset, magic in parts):
+            return mime_type
+    match = _ZIP_MIMETYPE.match(prefix)
+    return match.group(1).decode("ascii") if match else None
+
+
+def _read_prefix(obj: object, size: int) -> bytes | None:
+    """Read the first size bytes of a buffer or seekable stream, leaving streams where they were.
+
+    Text is encoded as UTF-8, the way it is uploaded. Returns None for inputs that
+    cannot be peeked at (non-seekable streams).
+    """
+    if isinstance(obj, str):
+        return obj[:size].encode("utf8")[:size]
+    if isinstance(obj, bytes | bytearray | memoryview):
+        return bytes(obj[:size])
+    if hasattr(obj, "seekable") and obj.seekable():  # type: ignore
+        position = obj.tell()  # type: ignore
+        try:
+            prefix = obj.read(size)  # type: ignore
+        finally:
+            obj.seek(position)  # type: ignore
+        return prefix if isinstance(prefix, bytes) else None
+    return None
+
+
+def _read_file_prefix(file_obj: str | Path | BinaryIO, size: int) -> bytes | None:
+    """Read the first size bytes of a local file or seekable stream.
+
+    Returns None for inputs that cannot be peeked at (URLs, missing files, non-seekable streams).
+    """
+    if isinstance(file_obj, str | Path):
+        path = Path(file_obj)
+        if not path.is_file():
+            return None
+        with path.open("rb") as stream:
+            return stream.read(size)
+    return _read_prefix(file_obj, size)
+
+
+async def _sniff(read: Callable[[Any, int], bytes | None], obj: object, prefix_size: int) -> str | None:
+    """Detect the type of obj locally from the prefix read returns, or None if the server has to decide."""
+    prefix = await asyncio.to_thread(read, obj, prefix_size)
+    return None if prefix is None else sniff(prefix)
 
 
 async def from_file(
     file_obj: str | Path | BinaryIO,
     *,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
     config_path: str | None = None,
     request_options: dict[str, Any] | None = None,
+    local: bool = False,
+    prefix_size: int = SNIFF_PREFIX_SIZE,
+    prefix_bytes: int = TIKA_DETECT_PREFIX_BYTES,
 ) -> str | bytes | BinaryIO:
     """Detects the MIME type of a file using Apache Tika server.
 
@@ -38,9 +146,16 @@ async def from_file(
             - str: A file path or URL
             - Path: A pathlib.Path object pointing to the file
             - BinaryIO: A file-like object in binary read mode
+        server_endpoint: The URL of the Tika server, or a TikaPool. Defaults to SERVER_ENDPOINT.
         config_path: Optional path to a custom Tika configuration file.
         request_options: Optional dictionary of request options to pass to the server.
             Can include parameters like timeout, headers, etc.
+        local: If True, first match the leading bytes against a built-in magic table
+            (see :func:`sniff`) and only upload to the server when that is inconclusive.
+        prefix_size: Number of leading bytes read for local detection.
+        prefix_bytes: If set, upload only this many leading bytes (and the file name) to
+            the server, and the whole file only for container formats such as ZIP and
+            OLE2. Defaults to TIKA_DETECT_PREFIX_BYTES.
 
     Returns:
         The detected MIME type (e.g., 'application/pdf', 'image/jpeg').
@@ -58,11 +173,15 @@ async def from_file(
         >>> mime_type = from_file("image.jpg")
         >>> print(mime_type)  # Prints 'image/jpeg'
     """
+    if local and (mime_type := await _sniff(_read_file_prefix, file_obj, prefix_size)) is not None:
+        return mime_type
     status, response = await detect_type_1(
         option="type",
         url_or_path=file_obj,
+        server_endpoint=server_endpoint,
         config_path=config_path,
         request_options=request_options,
+        prefix_bytes=prefix_bytes,
     )
     if status != HTTPStatus.OK:
         msg = f"Unexpected response from Tika server ({status}): {response}"
@@ -73,8 +192,11 @@ async def from_file(
 async def from_buffer(
     buf: str | bytes | BinaryIO,
     *,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
     config_path: str | None = None,
     request_options: dict[str, Any] | None = None,
+    local: bool = False,
+    prefix_size: int = SNIFF_PREFIX_SIZE,
 ) -> str | bytes | BinaryIO:
     """Detects the MIME type of content provided in a buffer using Apache Tika server.
 
@@ -87,9 +209,13 @@ async def from_buffer(
             - str: Text content
             - bytes: Binary content
             - BinaryIO: File-like object containing binary content
+        server_endpoint: The URL of the Tika server, or a TikaPool. Defaults to SERVER_ENDPOINT.
         config_path: Optional path to a custom Tika configuration file.
         request_options: Optional dictionary of request options to pass to the server.
             Can include parameters like timeout, headers, etc.
+        local: If True, first match the leading bytes against a built-in magic table
+            (see :func:`sniff`) and only upload to the server when that is inconclusive.
+        prefix_size: Number of leading bytes read for local detection.
 
     Returns:
         The detected MIME type (e.g., 'application/pdf', 'text/plain').
@@ -109,9 +235,11 @@ async def from_buffer(
         >>> mime_type = from_buffer(text_content)
         >>> print(mime_type)  # Prints 'text/plain'
     """
+    if local and (mime_type := await _sniff(_read_prefix, buf, prefix_size)) is not None:
+        return mime_type
     status, response = await call_server(
         verb="put",
-        server_endpoint=SERVER_ENDPOINT,
+        server_endpoint=server_endpoint,
         service="/detect/stream",
         data=buf,
         headers={"Accept": "text/plain"},
@@ -15,22 +15,76 @@
 # limitations under the License.
 #
 
+import asyncio
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import AsyncIterable, Callable, Iterable
+from contextlib import aclosing
 from http import HTTPStatus
 from pathlib import Path
 from typing import Any, BinaryIO
 
-from tika.core import SERVER_ENDPOINT, TikaError, call_server, detect_lang_1
+from tika.core import (
+    SERVER_ENDPOINT,
+    TIKA_MAX_IN_FLIGHT,
+    TikaError,
+    TikaPool,
+    call_server,
+    detect_lang_1,
+    gather_bounded,
+)
+from tika.parser import stream_file
+
+# Without extracted text, several samples are spread over this many times the characters
+# they cover at the start of the document, so they do not all land on its opening page.
+_SAMPLE_SPREAD = 10
+
+# Code point ranges of scripts written by a single language that Tika can detect, as
+# sorted (first, last, language). Han is shared by Chinese, Japanese and Korean, so it is
+# only accepted alongside kana or Hangul. Hebrew is left out as Tika also reports Yiddish
+# for it, and Georgian as Tika cannot detect it.
+_SCRIPT_RANGES = (
+    (0x0370, 0x03FF, "el"),
+    (0x0A80, 0x0AFF, "gu"),
+    (0x0B80, 0x0BFF, "ta"),
+    (0x0C00, 0x0C7F, "te"),
+    (0x0C80, 0x0CFF, "kn"),
+    (0x0D00, 0x0D7F, "ml"),
+    (0x0E00, 0x0E7F, "th"),
+    (0x1100, 0x11FF, "ko"),
+    (0x1F00, 0x1FFF, "el"),
+    (0x3040, 0x30FF, "ja"),
+    (0x3130, 0x318F, "ko"),
+    (0x3400, 0x4DBF, None),
+    (0x4E00, 0x9FFF, None),
+    (0xAC00, 0xD7AF, "ko"),
+)
+_SCRIPT_STARTS = [first for first, _, _ in _SCRIPT_RANGES]
 
 
 async def from_file(
     file_obj: str | Path | BinaryIO,
     request_options: dict[str, Any] | None = None,
+    *,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
+    sample_chars: int = 0,
+    samples: int = 1,
+    text: str | None = None,
 ) -> str | bytes | BinaryIO:
     """Detects the language of a file using Apache Tika server.
 
     Uses Tika's language detection capabilities to identify the primary language
     of text content within a file.
 
+    By default the whole file is uploaded to ``/language/stream``. With ``sample_chars``
+    set, only text samples of that many characters are sent to ``/language/string``
+    instead: taken from ``text`` if the content was already extracted, otherwise from the
+    start of a ``/tika`` text stream that is closed as soon as enough text has arrived.
+    With several ``samples``, each is detected separately and the most frequent language
+    wins. Samples are spread evenly over ``text``, or else over the first
+    ``sample_chars * samples * 10`` characters of the document, so that title pages and
+    headers do not decide the vote.
+
     Args:
         file_obj: The file to analyze. Can be:
             - str: A string path to the file
@@ -38,10 +92,17 @@ async def from_file(
             - BinaryIO: A file-like object in binary read mode
         request_options: Optional dictionary of request options to pass to the server.
             Can include parameters like timeout, headers, etc.
+        server_endpoint: The URL of the Tika server, or a TikaPool. Defaults to SERVER_ENDPOINT.
+        sample_chars: Number of characters per text sample; 0 uploads the whole file.
+            Defaults to 0.
+        samples: Number of samples to vote on. Defaults to 1.
+        text: Text already extracted from the file, to sample instead of asking Tika
+            for it. Samples are spread evenly over all of it.
 
     Returns:
         The detected language code (e.g., 'en' for English, 'fr' for French).
         Return type matches the server response, which may be str, bytes, or BinaryIO.
+        When sampling, an empty string if the file has no text.
 
     Raises:
         TikaError: If the server returns an unsuccessful status code or if language
@@ -53,7 +114,17 @@ async def from_file(
         >>> language = from_file(Path("document.txt"))
         >>> print(language)  # Prints 'en' for English text
     """
-    status, response = await detect_lang_1(option="file", url_or_path=file_obj, request_options=request_options)
+    if sample_chars > 0:
+        if text is None:
+            span = sample_chars * samples * (_SAMPLE_SPREAD if samples > 1 else 1)
+            text = await _extract_prefix(file_obj, span, server_endpoint, request_options)
+        sampled = _samples(text, sample_chars, samples)
+        if not sampled:  # nothing to detect; don't send blank strings to the server
+            return ""
+        return await _vote(sampled, server_endpoint, request_options)
+    status, response = await detect_lang_1(
+        option="file", url_or_path=file_obj, server_endpoint=server_endpoint, request_options=request_options
+    )
     if status != HTTPStatus.OK:
         msg = f"Unexpected response from Tika server ({status}): {response}"
         raise TikaError(msg)
@@ -63,6 +134,8 @@ async def from_file(
 async def from_buffer(
     buf: str | bytes | BinaryIO,
     request_options: dict[str, Any] | None = None,
+    *,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
 ) -> str | bytes | BinaryIO:
     """Detects the language of content provided in a buffer using Apache Tika server.
 
@@ -76,6 +149,7 @@ async def from_buffer(
             - BinaryIO: File-like object containing content
         request_options: Optional dictionary of request options to pass to the server.
             Can include parameters like timeout, headers, etc.
+        server_endpoint: The URL of the Tika server, or a TikaPool. Defaults to SERVER_ENDPOINT.
 
     Returns:
         The detected language code (e.g., 'en' for English, 'fr' for French).
@@ -93,7 +167,7 @@ async def from_buffer(
     """
     status, response = await call_server(
         verb="put",
-        server_endpoint=SERVER_ENDPOINT,
+        server_endpoint=server_endpoint,
         service="/language/string",
         data=buf,
         headers={"Accept": "text/plain"},
@@ -104,3 +178,118 @@ async def from_buffer(
         msg = f"Unexpected response from Tika server ({status}): {response}"
         raise TikaError(msg)
     return response
+
+
+async def _extract_prefix(
+    file_obj: str | Path | BinaryIO,
+    size: int,
+    server_endpoint: str | TikaPool,
+    request_options: dict[str, Any] | None,
+) -> str:
+    """Return the first size characters of a file's text, stopping the extraction there."""
+    chunks: list[str] = []
+    length = 0
+    async with aclosing(
+        stream_file(file_obj, server_endpoint=server_endpoint, service="text", request_options=request_options)
+    ) as stream:
+        async for chunk in stream:
+            chunks.append(chunk)  # type: ignore
+            length += len(chunk)  # type: ignore
+            if length >= size:
+                break
+    return "".join(chunks)[:size]
+
+
+def _samples(text: str, sample_chars: int, samples: int) -> list[str]:
+    """Cut up to samples non-blank windows of sample_chars characters, spread evenly over text."""
+    if len(text) <= sample_chars * samples:
+        windows = [text[start : start + sample_chars] for start in range(0, len(text), sample_chars)]
+    else:
+        stride = (len(text) - sample_chars) // max(samples - 1, 1)
+        windows = [text[i * stride : i * stride + sample_chars] for i in range(samples)]
+    return [window for window in windows if window.strip()]
+
+
+async def _vote(
+    samples: list[str],
+    server_endpoint: str | TikaPool,
+    request_options: dict[str, Any] | None,
+) -> str | bytes | BinaryIO:
+    """Detect the language of each sample and return the most frequent one, earliest first on ties."""
+    results = await asyncio.gather(
+        *(from_buffer(sample, request_options, server_endpoint=server_endpoint) for sample in samples)
+    )
+    votes = Counter(result.strip() if isinstance(result, str) else result for result in results)
+    return votes.most_common(1)[0][0]
+
+
+async def from_buffers(
+    bufs: Iterable[str] | AsyncIterable[str],
+    request_options: dict[str, Any] | None = None,
+    *,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
+    max_in_flight: int = TIKA_MAX_IN_FLIGHT,
+    prefilter: Callable[[str], str | None] | None = None,
+) -> list[str | bytes | BinaryIO]:
+    """Detects the language of many strings, keeping up to ``max_in_flight`` requests running.
+
+    Strings are pulled lazily and sent over the Tika server's kept-alive connections as
+    earlier ones complete, so millions of short records never cost more than
+    ``max_in_flight`` requests at a time.
+
+    Args:
+        bufs: The strings to analyze, as a (possibly lazy) iterable or async iterable.
+        request_options: Optional dictionary of request options to pass to the server.
+        server_endpoint: The URL of the Tika server, or a TikaPool. Defaults to SERVER_ENDPOINT.
+        max_in_flight: Maximum number of concurrent requests. Defaults to TIKA_MAX_IN_FLIGHT.
+        prefilter: Called with each string before it is sent; a returned language code is
+            used as the answer without asking the server. :func:`script_language` answers
+            strings written in a script used by a single language.
+
+    Returns:
+        The detected language codes, in input order.
+
+    Raises:
+        TikaError: If the server returns an unsuccessful status code for any string.
+
+    Example:
+        >>> await from_buffers(["Bonjour le monde", "こんにちは"], prefilter=script_language)
+        ['fr', 'ja']
+    """
+
+    async def detect_one(buf: str) -> str | bytes | BinaryIO:
+        if prefilter is not None and (language := prefilter(buf)) is not None:
+            return language
+        return await from_buffer(buf, request_options, server_endpoint=server_endpoint)
+
+    return await gather_bounded(detect_one, bufs, max_in_flight=max_in_flight)  # type: ignore
+
+
+def script_language(text: str) -> str | None:
+    """Identifies the language of text written in a script that only one language uses.
+
+    Args:
+        text: The text to classify.
+
+    Returns:
+        The language code if every letter is in one such script (e.g. Greek, Tamil, Thai,
+        Hangul, or kana possibly mixed with Han characters), otherwise None.
+
+    Example:
+        >>> script_language("Καλημέρα"), script_language("Good morning")
+        ('el', None)
+    """
+    found = None
+    for char in text:
+        if not char.isalpha():
+            continue
+        code = ord(char)
+        index = bisect_right(_SCRIPT_STARTS, code) - 1
+        if index < 0 or code > _SCRIPT_RANGES[index][1]:
+            return None
+        language = _SCRIPT_RANGES[index][2]
+        if language is not None:
+            if found not in (None, language):
+                return None
+            found = language
+    return found
@@ -14,24 +14,46 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import codecs
+import mimetypes
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Callable
 from http import HTTPStatus
 from pathlib import Path
-from typing import Any, BinaryIO, cast
+from typing import Any, BinaryIO, Literal, cast
 
 import orjson
 
-from tika.core import SERVER_ENDPOINT, TikaError, TikaResponse, call_server, parse_1
+from tika.core import (
+    SERVER_ENDPOINT,
+    TikaAnalysis,
+    TikaDocument,
+    TikaError,
+    TikaPool,
+    TikaResponse,
+    call_server,
+    call_server_stream,
+    parse_1,
+    stream_parse_1,
+)
+
+MergeStrategy = Literal["merge", "first-wins", "container-only", "list-all"]
+"""How the metadata of the documents in an /rmeta response is combined; see :func:`from_file`"""
+
+_CONTENT_KEY = "X-TIKA:content"
+_PATH_KEY = "X-TIKA:embedded_resource_path"
 
 
 async def from_file(
     obj: str | Path | BinaryIO,
     *,
-    server_endpoint: str = SERVER_ENDPOINT,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
     service: str = "all",
     xml_content: bool = False,
     headers: dict[str, Any] | None = None,
     config_path: str | None = None,
     request_options: dict[str, Any] | None = None,
+    merge: MergeStrategy = "merge",
 ) -> TikaResponse:
     """Parses a file using Apache Tika server and returns structured content and metadata.
 
@@ -43,7 +65,7 @@ async def from_file(
             - str: A file path or URL
             - Path: A pathlib.Path object pointing to a file
             - BinaryIO: A file-like object in binary read mode
-        server_endpoint: The URL of the Tika server. Defaults to SERVER_ENDPOINT.
+        server_endpoint: The URL of the Tika server, or a TikaPool. Defaults to SERVER_ENDPOINT.
         service: The Tika service to use. Must be one of:
             - "all": Both content and metadata (default)
             - "meta": Only metadata
@@ -53,6 +75,15 @@ async def from_file(
         headers: Additional HTTP headers to include in the request.
         config_path: Path to a custom Tika configuration file.
         request_options: Additional options for the HTTP request (e.g., timeout).
+        merge: How the metadata of the container and its embedded documents is combined
+            for the "all" service:
+            - "merge": The container's value, turned into a list with the string values
+              of embedded documents appended when they have the key too (default)
+            - "first-wins": Only the first value found for each key
+            - "container-only": Only the container's metadata; embedded documents are
+              not looked at
+            - "list-all": A list of every value of each key, in document order
+            Use :func:`stream_documents` to get the metadata of each document separately.
 
     Returns:
         TikaResponse: A dictionary-like object containing:
@@ -64,13 +95,14 @@ async def from_file(
     Raises:
         TikaError: If the server returns an error or parsing fails
         FileNotFoundError: If the specified file doesn't exist
-        ValueError: If an invalid service type is specified
+        ValueError: If an invalid service type or merge strategy is specified
 
     Example:
         >>> response = from_file("document.pdf", service="all")
         >>> print(response.content)  # Print extracted text
         >>> print(response.metadata.get("Content-Type"))  # Get document type
     """
+    _merger(merge)
     if not xml_content:
         output = await parse_1(
             option=service,
@@ -90,17 +122,18 @@ async def from_file(
             config_path=config_path,
             request_options=request_options,
         )
-    return _parse(output=output, service=service)
+    return _parse(output=output, service=service, merge=merge)
 
 
 async def from_buffer(
     buf: str | bytes | BinaryIO,
     *,
-    server_endpoint: str = SERVER_ENDPOINT,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
     xml_content: bool = False,
     headers: dict[str, Any] | None = None,
     config_path: str | None = None,
     request_options: dict[str, Any] | None = None,
+    merge: MergeStrategy = "merge",
 ) -> TikaResponse:
     """Parses content directly from a buffer using Apache Tika server.
 
@@ -113,13 +146,14 @@ async def from_buffer(
             - str: Text content
             - bytes: Binary content
             - BinaryIO: File-like object with binary content
-        server_endpoint: The URL of the Tika server. Defaults to SERVER_ENDPOINT.
+        server_endpoint: The URL of the Tika server, or a TikaPool. Defaults to SERVER_ENDPOINT.
         xml_content: If True, requests XML output instead of plain text.
             Affects the structure of the returned content.
         headers: Additional HTTP headers to include in the request.
             'Accept: application/json' is automatically added.
         config_path: Path to a custom Tika configuration file.
         request_options: Additional options for the HTTP request (e.g., timeout).
+        merge: How the metadata of embedded documents is combined; see :func:`from_file`.
 
     Returns:
         TikaResponse: A dictionary-like object containing:
@@ -131,12 +165,14 @@ async def from_buffer(
     Raises:
         TikaError: If the server returns a non-200 status code or parsing fails
         TypeError: If the buffer is not of a supported type
+        ValueError: If an invalid merge strategy is specified
 
     Example:
         >>> with open("document.pdf", "rb") as f:
         ...     response = from_buffer(f.read())
         >>> print(response.metadata)  # Print all metadata
     """
+    _merger(merge)
     headers = headers or {}
     headers.update({"Accept": "application/json"})
 
@@ -167,10 +203,368 @@ async def from_buffer(
         msg = f"Unexpected response from Tika server ({status}): {response}"
         raise TikaError(msg)
 
-    return _parse((status, response))
+    return _parse((status, response), merge=merge)
+
+
+async def analyze(
+    obj: str | Path | BinaryIO | bytes | bytearray | memoryview,
+    *,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
+    xml_content: bool = False,
+    headers: dict[str, Any] | None = None,
+    config_path: str | None = None,
+    request_options: dict[str, Any] | None = None,
+    language_sample: int = 64 * 1024,
+) -> TikaAnalysis:
+    """Detects the type and language of a document and parses it, uploading it only once.
+
+    The document is sent to ``/rmeta`` and its MIME type and language are read from the
+    metadata of the top-level document. When Tika reports no language (the default server
+    configuration has no language detector for ``/rmeta``), only the first ``language_sample``
+    characters of the extracted text are sent to ``/language/string``. When it reports no
+    type, the type is guessed from the file name.
+
+    Args:
+        obj: The document to analyze: a path or URL, a Path, a file-like object or an
+            in-memory buffer.
+        server_endpoint: The URL of the Tika server, or a TikaPool. Defaults to SERVER_ENDPOINT.
+        xml_content: If True, requests XML output instead of plain text. The language is
+            then only taken from the metadata.
+        headers: Additional HTTP headers to include in the request.
+        config_path: Path to a custom Tika configuration file.
+        request_options: Additional options for the HTTP request (e.g., timeout).
+        language_sample: Number of characters of text used for the language fallback;
+            0 disables it. Defaults to 65536.
+
+    Returns:
+        TikaAnalysis: The same fields as :func:`from_file` with ``service="all"``, plus
+            ``content_type`` and ``language``.
+
+    Raises:
+        TikaError: If the server returns an unsuccessful status code.
+
+    Example:
+        >>> result = await analyze("document.pdf")
+        >>> result["content_type"], result["language"]
+        ('application/pdf', 'en')
+    """
+    name = obj if isinstance(obj, str | Path) else getattr(obj, "name", None)
+    status, response = await parse_1(
+        option="all",
+        url_or_path=obj,
+        server_endpoint=server_endpoint,
+        services={"all": "/rmeta/xml" if xml_content else "/rmeta/text"},
+        headers=headers,
+        config_path=config_path,
+        request_options=request_options,
+    )
+    if status != HTTPStatus.OK:
+        msg = f"Unexpected response from Tika server ({status}): {response}"
+        raise TikaError(msg)
+    parsed = _parse((status, response))
+
+    metadata = parsed["metadata"] or {}
+    content_type = _first_value(metadata, "Content-Type")
+    if content_type is not None:
+        content_type = content_type.split(";", 1)[0].strip()
+    elif isinstance(name, str | Path):
+        content_type = mimetypes.guess_type(str(name))[0]
+
+    language = _first_value(metadata, "language", "dc:language", "Content-Language")
+    text = parsed["content"]
+    if language is None and language_sample > 0 and not xml_content and isinstance(text, str) and text.strip():
+        status, detected = await call_server(
+            verb="put",
+            server_endpoint=server_endpoint,
+            service="/language/string",
+            data=text[:language_sample],
+            headers={"Accept": "text/plain"},
+            verbose=False,
+            request_options=request_options,
+        )
+        if status == HTTPStatus.OK and isinstance(detected, str) and detected.strip():
+            language = detected.strip()
+
+    return TikaAnalysis(**parsed, content_type=content_type, language=language)
+
+
+def _first_value(metadata: dict[str, str | list[str]], *keys: str) -> str | None:
+    """Return the top-level document's value for the first of keys present in merged metadata."""
+    for key in keys:
+        value = metadata.get(key)
+        if isinstance(value, list):
+            value = value[0] if value else None
+        if value:
+            return value
+    return None
+
+
+async def stream_file(
+    obj: str | Path | BinaryIO,
+    *,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
+    service: str = "all",
+    xml_content: bool = False,
+    headers: dict[str, Any] | None = None,
+    config_path: str | None = None,
+    request_options: dict[str, Any] | None = None,
+) -> AsyncIterator[str | dict[str, Any]]:
+    """Parses a file using Apache Tika server and yields results as the server produces them.
+
+    Unlike :func:`from_file`, the response is never held in memory as a whole, so
+    downstream consumers can start work before the server has finished and peak
+    memory stays proportional to a single chunk or embedded document.
+
+    Args:
+        obj: The file to be parsed. Can be:
+            - str: A file path or URL
+            - Path: A pathlib.Path object pointing to a file
+            - BinaryIO: A file-like object in binary read mode
+        server_endpoint: The URL of the Tika server, or a TikaPool. Defaults to SERVER_ENDPOINT.
+        service: The Tika service to use. Must be one of:
+            - "all": One metadata record per (embedded) document from /rmeta (default)
+            - "meta": A single metadata record
+            - "text": Chunks of extracted text
+        xml_content: If True, requests XML output instead of plain text.
+        headers: Additional HTTP headers to include in the request.
+        config_path: Path to a custom Tika configuration file.
+        request_options: Additional options for the HTTP request (e.g., timeout).
+
+    Yields:
+        str chunks of extracted text for the "text" service, otherwise metadata
+        dictionaries, including ``X-TIKA:content`` for the "all" service.
+
+    Raises:
+        TikaError: If the server returns an error or parsing fails
+
+    Example:
+        >>> async for record in stream_file("archive.zip"):
+        ...     print(record["X-TIKA:embedded_resource_path"])
+    """
+    services = {"meta": "/meta", "text": "/tika", "all": "/rmeta/xml" if xml_content else "/rmeta/text"}
+    chunks = stream_parse_1(
+        option=service,
+        url_or_path=obj,
+        server_endpoint=server_endpoint,
+        services=services,
+        headers=headers,
+        config_path=config_path,
+        request_options=request_options,
+    )
+    if service == "text":
+        async for text in _iter_text(chunks):
+            yield text
+    elif service == "meta":
+        yield orjson.loads(b"".join([chunk async for chunk in chunks]))
+    else:
+        async for record in _iter_json_array(chunks):
+            yield record
 
 
-def _parse(output: tuple[int, str | bytes | BinaryIO | None], service: str = "all") -> TikaResponse:  # noqa: C901
+async def stream_buffer(
+    buf: str | bytes | BinaryIO,
+    *,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
+    xml_content: bool = False,
+    headers: dict[str, Any] | None = None,
+    config_path: str | None = None,
+    request_options: dict[str, Any] | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Parses content from a buffer and yields one /rmeta record per (embedded) document.
+
+    The streaming counterpart of :func:`from_buffer`; see :func:`stream_file`.
+
+    Args:
+        buf: The content to parse. Can be:
+            - str: Text content
+            - bytes: Binary content
+            - BinaryIO: File-like object with binary content
+        server_endpoint: The URL of the Tika server, or a TikaPool. Defaults to SERVER_ENDPOINT.
+        xml_content: If True, requests XML output instead of plain text.
+        headers: Additional HTTP headers to include in the request.
+            'Accept: application/json' is automatically added.
+        config_path: Path to a custom Tika configuration file.
+        request_options: Additional options for the HTTP request (e.g., timeout).
+
+    Yields:
+        dict[str, Any]: The metadata of each document, including ``X-TIKA:content``.
+
+    Raises:
+        TikaError: If the server returns a non-200 status code or parsing fails
+    """
+    headers = headers or {}
+    headers.update({"Accept": "application/json"})
+
+    chunks = call_server_stream(
+        verb="put",
+        server_endpoint=server_endpoint,
+        service="/rmeta/xml" if xml_content else "/rmeta/text",
+        data=buf,
+        headers=headers,
+        verbose=False,
+        config_path=config_path,
+        request_options=request_options,
+    )
+    async for record in _iter_json_array(chunks):
+        yield record
+
+
+async def stream_documents(
+    obj: str | Path | BinaryIO | bytes,
+    *,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
+    xml_content: bool = False,
+    headers: dict[str, Any] | None = None,
+    config_path: str | None = None,
+    request_options: dict[str, Any] | None = None,
+) -> AsyncIterator[TikaDocument]:
+    """Parses a file and yields the container and each embedded document separately.
+
+    Instead of one merged result, every /rmeta record becomes a :class:`TikaDocument`
+    with its own path, content and metadata, decoded as it arrives. Collect them with
+    ``[document async for document in stream_documents(...)]`` for a list.
+
+    Args:
+        obj: The file to be parsed: a path or URL, a Path, a file-like object or bytes.
+        server_endpoint: The URL of the Tika server, or a TikaPool. Defaults to SERVER_ENDPOINT.
+        xml_content: If True, requests XML output instead of plain text.
+        headers: Additional HTTP headers to include in the request.
+        config_path: Path to a custom Tika configuration file.
+        request_options: Additional options for the HTTP request (e.g., timeout).
+
+    Yields:
+        TikaDocument: The container first, then its embedded documents.
+
+    Raises:
+        TikaError: If the server returns an error or parsing fails
+
+    Example:
+        >>> async for document in stream_documents("mail.eml"):
+        ...     index(document["path"], document["content"])
+    """
+    records = stream_file(
+        obj,  # type: ignore
+        server_endpoint=server_endpoint,
+        xml_content=xml_content,
+        headers=headers,
+        config_path=config_path,
+        request_options=request_options,
+    )
+    async for record in records:
+        record = cast("dict[str, Any]", record)
+        content = record.pop(_CONTENT_KEY, None)
+        yield TikaDocument(
+            path=record.pop(_PATH_KEY, "/"),
+            content=content if isinstance(content, str) else None,
+            metadata=record,
+        )
+
+
+async def _iter_text(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Decodes a UTF-8 byte stream into text without splitting multi-byte characters."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    async for chunk in chunks:
+        if text := decoder.decode(chunk):
+            yield text
+    if text := decoder.decode(b"", final=True):
+        yield text
+
+
+async def _iter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """Decodes the elements of a streamed top-level JSON array one at a time."""
+    decoder = _JsonArrayDecoder()
+    async for chunk in chunks:
+        for element in decoder.feed(chunk):
+            yield element
+    decoder.close()
+
+
+class _JsonArrayDecoder:
+    """Incremental decoder for a JSON array of objects or arrays.
+
+    Only the element currently being received is buffered; each one is handed to
+    orjson as soon as its closing bracket arrives. Strings are skipped with a single
+    regex match, so long ``X-TIKA:content`` values are not scanned byte by byte.
+    """
+
+    _STRUCTURE = re.compile(rb'["{}\[\]]')
+    _STRING_BODY = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*')
+    _LEADING = re.compile(rb"\s*")
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._position = 0
+        self._depth = 0
+        self._element_start = 0
+        self._in_string = False
+        self._started = False
+        self._done = False
+
+    def feed(self, chunk: bytes) -> list[Any]:  # noqa: C901
+        """Adds a chunk of the array and returns the elements it completed.
+
+        Raises:
+            TikaError: If the response is not a JSON array, e.g. an error object.
+        """
+        buffer = self._buffer
+        buffer += chunk
+        elements: list[Any] = []
+        if not self._started:
+            start = self._LEADING.match(buffer).end()  # type: ignore
+            if start == len(buffer):
+                return elements
+            if buffer[start] != ord("["):
+                msg = f"Expected a JSON array from Tika server, got: {bytes(buffer[start : start + 100])!r}"
+                raise TikaError(msg)
+            self._started = True
+        while self._position < len(buffer) and not self._done:
+            if self._in_string:
+                end = self._STRING_BODY.match(buffer, self._position).end()  # type: ignore
+                self._position = end
+                if end < len(buffer) and buffer[end] == ord('"'):
+                    self._position += 1
+                    self._in_string = False
+                elif end < len(buffer):
+                    break  # a trailing backslash; wait for the escaped character
+                continue
+
+            match = self._STRUCTURE.search(buffer, self._position)
+            if match is None:
+                self._position = len(buffer)
+                break
+            self._position = match.end()
+            token = buffer[match.start()]
+            if token == ord('"'):
+                self._in_string = True
+            elif token in (ord("{"), ord("[")):
+                self._depth += 1
+                if self._depth == 2:
+                    self._element_start = match.start()
+            else:
+                self._depth -= 1
+                if self._depth == 1:
+                    elements.append(orjson.loads(buffer[self._element_start : self._position]))
+                elif self._depth == 0:
+                    self._done = True
+
+        # drop everything that belongs to elements already returned
+        keep_from = self._element_start if self._depth >= 2 else self._position
+        if keep_from:
+            del buffer[:keep_from]
+            self._position -= keep_from
+            self._element_start = max(self._element_start - keep_from, 0)
+        return elements
+
+    def close(self) -> None:
+        """Checks that the stream ended with a complete array."""
+        if not self._done:
+            msg = "Truncated JSON response from Tika server"
+            raise TikaError(msg)
+
+
+def _parse(
+    output: tuple[int, str | bytes | BinaryIO | None], service: str = "all", merge: MergeStrategy = "merge"
+) -> TikaResponse:
     """Parses the raw response from Tika server into a structured format.
 
     Internal function that processes the raw response from Tika's REST API and
@@ -185,6 +579,7 @@ def _parse(output: tuple[int, str | bytes | BinaryIO | None], service: str = "al
             - "all": Both content and metadata (default)
             - "meta": Only metadata
             - "text": Only text content
+        merge: How the metadata of the /rmeta records is combined; see :func:`from_file`.
 
     Returns:
         TikaResponse: A dictionary-like object containing:
@@ -218,33 +613,82 @@ def _parse(output: tuple[int, str | bytes | BinaryIO | None], service: str = "al
     if service == "meta" and isinstance(raw_json, dict):
         for key, value in raw_json.items():
             if isinstance(value, str | list):
-                parsed["metadata"][key] = cast(str | list[str], value)
+                parsed["metadata"][key] = cast("str | list[str]", value)
         return parsed
 
-    content: list[str] = []
     if isinstance(raw_json, list):
-        for js in raw_json:
-            if "X-TIKA:content" in js and isinstance(js["X-TIKA:content"], str):
-                content.append(js["X-TIKA:content"])
-
+        content = [text for record in raw_json if isinstance(text := record.get(_CONTENT_KEY), str)]
         parsed["content"] = "".join(content) if content else None
+        parsed["metadata"] = _merger(merge)(raw_json)
 
-        metadata_dict = parsed["metadata"]
-        if metadata_dict is not None:
-            for js in raw_json:
-                for key, value in js.items():
-                    if key != "X-TIKA:content":
-                        current_value = metadata_dict.get(key)
-
-                        if current_value is not None:
-                            if isinstance(current_value, str):
-                                metadata_dict[key] = [current_value]
+    return parsed
 
-                            if isinstance(value, str):  # noqa: SIM102
-                                if isinstance(metadata_dict[key], list):
-                                    cast(list[str], metadata_dict[key]).append(value)
-                        else:
-                            if isinstance(value, str | list):
-                                metadata_dict[key] = cast(str | list[str], value)
 
-    return parsed
+def _merge(records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Keep the first string or list value of each key, extended with the later string values."""
+    merged: dict[str, Any] = {}
+    later: dict[str, list[str]] = {}
+    for record in records:
+        for key, value in record.items():
+            if key in merged:
+                # a key seen before always ends up as a list, even if this value is not kept
+                values = later.get(key)
+                if values is None:
+                    values = later[key] = []
+                if isinstance(value, str):
+                    values.append(value)
+            elif key != _CONTENT_KEY and isinstance(value, str | list):
+                merged[key] = value
+    for key, values in later.items():
+        first = merged[key]
+        merged[key] = [first, *values] if isinstance(first, str) else first + values
+    return merged
+
+
+def _first_wins(records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Keep only the first string or list value of each key."""
+    merged: dict[str, Any] = {}
+    for record in records:
+        for key, value in record.items():
+            if key not in merged and key != _CONTENT_KEY and isinstance(value, str | list):
+                merged[key] = value
+    return merged
+
+
+def _container_only(records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Keep the metadata of the container document, the first record."""
+    return _first_wins(records[:1])
+
+
+def _list_all(records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Collect every string value of each key across all records into one list."""
+    merged: dict[str, list[str]] = {}
+    for record in records:
+        for key, value in record.items():
+            if key == _CONTENT_KEY:
+                continue
+            values = merged.get(key)
+            if values is None:
+                values = merged[key] = []
+            if isinstance(value, str):
+                values.append(value)
+            elif isinstance(value, list):
+                values.extend(value)
+    return merged
+
+
+_MERGERS = {
+    "merge": _merge,
+    "first-wins": _first_wins,
+    "container-only": _container_only,
+    "list-all": _list_all,
+}
+
+
+def _merger(merge: str) -> Callable[[list[dict[str, Any]]], dict[str, Any]]:
+    """Look up a merge strategy by name."""
+    merger = _MERGERS.get(merge)
+    if merger is None:
+        msg = f"merge must be one of {', '.join(_MERGERS)}, got {merge!r}"
+        raise ValueError(msg)
+    return merger
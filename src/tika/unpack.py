@@ -15,23 +15,40 @@
 # limitations under the License.
 #
 
+import asyncio
 import csv
+import mmap
+import os
+import shutil
 import tarfile
-from collections.abc import Generator
-from contextlib import closing
+import tempfile
+import threading
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterator, Mapping
+from contextlib import aclosing, closing, suppress
 from http import HTTPStatus
-from io import BytesIO, TextIOWrapper
+from io import BytesIO, RawIOBase, StringIO
 from pathlib import Path
-from sys import version_info
-from typing import Any, BinaryIO
+from typing import Any, BinaryIO, Self
 
-from tika.core import SERVER_ENDPOINT, TikaError, TikaResponse, call_server, parse_1
+from tika.core import (
+    SERVER_ENDPOINT,
+    TIKA_UNPACK_SPILL_BYTES,
+    TikaError,
+    TikaPool,
+    TikaResponse,
+    call_server_stream,
+    stream_parse_1,
+)
+
+UnpackSink = str | Path | Callable[[str, BinaryIO], None]
+"""Where streamed attachments go: a directory, or a callback given each attachment's name and contents"""
 
 
 async def from_file(
     file_obj: Path,
     *,
-    server_endpoint: str = SERVER_ENDPOINT,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
     request_options: dict[str, Any] | None = None,
 ) -> TikaResponse:
     """Parses a file using Apache Tika server's unpack endpoint.
@@ -41,7 +58,7 @@ async def from_file(
 
     Args:
         file_obj: A Path object pointing to the file to be parsed.
-        server_endpoint: The URL of the Tika server. Defaults to SERVER_ENDPOINT.
+        server_endpoint: The URL of the Tika server, or a TikaPool. Defaults to SERVER_ENDPOINT.
         request_options: Optional dictionary of request options to pass to the server.
             Can include parameters like timeout, headers, etc.
 
@@ -49,7 +66,7 @@ async def from_file(
         TikaResponse: A dictionary-like object containing:
             - content: The extracted text content (str)
             - metadata: Dictionary of metadata key-value pairs
-            - attachments: Dictionary of embedded files
+            - attachments: LazyAttachments mapping of embedded file names to their bytes
             - status: HTTP status code of the response
 
     Raises:
@@ -62,22 +79,21 @@ async def from_file(
         >>> print(response.content)  # Print extracted text
         >>> print(response.metadata)  # Print document metadata
     """
-    tar_output = await parse_1(
+    chunks = stream_parse_1(
         option="unpack",
         url_or_path=file_obj,
         server_endpoint=server_endpoint,
         response_mime_type="application/x-tar",
         services={"meta": "/meta", "text": "/tika", "all": "/rmeta/xml", "unpack": "/unpack/all"},
-        raw_response=True,
         request_options=request_options,
     )
-    return _parse(tar_output=tar_output)
+    return _parse(tar_output=(HTTPStatus.OK, await _spool(chunks)))
 
 
 async def from_buffer(
     buf: str | bytes | BinaryIO,
     *,
-    server_endpoint: str = SERVER_ENDPOINT,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
     headers: dict[str, Any] | None = None,
     request_options: dict[str, Any] | None = None,
 ) -> TikaResponse:
@@ -91,7 +107,7 @@ async def from_buffer(
             - str: Text content
             - bytes: Binary content
             - BinaryIO: File-like object containing binary content
-        server_endpoint: The URL of the Tika server. Defaults to SERVER_ENDPOINT.
+        server_endpoint: The URL of the Tika server, or a TikaPool. Defaults to SERVER_ENDPOINT.
         headers: Optional dictionary of additional HTTP headers to send with the request.
             The 'Accept: application/x-tar' header will be added automatically.
         request_options: Optional dictionary of request options to pass to the server.
@@ -101,7 +117,7 @@ async def from_buffer(
         TikaResponse: A dictionary-like object containing:
             - content: The extracted text content (str)
             - metadata: Dictionary of metadata key-value pairs
-            - attachments: Dictionary of embedded files
+            - attachments: LazyAttachments mapping of embedded file names to their bytes
             - status: HTTP status code of the response
 
     Raises:
@@ -117,22 +133,291 @@ async def from_buffer(
     headers = headers or {}
     headers.update({"Accept": "application/x-tar"})
 
-    status, response = await call_server(
+    chunks = call_server_stream(
         verb="put",
         server_endpoint=server_endpoint,
         service="/unpack/all",
         data=buf,
         headers=headers,
         verbose=False,
-        raw_response=True,
         request_options=request_options,
     )
+    return _parse(tar_output=(HTTPStatus.OK, await _spool(chunks)))
+
+
+async def stream_file(
+    file_obj: str | Path | BinaryIO,
+    *,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
+    sink: UnpackSink | None = None,
+    headers: dict[str, Any] | None = None,
+    request_options: dict[str, Any] | None = None,
+) -> AsyncIterator[tuple[str, Any]]:
+    """Unpacks a file with Apache Tika server and yields its parts as the archive arrives.
+
+    Unlike :func:`from_file`, the ``/unpack/all`` response is read as a TAR stream and never
+    held in memory as a whole: at most one attachment is buffered at a time, or none at
+    all when a ``sink`` is given.
+
+    Args:
+        file_obj: The file to unpack: a path or URL, a Path or a file-like object.
+        server_endpoint: The URL of the Tika server, or a TikaPool. Defaults to SERVER_ENDPOINT.
+        sink: Where to put attachments instead of yielding their bytes. A directory receives
+            one file per attachment; a callback is called with each attachment's name and a
+            file object that must be read before it returns.
+        headers: Optional dictionary of additional HTTP headers to send with the request.
+        request_options: Optional dictionary of request options to pass to the server.
 
-    if status != HTTPStatus.OK:
-        msg = f"Unexpected response from Tika server ({status}): {response}"
+    Yields:
+        tuple[str, Any]: ``("__METADATA__", dict)``, ``("__TEXT__", str)`` and one
+        ``(name, value)`` per attachment, in the order the server sends them. The value
+        of an attachment is its bytes, the Path it was written to, or None when it was
+        passed to a callback.
+
+    Raises:
+        TikaError: If the server returns an error, the archive is malformed or an
+            attachment name would escape the sink directory.
+
+    Example:
+        >>> async for name, value in stream_file(Path("mail.eml"), sink=Path("/tmp/parts")):
+        ...     print(name, value)
+    """
+    chunks = stream_parse_1(
+        option="unpack",
+        url_or_path=file_obj,
+        server_endpoint=server_endpoint,
+        response_mime_type="application/x-tar",
+        services={"unpack": "/unpack/all"},
+        headers=headers,
+        request_options=request_options,
+    )
+    async for entry in _iter_tar(chunks, sink):
+        yield entry
+
+
+async def stream_buffer(
+    buf: str | bytes | BinaryIO,
+    *,
+    server_endpoint: str | TikaPool = SERVER_ENDPOINT,
+    sink: UnpackSink | None = None,
+    headers: dict[str, Any] | None = None,
+    request_options: dict[str, Any] | None = None,
+) -> AsyncIterator[tuple[str, Any]]:
+    """Unpacks content from a buffer and yields its parts as the archive arrives.
+
+    The streaming counterpart of :func:`from_buffer`; see :func:`stream_file`.
+
+    Args:
+        buf: The content to unpack: text, bytes or a file-like object.
+        server_endpoint: The URL of the Tika server, or a TikaPool. Defaults to SERVER_ENDPOINT.
+        sink: Where to put attachments instead of yielding their bytes; see :func:`stream_file`.
+        headers: Optional dictionary of additional HTTP headers to send with the request.
+            The 'Accept: application/x-tar' header will be added automatically.
+        request_options: Optional dictionary of request options to pass to the server.
+
+    Yields:
+        tuple[str, Any]: The metadata, the text and each attachment; see :func:`stream_file`.
+
+    Raises:
+        TikaError: If the server returns an error or the archive is malformed.
+    """
+    headers = headers or {}
+    headers.update({"Accept": "application/x-tar"})
+
+    chunks = call_server_stream(
+        verb="put",
+        server_endpoint=server_endpoint,
+        service="/unpack/all",
+        data=buf,
+        headers=headers,
+        verbose=False,
+        request_options=request_options,
+    )
+    async for entry in _iter_tar(chunks, sink):
+        yield entry
+
+
+class _ChunkPipe(RawIOBase):
+    """Blocking file object fed with chunks from the event loop and read by ``tarfile`` in a reader thread.
+
+    Writing never blocks; the writer limits how many chunks are queued and is told through
+    ``on_consumed`` each time the reader has used one up.
+    """
+
+    def __init__(self, on_consumed: Callable[[], None]) -> None:
+        self._chunks: deque[memoryview] = deque()
+        self._condition = threading.Condition()
+        self._on_consumed = on_consumed
+        self._eof = False
+        self._error: BaseException | None = None
+        self.aborted = False
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def write_chunk(self, chunk: bytes) -> None:
+        with self._condition:
+            if not self.aborted:
+                self._chunks.append(memoryview(chunk))
+                self._condition.notify_all()
+
+    def finish(self, error: BaseException | None = None) -> None:
+        """Mark the end of the stream, or that it failed with error."""
+        with self._condition:
+            self._eof = True
+            self._error = error
+            self._condition.notify_all()
+
+    def abort(self) -> None:
+        """Unblock both sides for good; further reads fail."""
+        with self._condition:
+            self.aborted = True
+            self._chunks.clear()
+            self._condition.notify_all()
+
+    def readinto(self, buffer: Any) -> int:  # noqa: ANN401
+        with self._condition:
+            self._condition.wait_for(lambda: self._chunks or self._eof or self.aborted)
+            if self.aborted:
+                msg = "Unpack stream was closed"
+                raise TikaError(msg)
+            if not self._chunks:
+                if self._error is not None:
+                    raise self._error
+                return 0
+            chunk = self._chunks[0]
+            size = min(len(buffer), len(chunk))
+            buffer[:size] = chunk[:size]
+            if size == len(chunk):
+                self._chunks.popleft()
+                self._on_consumed()
+            else:
+                self._chunks[0] = chunk[size:]
+            self.bytes_read += size
+            return size
+
+
+_END = object()
+
+
+async def _iter_tar(  # noqa: C901
+    chunks: AsyncIterable[bytes], sink: UnpackSink | None, max_chunks: int = 8
+) -> AsyncIterator[tuple[str, Any]]:
+    """Read a streamed TAR response in a reader thread and yield its members as they are completed.
+
+    The reader gets a thread of its own rather than a default executor worker, as it blocks
+    for the whole response: sharing the pool would let enough concurrent streams take every
+    worker and starve the ``to_thread`` calls they, and everything else, depend on. At most
+    ``max_chunks`` chunks are queued for it, so a slow reader slows down the download
+    instead of buffering it.
+    """
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(max_chunks)
+    pipe = _ChunkPipe(on_consumed=lambda: loop.call_soon_threadsafe(slots.release))
+    entries: asyncio.Queue[Any] = asyncio.Queue()
+    taken = threading.Semaphore(0)
+    finished = loop.create_future()
+
+    def emit(item: object) -> None:
+        # hand one item to the event loop and wait until it is consumed, so members
+        # are not read ahead of the consumer
+        loop.call_soon_threadsafe(entries.put_nowait, item)
+        if not pipe.aborted:
+            taken.acquire()
+
+    def read_tar() -> None:
+        try:
+            with tarfile.open(fileobj=pipe, mode="r|") as tar_file:  # type: ignore
+                for member in tar_file:
+                    if member.issym() or not member.isfile():
+                        continue
+                    extracted = tar_file.extractfile(member)
+                    if not extracted:
+                        msg = "Failed to extract attachment from TAR file"
+                        raise TikaError(msg)
+                    with closing(extracted):
+                        emit((member.name, _read_member(member.name, extracted, tar_file.encoding, sink)))
+        except tarfile.ReadError as e:
+            if pipe.bytes_read:
+                emit(TikaError(f"Malformed TAR response from Tika server: {e}"))
+        except Exception as e:  # noqa: BLE001
+            emit(e)
+        emit(_END)
+
+    def run_reader() -> None:
+        try:
+            read_tar()
+        finally:
+            loop.call_soon_threadsafe(finished.set_result, None)
+
+    async def feed() -> None:
+        try:
+            async with aclosing(chunks) as stream:  # type: ignore
+                async for chunk in stream:
+                    await slots.acquire()
+                    pipe.write_chunk(chunk)
+        except Exception as e:  # noqa: BLE001
+            pipe.finish(e)
+        else:
+            pipe.finish()
+
+    feeder = asyncio.create_task(feed())
+    threading.Thread(target=run_reader, name="tika-unpack-reader", daemon=True).start()
+    try:
+        while (item := await entries.get()) is not _END:
+            taken.release()
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        pipe.abort()
+        taken.release()
+        feeder.cancel()
+        with suppress(asyncio.CancelledError):
+            await feeder
+        await finished
+
+
+def _read_member(name: str, extracted: BinaryIO, encoding: str, sink: UnpackSink | None) -> Any:  # noqa: ANN401
+    """Decode the metadata or text member, or deliver an attachment to the sink."""
+    # members of a streamed archive are not seekable, which TextIOWrapper requires
+    if name == "__METADATA__":
+        return _read_metadata(extracted.read(), encoding)
+    if name == "__TEXT__":
+        return extracted.read().decode("utf8")
+    if sink is None:
+        return extracted.read()
+    if callable(sink):
+        sink(name, extracted)
+        return None
+    root = Path(sink).resolve()
+    path = (root / name).resolve()
+    if not path.is_relative_to(root) or path == root:
+        msg = f"Attachment name {name!r} escapes the unpack directory"
         raise TikaError(msg)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as out:
+        shutil.copyfileobj(extracted, out)
+    return path
+
 
-    return _parse(tar_output=(status, response))
+def _read_metadata(data: bytes, encoding: str) -> dict[str, Any]:
+    """Decode the ``__METADATA__`` CSV of an unpack response in a single pass.
+
+    Each line is a key followed by its value, with list values returned as extra values in
+    the line; single values are returned as str to be consistent with parser metadata.
+    """
+    # NULs are dropped in bulk before parsing, see https://issues.apache.org/jira/browse/TIKA-3070
+    text = data.decode(encoding).replace("\0", "")
+    metadata: dict[str, Any] = {}
+    # newline=None translates \r\n in quoted values to \n, as TextIOWrapper used to
+    for row in csv.reader(StringIO(text, newline=None)):
+        if len(row) < 2:
+            msg = "Failed to extract metadata from TAR file"
+            raise TikaError(msg)
+        metadata[row[0]] = row[1:] if len(row) > 2 else row[1]
+    return metadata
 
 
 def _parse(tar_output: tuple[int, str | bytes | BinaryIO]) -> TikaResponse:  # noqa: C901
@@ -150,7 +435,7 @@ def _parse(tar_output: tuple[int, str | bytes | BinaryIO]) -> TikaResponse:  # n
         TikaResponse: A dictionary-like object containing:
             - content: The extracted text content (str)
             - metadata: Dictionary of metadata key-value pairs
-            - attachments: Dictionary of embedded files
+            - attachments: LazyAttachments mapping of embedded file names to their bytes
             - status: Always 200 for successful parsing
 
     Raises:
@@ -169,8 +454,17 @@ def _parse(tar_output: tuple[int, str | bytes | BinaryIO]) -> TikaResponse:  # n
     )
     if not tar_output or tar_output[1] is None or tar_output[1] == b"":
         return parsed
+    archive = tar_output[1]
+    if isinstance(archive, str):
+        archive = archive.encode("utf8")
+    if isinstance(archive, bytes):
+        archive = BytesIO(archive)
+    if archive.seek(0, os.SEEK_END) == 0:
+        archive.close()
+        return parsed
+    archive.seek(0)
 
-    with tarfile.open(fileobj=BytesIO(tar_output[1])) as tar_file:  # type: ignore
+    with tarfile.open(fileobj=archive) as tar_file:
         # get the member names
         member_names = list(tar_file.getnames())
 
@@ -185,40 +479,8 @@ def _parse(tar_output: tuple[int, str | bytes | BinaryIO]) -> TikaResponse:  # n
             if not extracted:
                 msg = "Failed to extract metadata from TAR file"
                 raise TikaError(msg)
-            if version_info.major >= 3:
-                with closing(TextIOWrapper(extracted, encoding=tar_file.encoding)) as metadata_file:
-                    metadata_reader = csv.reader(_truncate_nulls(metadata_file))
-                    for metadata_line in metadata_reader:
-                        # each metadata line comes as a key-value pair, with list values
-                        # returned as extra values in the line - convert single values
-                        # to non-list values to be consistent with parser metadata
-                        if not len(metadata_line) >= 2:
-                            msg = "Failed to extract metadata from TAR file"
-                            raise TikaError(msg)
-
-                        if len(metadata_line) > 2:
-                            metadata[metadata_line[0]] = metadata_line[1:]
-                        else:
-                            metadata[metadata_line[0]] = metadata_line[1]
-            else:
-                extracted = tar_file.extractfile(metadata_member)
-                if not extracted:
-                    msg = "Failed to extract metadata from TAR file"
-                    raise TikaError(msg)
-                with closing(TextIOWrapper(extracted)) as metadata_file:
-                    metadata_reader = csv.reader(_truncate_nulls(metadata_file))
-                    for metadata_line in metadata_reader:
-                        # each metadata line comes as a key-value pair, with list values
-                        # returned as extra values in the line - convert single values
-                        # to non-list values to be consistent with parser metadata
-                        if len(metadata_line) < 2:
-                            msg = "Failed to extract metadata from TAR file"
-                            raise TikaError(msg)
-
-                        if len(metadata_line) > 2:
-                            metadata[metadata_line[0]] = metadata_line[1:]
-                        else:
-                            metadata[metadata_line[0]] = metadata_line[1]
+            with closing(extracted) as metadata_file:
+                metadata = _read_metadata(metadata_file.read(), tar_file.encoding)
 
         # get the content
         content: str = ""
@@ -231,24 +493,16 @@ def _parse(tar_output: tuple[int, str | bytes | BinaryIO]) -> TikaResponse:  # n
                 if not extracted:
                     msg = "Failed to extract content from TAR file"
                     raise TikaError(msg)
-                if version_info.major >= 3:
-                    with closing(TextIOWrapper(extracted, encoding="utf8")) as content_file:
-                        content = content_file.read()
-                else:
-                    with closing(extracted) as content_file:
-                        content = content_file.read().decode("utf8")
-
-        # get the remaining files as attachments
-        attachments: dict[str, Any] = {}
+                with closing(extracted) as content_file:
+                    content = content_file.read().decode("utf8")
+
+        # index the remaining files as attachments, to be read on access
+        index: dict[str, tuple[int, int]] = {}
         for attachment in member_names:
             attachment_member = tar_file.getmember(attachment)
             if not attachment_member.issym() and attachment_member.isfile():
-                extracted = tar_file.extractfile(attachment_member)
-                if not extracted:
-                    msg = "Failed to extract attachment from TAR file"
-                    raise TikaError(msg)
-                with closing(extracted) as attachment_file:
-                    attachments[attachment] = attachment_file.read()
+                index[attachment] = (attachment_member.offset_data, attachment_member.size)
+        attachments = LazyAttachments(archive, index)
 
         parsed["content"] = content
         parsed["metadata"] = metadata
@@ -257,7 +511,86 @@ def _parse(tar_output: tuple[int, str | bytes | BinaryIO]) -> TikaResponse:  # n
         return parsed
 
 
-# TODO: Remove if/when fixed. https://issues.apache.org/jira/browse/TIKA-3070
-def _truncate_nulls(s: list[str] | TextIOWrapper) -> Generator[Any, Any, None]:
-    for line in s:
-        yield line.replace("\0", "")
+class LazyAttachments(Mapping[str, bytes]):
+    """The attachments of an unpack result, read from the response only when accessed.
+
+    The response is kept as a single buffer: in memory, or memory-mapped from a temporary
+    file when it exceeded TIKA_UNPACK_SPILL_BYTES. Names and sizes are indexed up front,
+    so attachments can be filtered before any of them is copied out.
+
+    Args:
+        archive: The uncompressed TAR response.
+        index: Offset and size of each attachment's data in the archive, by name.
+
+    Example:
+        >>> parsed = await from_file(Path("mailbox.pst"))
+        >>> images = {name: parsed["attachments"][name] for name in parsed["attachments"] if name.endswith(".png")}
+    """
+
+    def __init__(self, archive: BinaryIO, index: dict[str, tuple[int, int]]) -> None:
+        self._archive = archive
+        self._index = index
+        self._mmap: mmap.mmap | None = None
+        if isinstance(archive, BytesIO):
+            self._buffer = archive.getbuffer()
+        else:
+            self._mmap = mmap.mmap(archive.fileno(), 0, access=mmap.ACCESS_READ)
+            self._buffer = memoryview(self._mmap)
+
+    @property
+    def sizes(self) -> dict[str, int]:
+        """Size in bytes of each attachment, by name."""
+        return {name: size for name, (_, size) in self._index.items()}
+
+    def __getitem__(self, name: str) -> bytes:
+        return bytes(self.view(name))
+
+    def view(self, name: str) -> memoryview:
+        """Return an attachment without copying it; the view is valid until :meth:`close`."""
+        offset, size = self._index[name]
+        return self._buffer[offset : offset + size]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.sizes!r})"
+
+    def close(self) -> None:
+        """Release the response buffer and any temporary file behind it."""
+        # views handed out may still be alive; whatever they pin is left to the GC
+        with suppress(BufferError):
+            self._buffer.release()
+        if self._mmap is not None:
+            with suppress(BufferError):
+                self._mmap.close()
+        with suppress(BufferError):
+            self._archive.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+async def _spool(chunks: AsyncIterable[bytes], spill_bytes: int = TIKA_UNPACK_SPILL_BYTES) -> BinaryIO:
+    """Collect a response in memory, moving it to a temporary file once it grows past spill_bytes."""
+    archive: BinaryIO = BytesIO()
+    size = 0
+    async with aclosing(chunks) as stream:  # type: ignore
+        async for chunk in stream:
+            size += len(chunk)
+            if isinstance(archive, BytesIO) and size > spill_bytes:
+                spilled = tempfile.TemporaryFile()  # noqa: SIM115
+                await asyncio.to_thread(spilled.write, archive.getbuffer())
+                archive = spilled  # type: ignore
+            if isinstance(archive, BytesIO):
+                archive.write(chunk)
+            else:
+                await asyncio.to_thread(archive.write, chunk)
+    archive.seek(0)
+    return archive
@@ -1,7 +1,13 @@
 import asyncio
+from collections.abc import AsyncGenerator, Callable
 
+import httpx
 import pytest
 
+from tika import core
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -11,3 +17,19 @@ def event_loop():
         loop = asyncio.new_event_loop()
     yield loop
     loop.close()
+
+
+@pytest.fixture
+async def mock_tika(monkeypatch: pytest.MonkeyPatch) -> AsyncGenerator[Callable[[Handler], None], None]:
+    """Route requests to the Tika server through an in-process handler instead of a JVM."""
+    clients: list[httpx.AsyncClient] = []
+
+    def install(handler: Handler) -> None:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        monkeypatch.setattr(core, "get_async_client", lambda *_, **__: client)
+
+    monkeypatch.setattr(core, "TIKA_CLIENT_ONLY", True)
+    yield install
+    for client in clients:
+        await client.aclose()
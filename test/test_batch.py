@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import io
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from tika import core
+
+
+class Tracker:
+    """Fake request that records how many calls run at once."""
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.peak = 0
+        self.pulled = 0
+
+    def inputs(self, count: int) -> Iterator[int]:
+        for item in range(count):
+            self.pulled += 1
+            yield item
+
+    async def __call__(self, item: int) -> tuple[int, str]:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(0.001 * (item % 3))
+        finally:
+            self.running -= 1
+        if item == 5:
+            msg = "bad document"
+            raise core.TikaError(msg)
+        return (200, str(item))
+
+
+async def test_iter_batch_bounds_concurrency() -> None:
+    """Test that no more than max_in_flight calls run and every input gets a result."""
+    tracker = Tracker()
+    results = [result async for result in core.iter_batch(tracker, tracker.inputs(50), max_in_flight=4)]
+    assert tracker.peak == 4
+    assert sorted(result["url_or_path"] for result in results) == list(range(50))
+
+
+async def test_iter_batch_captures_errors() -> None:
+    """Test that a failing input is reported without cancelling the rest of the batch."""
+    tracker = Tracker()
+    results = {result["url_or_path"]: result async for result in core.iter_batch(tracker, tracker.inputs(10))}
+    assert isinstance(results[5]["error"], core.TikaError)
+    assert results[5]["result"] is None
+    assert results[9] == {"url_or_path": 9, "result": (200, "9"), "error": None}
+
+
+async def test_iter_batch_consumes_inputs_lazily() -> None:
+    """Test that inputs are only pulled as slots free up."""
+    tracker = Tracker()
+    batch = core.iter_batch(tracker, tracker.inputs(1_000_000), max_in_flight=3)
+    await anext(batch)
+    await batch.aclose()
+    assert tracker.pulled <= 4
+    assert tracker.running == 0
+
+
+async def test_gather_bounded_keeps_order_and_raises() -> None:
+    """Test that gather_bounded returns results in input order and re-raises failures."""
+    tracker = Tracker()
+    assert await core.gather_bounded(tracker, tracker.inputs(5), max_in_flight=2) == [
+        (200, str(item)) for item in range(5)
+    ]
+    with pytest.raises(core.TikaError, match="bad document"):
+        await core.gather_bounded(tracker, tracker.inputs(10), max_in_flight=2)
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    """Directory tree with files of different names, sizes and depths."""
+    (tmp_path / "docs" / "archive").mkdir(parents=True)
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "a.pdf").write_bytes(b"x" * 10)
+    (tmp_path / "b.txt").write_bytes(b"x" * 1000)
+    (tmp_path / "docs" / "c.pdf").write_bytes(b"x" * 500)
+    (tmp_path / "docs" / "archive" / "d.pdf").write_bytes(b"x" * 50)
+    (tmp_path / ".git" / "config").write_bytes(b"x")
+    return tmp_path
+
+
+def _names(paths: Iterator[object]) -> list[str]:
+    return sorted(Path(path).name for path in paths)  # type: ignore
+
+
+def test_get_paths_is_lazy(tree: Path) -> None:
+    """Test that get_paths walks directories on demand and passes other inputs through."""
+    paths = core.get_paths([tree, "https://example.com/e.pdf"])
+    assert isinstance(next(paths), Path)
+    assert _names(core.get_paths(tree)) == ["a.pdf", "b.txt", "c.pdf", "config", "d.pdf"]
+    assert list(core.get_paths("https://example.com/e.pdf")) == ["https://example.com/e.pdf"]
+
+
+def test_get_paths_filters(tree: Path) -> None:
+    """Test include/exclude globs, directory pruning and size limits."""
+    assert _names(core.get_paths(tree, include=["*.pdf"])) == ["a.pdf", "c.pdf", "d.pdf"]
+    assert _names(core.get_paths(tree, exclude=[".git", "docs/archive"])) == ["a.pdf", "b.txt", "c.pdf"]
+    assert _names(core.get_paths(tree, include=["*.pdf"], min_size=20, max_size=500)) == ["c.pdf", "d.pdf"]
+
+
+async def test_parse_and_save_walks_directory(
+    mock_tika: Callable[[Callable[[httpx.Request], httpx.Response]], None], tree: Path, tmp_path: Path
+) -> None:
+    """Test that every file found in a directory is parsed and saved next to the input."""
+    mock_tika(lambda _: httpx.Response(200, json=[{"Content-Type": "application/pdf"}]))
+    meta_paths = await core.parse_and_save(
+        "all", core.get_paths(tree / "docs", include=["*.pdf"]), server_endpoint="http://tika.test:9998"
+    )
+    assert _names(meta_paths) == ["c.pdf_meta.json", "d.pdf_meta.json"]
+    assert all(path.read_bytes().endswith(b"\n") for path in meta_paths)
+
+
+async def test_parse_and_save_stream(
+    mock_tika: Callable[[Callable[[httpx.Request], httpx.Response]], None], tmp_path: Path
+) -> None:
+    """Test that a stream is sent as given and its metadata file is named after the stream."""
+    bodies: list[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.read())
+        return httpx.Response(200, json=[{"Content-Type": "text/plain"}])
+
+    mock_tika(handler)
+    stream = io.BytesIO(b"hello")
+    stream.name = "notes.txt"
+    meta_paths = await core.parse_and_save("all", [stream], out_dir=tmp_path, server_endpoint="http://tika.test:9998")
+    assert meta_paths == [tmp_path / "notes.txt_meta.json"]
+    assert bodies == [b"hello"]
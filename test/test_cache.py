@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import sqlite3
+from collections.abc import AsyncIterator, Callable
+from io import BytesIO
+from pathlib import Path
+
+import httpx
+import pytest
+
+from tika import core, parser
+from tika.cache import MemoryCache, SQLiteCache
+
+TEST_PDF_PATH = Path(__file__).parent / "files" / "rwservlet.pdf"
+SERVER_ENDPOINT = "http://tika.test:9998"
+
+
+@pytest.fixture
+def server_calls(mock_tika: Callable[..., None], monkeypatch: pytest.MonkeyPatch) -> list[httpx.Request]:
+    """Count requests that reach the server while a memory cache is active."""
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.headers.get("X-Fail"):
+            return httpx.Response(503)
+        return httpx.Response(200, json=[{"X-TIKA:content": "naïve café", "size": len(request.read())}])
+
+    mock_tika(handler)
+    monkeypatch.setattr(core, "_result_cache", MemoryCache())
+    return calls
+
+
+async def test_memory_cache_evicts_least_recently_used() -> None:
+    """Test that the memory cache stays under its byte budget by evicting the oldest entries."""
+    cache = MemoryCache(max_bytes=10)
+    await cache.set("a", b"1234")
+    await cache.set("b", b"1234")
+    assert await cache.get("a") == b"1234"
+    await cache.set("c", b"1234")
+    assert await cache.get("b") is None
+    assert await cache.get("a") == b"1234"
+    await cache.set("huge", b"x" * 11)
+    assert await cache.get("huge") is None
+    assert cache.size == 8
+
+
+async def test_sqlite_cache_persists(tmp_path: Path) -> None:
+    """Test that the SQLite cache is shared by every instance opening the same file."""
+    cache = SQLiteCache(tmp_path / "tika.sqlite")
+    await cache.set("key", b"value")
+    await cache.close()
+    reopened = SQLiteCache(tmp_path / "tika.sqlite")
+    assert await reopened.get("key") == b"value"
+    assert await reopened.get("missing") is None
+    await reopened.close()
+    expired = SQLiteCache(tmp_path / "tika.sqlite", max_age=-1)
+    assert await expired.get("key") is None
+    await expired.close()
+
+
+async def test_duplicate_documents_are_served_from_cache(server_calls: list[httpx.Request]) -> None:
+    """Test that the same content is only sent once, whatever form it arrives in."""
+    first = await parser.from_buffer(TEST_PDF_PATH.read_bytes(), server_endpoint=SERVER_ENDPOINT)
+    stream = BytesIO(TEST_PDF_PATH.read_bytes())
+    second = await parser.from_buffer(stream, server_endpoint=SERVER_ENDPOINT)
+    assert first == second
+    assert first["content"] == "naïve café"
+    assert stream.closed
+    assert len(server_calls) == 1
+
+    await parser.from_file(TEST_PDF_PATH, server_endpoint=SERVER_ENDPOINT)
+    await parser.from_file(TEST_PDF_PATH, server_endpoint=SERVER_ENDPOINT)
+    assert len(server_calls) == 2  # the file name is part of the request, so it is a new key
+
+
+async def test_cache_key_covers_request(server_calls: list[httpx.Request]) -> None:
+    """Test that a different service, headers or content miss the cache and errors are not stored."""
+    await parser.from_buffer("Good evening, Dave", server_endpoint=SERVER_ENDPOINT)
+    await parser.from_buffer("Good evening, Dave", server_endpoint=SERVER_ENDPOINT, xml_content=True)
+    await parser.from_buffer("Good evening, Dave", server_endpoint=SERVER_ENDPOINT, headers={"X-Tika-Skip": "1"})
+    await parser.from_buffer("Good morning, Dave", server_endpoint=SERVER_ENDPOINT)
+    assert len(server_calls) == 4
+    for _ in range(2):
+        with pytest.raises(core.TikaError):
+            await parser.from_buffer("Good evening, Dave", server_endpoint=SERVER_ENDPOINT, headers={"X-Fail": "1"})
+    assert len(server_calls) == 6
+
+
+async def test_cache_key_covers_endpoint(server_calls: list[httpx.Request]) -> None:
+    """Test that different servers never share entries, while spellings of one server do."""
+    await parser.from_buffer("Good evening, Dave", server_endpoint=SERVER_ENDPOINT)
+    await parser.from_buffer("Good evening, Dave", server_endpoint="HTTP://Tika.test:9998/")
+    await parser.from_buffer("Good evening, Dave", server_endpoint="http://tika-2.test:9998")
+    assert len(server_calls) == 2
+    for _ in range(2):
+        pool = core.TikaPool([SERVER_ENDPOINT, "http://tika-2.test:9998"])
+        await parser.from_buffer("Good evening, Dave", server_endpoint=pool)
+    assert len(server_calls) == 3
+
+
+async def test_unhashable_body_bypasses_cache(server_calls: list[httpx.Request]) -> None:
+    """Test that bodies which cannot be hashed without consuming them are always sent."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        yield b"Good evening, Dave"
+
+    for _ in range(2):
+        await core.call_server("put", SERVER_ENDPOINT, "/rmeta", chunks(), headers={})
+    assert len(server_calls) == 2
+
+
+class BrokenCache(MemoryCache):
+    """Backend whose storage has failed, like a full LMDB map or a locked SQLite file."""
+
+    async def get(self, key: str) -> bytes | None:
+        msg = "database is locked"
+        raise sqlite3.OperationalError(msg)
+
+    async def set(self, key: str, value: bytes) -> None:
+        msg = "database or disk is full"
+        raise sqlite3.OperationalError(msg)
+
+
+async def test_failing_backend_falls_through(
+    server_calls: list[httpx.Request], monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that cache errors are logged and the server's response is still returned."""
+    monkeypatch.setattr(core, "_result_cache", BrokenCache())
+    for _ in range(2):
+        parsed = await parser.from_buffer("Good evening, Dave", server_endpoint=SERVER_ENDPOINT)
+        assert parsed["content"] == "naïve café"
+    assert len(server_calls) == 2
+    assert "Result cache lookup failed" in caplog.text
+    assert "Result cache store failed" in caplog.text
+
+
+@pytest.fixture
+def slow_server(mock_tika: Callable[..., None], monkeypatch: pytest.MonkeyPatch) -> list[httpx.Request]:
+    """Server that takes a while to answer, with single-flight enabled and no result cache."""
+    calls: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, text=request.read().decode())
+
+    mock_tika(handler)
+    monkeypatch.setattr(core, "_single_flight", True)
+    return calls
+
+
+async def _put(data: object) -> tuple[int, object]:
+    return await core.call_server("put", SERVER_ENDPOINT, "/tika", data, headers={"Accept": "text/plain"})  # type: ignore
+
+
+async def test_single_flight_shares_concurrent_requests(slow_server: list[httpx.Request]) -> None:
+    """Test that concurrent identical requests reach the server once and later ones are sent again."""
+    streams = [BytesIO(b"Good evening, Dave") for _ in range(3)]
+    results = await asyncio.gather(*(_put(data) for data in [b"Good evening, Dave", *streams, b"Good morning, Dave"]))
+    assert results == [(200, "Good evening, Dave")] * 4 + [(200, "Good morning, Dave")]
+    assert len(slow_server) == 2
+    assert all(stream.closed for stream in streams)
+    await _put(b"Good evening, Dave")
+    assert len(slow_server) == 3
+
+
+async def test_single_flight_survives_cancelled_caller(slow_server: list[httpx.Request]) -> None:
+    """Test that cancelling the caller that started a request does not fail the others waiting for it."""
+    first = asyncio.create_task(_put(b"Good evening, Dave"))
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(_put(b"Good evening, Dave"))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    assert await second == (200, "Good evening, Dave")
+    assert first.cancelled()
+    assert len(slow_server) == 1
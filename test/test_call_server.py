@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterator
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO
+
+import httpx
+import pytest
+
+from tika import core
+
+# Constants
+TEST_FILES_DIR = Path(__file__).parent / "files"
+TEST_PDF_PATH = TEST_FILES_DIR / "rwservlet.pdf"
+SERVER_ENDPOINT = "http://tika.test:9998"
+
+
+@pytest.fixture
+def requests_seen(mock_tika: Callable[[Callable[[httpx.Request], httpx.Response]], None]) -> list[httpx.Request]:
+    """Echo request bodies back and record every request sent to the server."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, content=request.content)
+
+    mock_tika(handler)
+    return seen
+
+
+async def _put(data: object, **kwargs: object) -> tuple[int, object]:
+    return await core.call_server(
+        verb="put",
+        server_endpoint=SERVER_ENDPOINT,
+        service="/tika",
+        data=data,  # type: ignore
+        headers={"Accept": "text/plain"},
+        raw_response=True,
+        **kwargs,  # type: ignore
+    )
+
+
+async def test_stream_path_upload(requests_seen: list[httpx.Request]) -> None:
+    """Test that a Path is streamed with an explicit Content-Length."""
+    status, response = await _put(TEST_PDF_PATH)
+    assert status == 200
+    assert response == TEST_PDF_PATH.read_bytes()
+    assert requests_seen[0].headers["Content-Length"] == str(TEST_PDF_PATH.stat().st_size)
+    assert "Transfer-Encoding" not in requests_seen[0].headers
+
+
+@pytest.fixture
+def pdf_file() -> Iterator[BinaryIO]:
+    """The test PDF, opened for reading outside the event loop."""
+    with open(TEST_PDF_PATH, "rb") as file_obj:
+        yield file_obj
+
+
+async def test_stream_file_object_upload(requests_seen: list[httpx.Request], pdf_file: BinaryIO) -> None:
+    """Test that an open file is streamed from its current position and closed afterwards."""
+    file_obj = pdf_file
+    file_obj.seek(10)
+    _, response = await _put(file_obj)
+    assert response == TEST_PDF_PATH.read_bytes()[10:]
+    assert requests_seen[0].headers["Content-Length"] == str(TEST_PDF_PATH.stat().st_size - 10)
+    assert file_obj.closed
+
+
+async def test_stream_async_iterator_upload(requests_seen: list[httpx.Request]) -> None:
+    """Test that async iterators are sent as chunked bodies."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for chunk in (b"Good ", b"evening, ", b"Dave"):
+            yield chunk
+
+    _, response = await _put(chunks())
+    assert response == b"Good evening, Dave"
+    assert requests_seen[0].headers["Transfer-Encoding"] == "chunked"
+
+
+async def test_iter_file_chunks_is_bounded() -> None:
+    """Test that file uploads are read in chunks of at most the requested size."""
+    chunks = [chunk async for chunk in core._iter_file_chunks(BytesIO(b"x" * 10), chunk_size=4)]
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+
+
+@pytest.mark.parametrize(
+    "buffer",
+    [BytesIO(b"Good evening, Dave"), bytearray(b"Good evening, Dave"), memoryview(b"Good evening, Dave")],
+)
+async def test_buffer_upload_without_copy(requests_seen: list[httpx.Request], buffer: object) -> None:
+    """Test that in-memory buffers are sent from their own memory with a Content-Length."""
+    _, response = await _put(buffer)
+    assert response == b"Good evening, Dave"
+    assert requests_seen[0].headers["Content-Length"] == "18"
+
+
+def test_get_remote_file_keeps_streams_in_memory(tmp_path: Path) -> None:
+    """Test that binary streams are passed through instead of being copied to a temp file."""
+    stream = BytesIO(b"Good evening, Dave")
+    assert core.get_remote_file(stream, tmp_path) == (stream, "binary")
+    assert not any(tmp_path.iterdir())
+
+
+def test_content_disposition_uses_stream_name() -> None:
+    """Test that named streams keep their file name and anonymous ones get a generated one."""
+    with open(TEST_PDF_PATH, "rb") as file_obj:
+        assert core.content_disposition(file_obj) == {"Content-Disposition": "attachment; filename=rwservlet.pdf"}
+    assert core.content_disposition(BytesIO(b""))["Content-Disposition"].startswith("attachment; filename=file_")
+
+
+def _remote_handler(seen: list[httpx.Request], payload: bytes, **response_kwargs: object) -> object:
+    """Serve payload for GETs to the remote host and echo PUTs to the Tika server."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.method == "GET":
+            return httpx.Response(200, content=payload, **response_kwargs)  # type: ignore
+        return httpx.Response(200, content=request.content)
+
+    return handler
+
+
+async def test_remote_url_is_piped_to_upload(mock_tika: Callable[..., None], tmp_path: Path) -> None:
+    """Test that URL inputs are streamed from the remote host into the Tika upload."""
+    seen: list[httpx.Request] = []
+    mock_tika(_remote_handler(seen, b"%PDF-1.4 remote"))
+    status, response = await core.parse_1(
+        "text",
+        "https://files.test/reports/doc.pdf?sig=abc",
+        server_endpoint=SERVER_ENDPOINT,
+        raw_response=True,
+    )
+    assert status == 200
+    assert response == b"%PDF-1.4 remote"
+    get, put = seen
+    assert get.url.host == "files.test"
+    assert put.headers["Content-Length"] == "15"
+    assert put.headers["Content-Disposition"] == "attachment; filename=reports-doc.pdf"
+
+
+async def test_remote_url_over_announced_limit(mock_tika: Callable[..., None]) -> None:
+    """Test that downloads announcing a size over the limit are refused before upload."""
+    seen: list[httpx.Request] = []
+    mock_tika(_remote_handler(seen, b"x" * 100))
+    with pytest.raises(core.TikaError, match="limit"):
+        async with core.open_source("https://files.test/big.bin", max_bytes=10):
+            pass
+    assert [request.method for request in seen] == ["GET"]
+
+
+async def test_remote_url_over_streamed_limit(mock_tika: Callable[..., None]) -> None:
+    """Test that downloads without a Content-Length are cut off once over the limit."""
+
+    async def body() -> AsyncIterator[bytes]:
+        for _ in range(10):
+            yield b"x" * 10
+
+    async def upload() -> None:
+        async with core.open_source("https://files.test/big.bin", max_bytes=10) as (source, headers):
+            assert "Content-Length" not in headers
+            await _put(source)
+
+    seen: list[httpx.Request] = []
+    mock_tika(_remote_handler(seen, body()))  # type: ignore
+    with pytest.raises(core.TikaError, match="limit"):
+        await upload()
+
+
+async def test_client_per_endpoint_and_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that every (endpoint, event loop) pair gets its own configured client."""
+    monkeypatch.setattr(core, "_client_options", {})
+    core.configure_client(read_timeout=5)
+    core.configure_client("http://tika-2.test:9998", read_timeout=300)
+    try:
+        first = core.get_async_client("http://tika-1.test:9998")
+        assert core.get_async_client("HTTP://tika-1.test:9998/rmeta/text") is first
+        second = core.get_async_client("http://tika-2.test:9998")
+        assert second is not first
+        assert (first.timeout.read, second.timeout.read) == (5, 300)
+        other_loop = await asyncio.to_thread(asyncio.run, _get_client("http://tika-1.test:9998"))
+        assert other_loop is not first
+    finally:
+        await core.close_async_client()
+    assert first.is_closed
+    assert core.get_async_client("http://tika-1.test:9998") is not first
+    await core.close_async_client()
+
+
+async def _get_client(server_endpoint: str) -> httpx.AsyncClient:
+    client = core.get_async_client(server_endpoint)
+    await core.close_async_client()
+    return client
+
+
+def test_http2_requires_h2(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that asking for HTTP/2 without the optional h2 package is reported clearly."""
+    monkeypatch.setattr(core.importlib.util, "find_spec", lambda _: None)
+    with pytest.raises(core.TikaError, match="h2"):
+        core.create_async_client(http2=True)
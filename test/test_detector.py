@@ -1,11 +1,13 @@
 import tempfile
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from pathlib import Path
 from typing import BinaryIO, cast
 
+import httpx
 import pytest
 
 import tika
+from tika.detector import sniff
 
 # Test constants
 TEST_FILES = {
@@ -128,3 +130,79 @@ async def test_detect_edge_cases(invalid_input: str) -> None:
     """Test MIME type detection with edge cases."""
     result = await tika.detector.from_buffer(invalid_input)
     assert isinstance(result, str | bytes)
+
+
+@pytest.mark.parametrize(
+    ("prefix", "expected"),
+    [
+        (b"%PDF-1.7\n", "application/pdf"),
+        (b"RIFF\x00\x00\x00\x00WEBPVP8 ", "image/webp"),
+        (
+            b"PK\x03\x04" + bytes(26) + b"mimetypeapplication/vnd.oasis.opendocument.textPK",
+            "application/vnd.oasis.opendocument.text",
+        ),
+        (b"PK\x03\x04" + bytes(26) + b"[Content_Types].xml", None),
+        (b"Hello world", None),
+    ],
+)
+def test_sniff(prefix: bytes, expected: str | None) -> None:
+    """Test that only unambiguous signatures are resolved locally."""
+    assert sniff(prefix) == expected
+
+
+async def test_detect_local_skips_upload(mock_tika: Callable[..., None], tmp_path: Path) -> None:
+    """Test that local detection reads a prefix only and asks the server when inconclusive."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, text="text/plain")
+
+    mock_tika(handler)
+    pdf = tmp_path / "doc.bin"
+    pdf.write_bytes(b"%PDF-1.4\n" + bytes(100_000))
+    with pdf.open("rb") as file_obj:
+        assert await tika.detector.from_file(file_obj, local=True) == "application/pdf"
+        assert file_obj.tell() == 0
+    assert await tika.detector.from_buffer(b"%PDF-1.4", local=True) == "application/pdf"
+    assert not seen
+    assert await tika.detector.from_buffer(b"Hello world", local=True) == "text/plain"
+    assert [request.url.path for request in seen] == ["/detect/stream"]
+
+
+async def test_detect_local_text_is_not_a_path(mock_tika: Callable[..., None], tmp_path: Path) -> None:
+    """Test that local detection sniffs text buffers as content, never as a file name."""
+    seen: list[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.read())
+        return httpx.Response(200, text="text/plain")
+
+    mock_tika(handler)
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"%PDF-1.4\n")
+    assert await tika.detector.from_buffer(str(pdf), local=True) == "text/plain"
+    assert await tika.detector.from_buffer("x" * 5000, local=True) == "text/plain"
+    assert seen == [str(pdf).encode(), b"x" * 5000]
+
+
+async def test_detect_prefix_upload(mock_tika: Callable[..., None], tmp_path: Path) -> None:
+    """Test that only a prefix is uploaded, and the whole file only for containers."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.content.startswith(b"PK"):
+            full = len(request.content) > 16
+            return httpx.Response(200, text="application/x-tika-ooxml" if not full else "application/msword")
+        return httpx.Response(200, text="application/pdf")
+
+    mock_tika(handler)
+    pdf, docx = tmp_path / "doc.pdf", tmp_path / "doc.docx"
+    pdf.write_bytes(b"%PDF-1.4\n" + bytes(1000))
+    docx.write_bytes(b"PK\x03\x04" + bytes(1000))
+    assert await tika.detector.from_file(pdf, prefix_bytes=16) == "application/pdf"
+    assert len(seen[0].content) == 16
+    assert seen[0].headers["Content-Disposition"] == "attachment; filename=doc.pdf"
+    assert await tika.detector.from_file(docx, prefix_bytes=16) == "application/msword"
+    assert [len(request.content) for request in seen[1:]] == [16, 1004]
@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import os
+import signal
+import socket
+import stat
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+import pytest
+
+from tika import TikaServerFarm, core
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses a POSIX shell script in place of java")
+
+
+@pytest.fixture
+def fake_java(tmp_path: Path) -> str:
+    """Script that accepts the Tika server command line and serves HTTP on --port."""
+    (tmp_path / "version").write_text("Apache Tika 3.0.0")
+    script = tmp_path / "java"
+    script.write_text(
+        "#!/bin/sh\n"
+        'while [ $# -gt 0 ]; do [ "$1" = "--port" ] && port=$2; shift; done\n'
+        f'exec "{sys.executable}" -m http.server "$port" --bind 127.0.0.1 --directory "{tmp_path}"\n'
+    )
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return str(script)
+
+
+def _free_ports(count: int) -> int:
+    """Find the first of count consecutive ports that are free on localhost."""
+    for base in range(45000, 46000, count):
+        with socket.socket() as probe:
+            if all(probe.connect_ex(("127.0.0.1", base + i)) != 0 for i in range(count)):
+                return base
+    pytest.skip("no free consecutive ports")
+
+
+async def test_farm_lifecycle(fake_java: str) -> None:
+    """Test that a farm starts its servers, restarts crashed ones, routes calls and shuts down."""
+    base_port = _free_ports(2)
+    farm = TikaServerFarm(2, server_host="127.0.0.1", base_port=base_port, java_path=fake_java, health_interval=0.05)
+    async with farm:
+        assert farm.endpoints == [f"http://127.0.0.1:{base_port}", f"http://127.0.0.1:{base_port + 1}"]
+        crashed = farm.processes[base_port]
+        crashed.kill()
+        await crashed.wait()
+        for _ in range(100):
+            await asyncio.sleep(0.05)
+            if farm.processes[base_port] is not crashed and farm.members[0].ejected_until == 0:
+                break
+        assert farm.processes[base_port].returncode is None
+        assert farm.processes[base_port] is not crashed
+
+        statuses = [
+            (await core.call_server("get", farm, "/", None, headers={}, request_options={"timeout": 5}))[0]
+            for _ in range(4)
+        ]
+        assert statuses == [200] * 4
+        processes = list(farm.processes.values())
+    assert all(process.returncode is not None for process in processes)
+    assert not farm.processes
+
+
+async def test_farm_supervisor_survives_launch_errors(fake_java: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an unexpected error restarting a server is logged and retried on the next check."""
+    base_port = _free_ports(1)
+    farm = TikaServerFarm(1, server_host="127.0.0.1", base_port=base_port, java_path=fake_java, health_interval=0.05)
+    async with farm:
+        launch = farm._launch
+        attempts: list[int] = []
+
+        async def flaky_launch(member: core._PoolMember, port: int) -> None:
+            attempts.append(port)
+            if len(attempts) == 1:
+                msg = "cannot open log file"
+                raise OSError(msg)
+            await launch(member, port)
+
+        monkeypatch.setattr(farm, "_launch", flaky_launch)
+        crashed = farm.processes[base_port]
+        crashed.kill()
+        await crashed.wait()
+        for _ in range(100):
+            await asyncio.sleep(0.05)
+            if farm.processes[base_port] is not crashed and farm.members[0].ejected_until == 0:
+                break
+        assert len(attempts) == 2
+        assert farm.processes[base_port].returncode is None
+
+
+async def test_farm_restarts_hung_server(fake_java: str) -> None:
+    """Test that a server that is still running but no longer answers is replaced."""
+    base_port = _free_ports(1)
+    farm = TikaServerFarm(
+        1,
+        server_host="127.0.0.1",
+        base_port=base_port,
+        java_path=fake_java,
+        health_interval=0.05,
+        health_timeout=0.5,
+        shutdown_timeout=0.5,
+    )
+    async with farm:
+        hung = farm.processes[base_port]
+        os.kill(hung.pid, signal.SIGSTOP)
+        for _ in range(100):
+            await asyncio.sleep(0.05)
+            if farm.processes.get(base_port) not in (None, hung) and farm.members[0].ejected_until == 0:
+                break
+        assert hung.returncode is not None
+        assert farm.processes[base_port].returncode is None
+
+
+async def test_farm_start_failure(tmp_path: Path) -> None:
+    """Test that a server that exits during startup is reported."""
+    script = tmp_path / "java"
+    script.write_text("#!/bin/sh\nexit 3\n")
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    farm = TikaServerFarm(1, server_host="127.0.0.1", base_port=_free_ports(1), java_path=str(script))
+    with pytest.raises(core.TikaError, match="exited with status 3"):
+        await farm.start()
+    assert not farm.processes
+
+
+async def test_start_server_async(fake_java: str) -> None:
+    """Test that startup completes once /version answers, without blocking the event loop."""
+    port = _free_ports(1)
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(tick())
+    try:
+        assert await core.start_server_async(
+            Path("tika-server.jar"), java_path=fake_java, server_host="127.0.0.1", port=str(port)
+        )
+        assert ticks > 1
+        assert core.TIKA_SERVER_PROCESS is not None
+        assert core.TIKA_SERVER_PROCESS.poll() is None
+    finally:
+        ticker.cancel()
+        if core.TIKA_SERVER_PROCESS is not None:
+            core.TIKA_SERVER_PROCESS.kill()
+            core.TIKA_SERVER_PROCESS.wait()
+
+
+async def test_wait_for_server_backs_off(mock_tika: Callable[..., None]) -> None:
+    """Test that the readiness probe retries refused connections until the server answers."""
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            msg = "connection refused"
+            raise httpx.ConnectError(msg, request=request)
+        assert request.url.path == "/version"
+        return httpx.Response(200, text="Apache Tika 3.0.0")
+
+    mock_tika(handler)
+    await core.wait_for_server("http://tika.test:9998", timeout=5)
+    assert attempts == 3
+
+
+async def test_wait_for_server_timeout(mock_tika: Callable[..., None]) -> None:
+    """Test that a server that never becomes ready is reported after the timeout."""
+    mock_tika(lambda _: httpx.Response(503))
+    with pytest.raises(core.TikaError, match="did not answer"):
+        await core.wait_for_server("http://tika.test:9998", timeout=0.2)
+
+
+async def test_liveness_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a live local server is only probed again after the TTL or a connection error."""
+    probes: list[tuple[str, int]] = []
+
+    async def port_accepts(host: str, port: int) -> bool:
+        probes.append((host, port))
+        return True
+
+    monkeypatch.setattr(core, "_port_accepts", port_accepts)
+    monkeypatch.setattr(core, "_live_servers", {})
+    for _ in range(3):
+        assert await core.check_tika_server_async(server_host="localhost", port="9998") == "http://localhost:9998"
+    assert probes == [("localhost", 9998)]
+
+    core.forget_server_liveness("http://localhost:9998/tika")
+    await core.check_tika_server_async(server_host="localhost", port="9998")
+    assert len(probes) == 2
+
+    monkeypatch.setattr(core, "TIKA_LIVENESS_TTL", 0)
+    core.forget_server_liveness()
+    await core.check_tika_server_async(server_host="localhost", port="9998")
+    await core.check_tika_server_async(server_host="localhost", port="9998")
+    assert len(probes) == 4
+
+
+async def test_connection_error_forgets_liveness(
+    mock_tika: Callable[..., None], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a refused connection drops the cached liveness of that server."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        msg = "connection refused"
+        raise httpx.ConnectError(msg, request=request)
+
+    mock_tika(handler)
+    monkeypatch.setattr(core, "_live_servers", {("localhost", 9998): float("inf")})
+    with pytest.raises(core.TikaError):
+        await core.call_server("get", "http://localhost:9998", "/version", None, headers={})
+    assert not core._live_servers
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from tika import core
+
+
+@pytest.fixture
+def jar(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Fake JAR with a Maven style checksum file next to it."""
+    monkeypatch.setattr(core, "_jar_digests", {})
+    jar_path = tmp_path / "tika-server.jar"
+    jar_path.write_bytes(b"PK" * 100_000)
+    digest = hashlib.sha1(jar_path.read_bytes()).hexdigest()
+    (tmp_path / "tika-server.jar.sha1").write_text(f"{digest}  tika-server.jar\n")
+    return jar_path
+
+
+def test_signature_matches(jar: Path) -> None:
+    """Test that the checksum next to the JAR is used and a modified JAR is rejected."""
+    assert core.check_jar_signature(jar, jar, algo="sha1")
+    with open(jar, "ab") as f:
+        f.write(b"tampered")
+    assert not core.check_jar_signature(jar, jar, algo="sha1")
+
+
+def test_missing_checksum(jar: Path) -> None:
+    """Test that a JAR without a checksum file for the algorithm is refused."""
+    with pytest.raises(RuntimeError, match="tika-server.jar.sha256"):
+        core.check_jar_signature(jar, jar, algo="sha256")
+
+
+def test_digest_is_cached(jar: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the JAR is hashed once, even across processes, until it changes."""
+    hashed: list[str] = []
+    file_digest = hashlib.file_digest
+
+    def counting_file_digest(f: object, algo: str) -> object:
+        hashed.append(algo)
+        return file_digest(f, algo)  # type: ignore
+
+    monkeypatch.setattr(hashlib, "file_digest", counting_file_digest)
+    digest = core.jar_digest(jar, "sha1")
+    assert core.jar_digest(jar, "sha1") == digest
+    core._jar_digests.clear()  # a new process only has the cache file
+    assert core.jar_digest(jar, "sha1") == digest
+    assert hashed == ["sha1"]
+    assert jar.with_name("tika-server.jar.sigcache").exists()
+
+    stat = jar.stat()
+    os.utime(jar, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert core.jar_digest(jar, "sha1") == digest
+    assert hashed == ["sha1", "sha1"]
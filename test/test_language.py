@@ -1,8 +1,9 @@
 import tempfile
-from collections.abc import Generator
+from collections.abc import AsyncIterator, Callable, Generator
 from pathlib import Path
 from typing import Any, BinaryIO, cast
 
+import httpx
 import pytest
 
 import tika
@@ -86,3 +87,74 @@ async def test_detect_edge_cases(invalid_input: str) -> None:
     """Test language detection with edge cases."""
     result = await tika.language.from_buffer(invalid_input)
     assert isinstance(result, str | bytes)
+
+
+async def test_detect_sampled_from_stream(mock_tika: Callable[..., None]) -> None:
+    """Test that samples are spread over a bounded prefix of the text stream and voted on."""
+    seen: list[httpx.Request] = []
+    sent = 0
+
+    async def text() -> AsyncIterator[bytes]:
+        nonlocal sent
+        for word in ("Bonjour ", "le ", "monde ", "entier ") * 1000:
+            sent += 1
+            yield word.encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.url.path == "/tika":
+            return httpx.Response(200, content=text())
+        return httpx.Response(200, text="en" if request.content.startswith(b" monde") else "fr")
+
+    mock_tika(handler)
+    result = await tika.language.from_file(b"document", sample_chars=10, samples=3)
+    assert result == "fr"
+    assert [request.url.path for request in seen].count("/language/string") == 3
+    assert sorted(request.content for request in seen[1:]) == [b"Bonjour le", b"njour le m", b"onjour le "]
+    assert sent < 100
+
+
+async def test_detect_sampled_from_text(mock_tika: Callable[..., None]) -> None:
+    """Test that samples are spread over already extracted text without touching the file."""
+    seen: list[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.content)
+        return httpx.Response(200, text="de\n")
+
+    mock_tika(handler)
+    text = "a" * 10 + "b" * 10 + "c" * 10
+    assert await tika.language.from_file("missing.txt", sample_chars=10, samples=3, text=text) == "de"
+    assert sorted(seen) == [b"a" * 10, b"b" * 10, b"c" * 10]
+
+    seen.clear()
+    assert await tika.language.from_file("missing.txt", sample_chars=10, text="") == ""
+    assert await tika.language.from_file("missing.txt", sample_chars=10, samples=3, text=" \n\t " * 10) == ""
+    assert not seen
+
+
+async def test_detect_many_buffers(mock_tika: Callable[..., None]) -> None:
+    """Test that batched detection keeps input order and skips the server for prefiltered strings."""
+    seen: list[bytes] = []
+
+    async def strings() -> AsyncIterator[str]:
+        for text in ("Bonjour le monde", "Καλημέρα κόσμε", "Good morning"):
+            yield text
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.content)
+        return httpx.Response(200, text="fr" if request.content.startswith(b"Bonjour") else "en")
+
+    mock_tika(handler)
+    results = await tika.language.from_buffers(strings(), max_in_flight=2, prefilter=tika.language.script_language)
+    assert results == ["fr", "el", "en"]
+    assert sorted(seen) == [b"Bonjour le monde", b"Good morning"]
+
+
+def test_script_language() -> None:
+    """Test that only scripts written by a single language Tika detects are recognized."""
+    assert tika.language.script_language("Καλημέρα κόσμε") == "el"
+    assert tika.language.script_language("こんにちは世界") == "ja"
+    assert tika.language.script_language("你好世界") is None
+    assert tika.language.script_language("שלום עולם") is None  # Hebrew or Yiddish
+    assert tika.language.script_language("გამარჯობა") is None
@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+
+import httpx
+import orjson
+import pytest
+
+import tika
+from tika import TikaError
+from tika.parser import _JsonArrayDecoder
+
+# Constants
+TEST_FILES_DIR = Path(__file__).parent / "files"
+TEST_PDF_PATH = TEST_FILES_DIR / "rwservlet.pdf"
+SERVER_ENDPOINT = "http://tika.test:9998"
+RMETA_RECORDS = [
+    {"Content-Type": "application/zip", "X-TIKA:content": 'quoted "text" \\ and {braces} [1]'},
+    {"Content-Type": "text/plain", "X-TIKA:content": "naïve café", "X-TIKA:embedded_resource_path": "/a.txt"},
+    {"Content-Type": "text/plain", "X-TIKA:content": "", "X-TIKA:embedded_resource_path": "/b.txt", "n": [1, 2]},
+]
+
+MockTika = Callable[[Callable[[httpx.Request], httpx.Response]], None]
+
+
+def _chunked(payload: bytes, size: int) -> Callable[[httpx.Request], httpx.Response]:
+    """Handler that responds with the payload split into chunks of the given size."""
+
+    async def body() -> AsyncIterator[bytes]:
+        for start in range(0, len(payload), size):
+            yield payload[start : start + size]
+
+    return lambda _: httpx.Response(200, content=body())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_json_array_decoder(chunk_size: int) -> None:
+    """Test that array elements are decoded regardless of chunk boundaries."""
+    payload = orjson.dumps(RMETA_RECORDS)
+    decoder = _JsonArrayDecoder()
+    records = []
+    for start in range(0, len(payload), chunk_size):
+        records.extend(decoder.feed(payload[start : start + chunk_size]))
+    decoder.close()
+    assert records == RMETA_RECORDS
+
+
+@pytest.mark.parametrize("cut", [-10, -1, 0])
+def test_json_array_decoder_truncated(cut: int) -> None:
+    """Test that a response cut off mid-record, between records or before it started is reported."""
+    payload = orjson.dumps(RMETA_RECORDS)
+    decoder = _JsonArrayDecoder()
+    decoder.feed(payload[:cut])
+    with pytest.raises(TikaError, match="Truncated"):
+        decoder.close()
+
+
+async def test_stream_file_not_an_array(mock_tika: MockTika) -> None:
+    """Test that a JSON body other than an array is an error, not an empty document."""
+    mock_tika(_chunked(b' \n{"error": "parse failure"}', 3))
+    with pytest.raises(TikaError, match="Expected a JSON array"):
+        _ = [record async for record in tika.parser.stream_file(TEST_PDF_PATH, server_endpoint=SERVER_ENDPOINT)]
+
+
+async def test_stream_file_records(mock_tika: MockTika) -> None:
+    """Test streaming /rmeta records from a file."""
+    mock_tika(_chunked(orjson.dumps(RMETA_RECORDS), 5))
+    records = [record async for record in tika.parser.stream_file(TEST_PDF_PATH, server_endpoint=SERVER_ENDPOINT)]
+    assert records == RMETA_RECORDS
+
+
+async def test_stream_file_text(mock_tika: MockTika) -> None:
+    """Test streaming text without splitting multi-byte characters."""
+    text = "naïve café 😎" * 10
+    mock_tika(_chunked(text.encode("utf-8"), 3))
+    chunks = [
+        chunk async for chunk in tika.parser.stream_file(TEST_PDF_PATH, server_endpoint=SERVER_ENDPOINT, service="text")
+    ]
+    assert "".join(chunks) == text  # type: ignore
+
+
+async def test_stream_buffer_error(mock_tika: MockTika) -> None:
+    """Test that an error status is raised before any record is yielded."""
+    mock_tika(lambda _: httpx.Response(422, content=b"Unprocessable"))
+    with pytest.raises(TikaError, match="422"):
+        async for _ in tika.parser.stream_buffer("Good evening, Dave", server_endpoint=SERVER_ENDPOINT):
+            pass
+
+
+async def test_analyze_single_upload(mock_tika: MockTika) -> None:
+    """Test that type and language come from the /rmeta metadata when Tika reports both."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        records = [{"Content-Type": "application/pdf; version=1.4", "language": "en", "X-TIKA:content": "Hello"}]
+        return httpx.Response(200, content=orjson.dumps(records))
+
+    mock_tika(handler)
+    result = await tika.parser.analyze(TEST_PDF_PATH, server_endpoint=SERVER_ENDPOINT)
+    assert (result["content_type"], result["language"], result["content"]) == ("application/pdf", "en", "Hello")
+    assert [request.url.path for request in seen] == ["/rmeta/text"]
+
+
+async def test_analyze_language_fallback(mock_tika: MockTika) -> None:
+    """Test that only a text sample is sent for language detection and the type is guessed."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.url.path == "/language/string":
+            return httpx.Response(200, content=b"fr\n")
+        return httpx.Response(200, content=orjson.dumps([{"X-TIKA:content": "Bonjour tout le monde"}]))
+
+    mock_tika(handler)
+    result = await tika.parser.analyze(TEST_PDF_PATH, server_endpoint=SERVER_ENDPOINT, language_sample=7)
+    assert (result["content_type"], result["language"]) == ("application/pdf", "fr")
+    assert [request.url.path for request in seen] == ["/rmeta/text", "/language/string"]
+    assert seen[1].content == b"Bonjour"
+
+
+@pytest.mark.parametrize(
+    ("merge", "expected"),
+    [
+        ("merge", {"Content-Type": ["application/zip", "text/plain", "text/plain"], "n": [1, 2]}),
+        ("first-wins", {"Content-Type": "application/zip", "n": [1, 2]}),
+        ("container-only", {"Content-Type": "application/zip"}),
+        ("list-all", {"Content-Type": ["application/zip", "text/plain", "text/plain"], "n": [1, 2]}),
+    ],
+)
+def test_parse_merge_strategies(merge: tika.parser.MergeStrategy, expected: dict[str, object]) -> None:
+    """Test that each merge strategy combines /rmeta metadata as documented."""
+    parsed = tika.parser._parse((200, orjson.dumps(RMETA_RECORDS)), merge=merge)
+    metadata = parsed["metadata"] or {}
+    metadata = {key: value for key, value in metadata.items() if key != "X-TIKA:embedded_resource_path"}
+    assert metadata == expected
+    assert parsed["content"] == 'quoted "text" \\ and {braces} [1]naïve café'
+
+
+async def test_parse_unknown_merge(mock_tika: MockTika) -> None:
+    """Test that an unknown merge strategy is rejected before any request, for every service."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, content=b"{}")
+
+    mock_tika(handler)
+    for service in ("all", "meta", "text"):
+        with pytest.raises(ValueError, match="merge must be one of"):
+            await tika.parser.from_file(
+                TEST_PDF_PATH,
+                service=service,
+                merge="per-embedded",  # type: ignore
+                server_endpoint=SERVER_ENDPOINT,
+            )
+    with pytest.raises(ValueError, match="merge must be one of"):
+        await tika.parser.from_buffer(b"zip", merge="bogus", server_endpoint=SERVER_ENDPOINT)  # type: ignore
+    assert not seen
+
+
+async def test_stream_documents(mock_tika: MockTika) -> None:
+    """Test that each /rmeta record becomes a separate document with its own path and content."""
+    mock_tika(_chunked(orjson.dumps(RMETA_RECORDS), 7))
+    documents = [document async for document in tika.parser.stream_documents(b"zip", server_endpoint=SERVER_ENDPOINT)]
+    assert [(document["path"], document["content"]) for document in documents] == [
+        ("/", 'quoted "text" \\ and {braces} [1]'),
+        ("/a.txt", "naïve café"),
+        ("/b.txt", ""),
+    ]
+    assert documents[2]["metadata"] == {"Content-Type": "text/plain", "n": [1, 2]}
+
+
+def test_compact_response() -> None:
+    """Test that compact results read like the response they were built from and share key tables."""
+    first, second = (tika.parser._parse((200, orjson.dumps(RMETA_RECORDS))) for _ in range(2))
+    compact, other = tika.CompactResponse(first), tika.CompactResponse(second)
+    assert compact["content"] == compact.content == first["content"]
+    assert compact.metadata is not None
+    assert other.metadata is not None
+    assert compact.metadata["Content-Type"] == ("application/zip", "text/plain", "text/plain")
+    assert compact.metadata._layout is other.metadata._layout
+    assert compact.to_dict() == first
+    assert dict(compact)["status"] == 200
+    assert not hasattr(compact, "__dict__")
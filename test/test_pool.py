@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+from collections import Counter
+from collections.abc import AsyncIterator, Callable
+from io import BytesIO
+
+import httpx
+import pytest
+
+from tika import TikaPool, core, detector, language, parser
+
+MockTika = Callable[[Callable[[httpx.Request], object]], None]
+ENDPOINTS = ["http://tika-1.test:9998", "http://tika-2.test:9998", "http://tika-3.test:9998"]
+
+
+async def _put(pool: TikaPool, data: object = b"Good evening, Dave") -> tuple[int, object]:
+    return await core.call_server(
+        verb="put",
+        server_endpoint=pool,
+        service="/tika",
+        data=data,  # type: ignore
+        headers={"Accept": "text/plain"},
+        raw_response=True,
+    )
+
+
+async def test_least_outstanding_spreads_load(mock_tika: MockTika) -> None:
+    """Test that concurrent requests are spread over the endpoints with the fewest in flight."""
+    hosts: Counter[str] = Counter()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        hosts[request.url.host] += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, content=b"ok")
+
+    mock_tika(handler)
+    pool = TikaPool(ENDPOINTS)
+    await asyncio.gather(*(_put(pool) for _ in range(9)))
+    assert hosts == {"tika-1.test": 3, "tika-2.test": 3, "tika-3.test": 3}
+    assert all(member.outstanding == 0 for member in pool.members)
+
+
+async def test_weighted_round_robin(mock_tika: MockTika) -> None:
+    """Test that round-robin follows the endpoint weights."""
+    hosts: list[str] = []
+    mock_tika(lambda request: hosts.append(request.url.host) or httpx.Response(200))  # type: ignore
+    pool = TikaPool({ENDPOINTS[0]: 2, ENDPOINTS[1]: 1}, strategy="round_robin")
+    for _ in range(6):
+        await _put(pool)
+    assert hosts == ["tika-1.test", "tika-2.test", "tika-1.test"] * 2
+
+
+async def test_failover_and_ejection(mock_tika: MockTika) -> None:
+    """Test that unreachable endpoints are failed over, ejected, and that the body is resent in full."""
+    hosts: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hosts.append(request.url.host)  # type: ignore
+        if request.url.host == "tika-1.test":
+            msg = "connection refused"
+            raise httpx.ConnectError(msg, request=request)
+        return httpx.Response(200, content=request.read())
+
+    mock_tika(handler)
+    pool = TikaPool(ENDPOINTS[:2], strategy="round_robin", max_failures=2)
+    stream = BytesIO(b"Good evening, Dave")
+    assert await _put(pool, stream) == (200, b"Good evening, Dave")
+    assert stream.closed
+    while hosts.count("tika-1.test") < 2:
+        assert await _put(pool) == (200, b"Good evening, Dave")
+    assert pool.endpoints == [ENDPOINTS[1]]
+    hosts.clear()
+    for _ in range(4):
+        await _put(pool)
+    assert hosts == ["tika-2.test"] * 4
+
+
+async def test_unreplayable_body_is_not_retried(mock_tika: MockTika) -> None:
+    """Test that bodies which cannot be replayed surface the connection error."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        msg = "connection refused"
+        raise httpx.ConnectError(msg, request=request)
+
+    async def chunks() -> AsyncIterator[bytes]:
+        yield b"Good evening, Dave"
+
+    mock_tika(handler)
+    with pytest.raises(core.TikaError, match="connection refused"):
+        await _put(TikaPool(ENDPOINTS), chunks())
+
+
+async def test_pool_is_drop_in_endpoint(mock_tika: MockTika) -> None:
+    """Test that a pool can be passed as server_endpoint to the public modules."""
+    hosts: set[str] = set()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hosts.add(request.url.host)  # type: ignore
+        if request.url.path == "/rmeta/text":
+            return httpx.Response(200, json=[{"X-TIKA:content": "Good evening, Dave"}])
+        return httpx.Response(200, text="en")
+
+    mock_tika(handler)
+    pool = TikaPool(ENDPOINTS)
+    parsed = await parser.from_buffer("Good evening, Dave", server_endpoint=pool)
+    assert parsed["content"] == "Good evening, Dave"
+    assert await detector.from_buffer("Good evening, Dave", server_endpoint=pool) == "en"
+    assert await language.from_buffer("Good evening, Dave", server_endpoint=pool) == "en"
+    assert hosts == {"tika-1.test", "tika-2.test", "tika-3.test"}
+
+
+def test_pool_validation() -> None:
+    """Test that empty pools and invalid weights are rejected."""
+    with pytest.raises(core.TikaError):
+        TikaPool([])
+    with pytest.raises(core.TikaError):
+        TikaPool({ENDPOINTS[0]: 0})
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import io
+import tarfile
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO
+
+import httpx
+import pytest
+
+import tika
+from tika import TikaError
+
+SERVER_ENDPOINT = "http://tika.test:9998"
+
+MockTika = Callable[[Callable[[httpx.Request], httpx.Response]], None]
+
+
+def _tar(members: dict[str, bytes]) -> bytes:
+    """Build an uncompressed TAR archive like the one /unpack/all returns."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar_file:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar_file.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+ARCHIVE = _tar(
+    {
+        "image.png": b"\x89PNG" + bytes(100_000),
+        "__METADATA__": b'"Content-Type","message/rfc822"\n"dc:creator","HAL","Dave"\n',
+        "__TEXT__": "naïve café".encode(),
+    }
+)
+
+
+def _chunked(payload: bytes, size: int) -> Callable[[httpx.Request], httpx.Response]:
+    async def body() -> AsyncIterator[bytes]:
+        for start in range(0, len(payload), size):
+            yield payload[start : start + size]
+
+    return lambda _: httpx.Response(200, content=body())
+
+
+async def test_stream_unpack(mock_tika: MockTika) -> None:
+    """Test that metadata, text and attachments are yielded from a chunked TAR stream."""
+    mock_tika(_chunked(ARCHIVE, 1000))
+    entries = dict([entry async for entry in tika.unpack.stream_buffer(b"mail", server_endpoint=SERVER_ENDPOINT)])
+    assert entries["__METADATA__"] == {"Content-Type": "message/rfc822", "dc:creator": ["HAL", "Dave"]}
+    assert entries["__TEXT__"] == "naïve café"
+    assert entries["image.png"] == b"\x89PNG" + bytes(100_000)
+
+
+async def test_stream_unpack_more_streams_than_workers() -> None:
+    """Test that concurrent streams do not exhaust the default executor and hang."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for start in range(0, len(ARCHIVE), 1000):
+            yield ARCHIVE[start : start + 1000]
+
+    async def unpack() -> dict[str, object]:
+        return dict([entry async for entry in tika.unpack._iter_tar(chunks(), None)])
+
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        loop.set_default_executor(executor)
+        results = await asyncio.wait_for(asyncio.gather(*(unpack() for _ in range(6))), timeout=10)
+        assert await asyncio.wait_for(asyncio.to_thread(len, ARCHIVE), timeout=1) == len(ARCHIVE)
+    assert all(result["__TEXT__"] == "naïve café" for result in results)
+
+
+async def test_stream_unpack_sinks(mock_tika: MockTika, tmp_path: Path) -> None:
+    """Test that attachments go to a directory or callback instead of being yielded."""
+    mock_tika(_chunked(ARCHIVE, 4096))
+    entries = dict([entry async for entry in tika.unpack.stream_buffer(b"mail", sink=tmp_path)])
+    assert entries["image.png"] == tmp_path / "image.png"
+    assert (tmp_path / "image.png").stat().st_size == 100_004
+
+    sizes: dict[str, int] = {}
+
+    def count(name: str, file_obj: BinaryIO) -> None:
+        sizes[name] = len(file_obj.read())
+
+    entries = dict([entry async for entry in tika.unpack.stream_buffer(b"mail", sink=count)])
+    assert entries["image.png"] is None
+    assert sizes == {"image.png": 100_004}
+
+
+async def test_stream_unpack_stops_early(mock_tika: MockTika) -> None:
+    """Test that leaving the loop early stops reading the response."""
+    mock_tika(_chunked(ARCHIVE, 512))
+    async for name, _ in tika.unpack.stream_buffer(b"mail"):
+        assert name == "image.png"
+        break
+
+
+async def test_stream_unpack_errors(mock_tika: MockTika, tmp_path: Path) -> None:
+    """Test that server errors, truncated archives and escaping names are reported."""
+    mock_tika(lambda _: httpx.Response(422, content=b"Unprocessable"))
+    with pytest.raises(TikaError, match="422"):
+        _ = [entry async for entry in tika.unpack.stream_buffer(b"mail")]
+
+    mock_tika(_chunked(ARCHIVE[:5000], 1000))
+    with pytest.raises(TikaError):
+        _ = [entry async for entry in tika.unpack.stream_buffer(b"mail")]
+
+    mock_tika(_chunked(_tar({"../evil": b"x"}), 1000))
+    with pytest.raises(TikaError, match="escapes"):
+        _ = [entry async for entry in tika.unpack.stream_buffer(b"mail", sink=tmp_path / "out")]
+
+
+async def test_unpack_lazy_attachments(mock_tika: MockTika) -> None:
+    """Test that unpack results index attachments and read them only on access."""
+    mock_tika(_chunked(ARCHIVE, 4096))
+    parsed = await tika.unpack.from_buffer(b"mail", server_endpoint=SERVER_ENDPOINT)
+    assert parsed["content"] == "naïve café"
+    assert parsed["metadata"] == {"Content-Type": "message/rfc822", "dc:creator": ["HAL", "Dave"]}
+    attachments = parsed["attachments"]
+    assert isinstance(attachments, tika.unpack.LazyAttachments)
+    assert attachments.sizes == {"image.png": 100_004}
+    assert attachments == {"image.png": b"\x89PNG" + bytes(100_000)}
+    attachments.close()
+
+
+async def test_unpack_spills_to_disk() -> None:
+    """Test that responses over the threshold are spooled to a memory-mapped temporary file."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for start in range(0, len(ARCHIVE), 1000):
+            yield ARCHIVE[start : start + 1000]
+
+    archive = await tika.unpack._spool(chunks(), spill_bytes=10_000)
+    assert not isinstance(archive, io.BytesIO)
+    with tika.unpack._parse((200, archive))["attachments"] as attachments:  # type: ignore
+        assert bytes(attachments.view("image.png")[:4]) == b"\x89PNG"
+        assert len(attachments["image.png"]) == 100_004
+    assert archive.closed
+
+
+async def test_unpack_close_with_live_view() -> None:
+    """Test that closing attachments tolerates views that are still referenced."""
+    with tika.unpack._parse((200, ARCHIVE))["attachments"] as attachments:  # type: ignore
+        view = attachments.view("image.png")
+    assert bytes(view[:4]) == b"\x89PNG"
+
+    empty = io.BytesIO()
+    assert tika.unpack._parse((200, empty))["attachments"] is None  # type: ignore
+    assert empty.closed
+
+
+def test_read_metadata() -> None:
+    """Test that metadata CSV drops NULs and translates newlines inside quoted values."""
+    data = '"title","two\r\nlines\0"\r\n"sep","a b"\r\n'.encode()
+    assert tika.unpack._read_metadata(data, "utf-8") == {"title": "two\nlines", "sep": "a b"}
+    with pytest.raises(TikaError):
+        tika.unpack._read_metadata(b'"lonely"\n', "utf-8")